@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Authors: Sampreet Kalita
+# Created: 2026-10-19
+# Updated: 2026-10-19
+
+"""Module to generate parameterized problems of growing size for the benchmarks."""
+
+# dependencies
+import math
+import numpy as np
+
+def get_matrix_dense(n, rng):
+    """
+    Obtain a random dense matrix with a constant vector.
+
+    Parameters
+    ----------
+    n : int
+        Number of variables.
+    rng : numpy.random.Generator
+        Random number generator.
+
+    Returns
+    -------
+    A, b : numpy.ndarray, numpy.ndarray
+        The coefficient matrix and the constant vector.
+    """
+
+    return rng.uniform(-1, 1, (n, n)), rng.uniform(-1, 1, n)
+
+def get_matrix_SPD(n, rng):
+    """
+    Obtain a random symmetric positive definite matrix with a constant vector.
+
+    Parameters
+    ----------
+    n : int
+        Number of variables.
+    rng : numpy.random.Generator
+        Random number generator.
+
+    Returns
+    -------
+    A, b : numpy.ndarray, numpy.ndarray
+        The coefficient matrix and the constant vector.
+    """
+
+    G = rng.uniform(-1, 1, (n, n))
+
+    return G @ G.T/n + np.eye(n), rng.uniform(-1, 1, n)
+
+def get_matrix_dominant(n, rng):
+    """
+    Obtain a random strictly diagonally dominant matrix with a constant vector.
+
+    Parameters
+    ----------
+    n : int
+        Number of variables.
+    rng : numpy.random.Generator
+        Random number generator.
+
+    Returns
+    -------
+    A, b : numpy.ndarray, numpy.ndarray
+        The coefficient matrix and the constant vector.
+    """
+
+    A = rng.uniform(-1, 1, (n, n))
+    A[np.diag_indices(n)] = np.sum(np.abs(A), axis=1) + 1
+
+    return A, rng.uniform(-1, 1, n)
+
+def get_matrix_banded(n, rng, width=2):
+    """
+    Obtain a random symmetric diagonally dominant banded matrix with a constant vector.
+
+    Parameters
+    ----------
+    n : int
+        Number of variables.
+    rng : numpy.random.Generator
+        Random number generator.
+    width : int (optional)
+        Number of non-zero sub-diagonals.
+
+    Returns
+    -------
+    A, b : numpy.ndarray, numpy.ndarray
+        The coefficient matrix and the constant vector.
+    """
+
+    A = np.zeros((n, n))
+    for k in range(1, width + 1):
+        band = rng.uniform(-1, 1, n - k)
+        A[np.arange(n - k), np.arange(k, n)] = band
+        A[np.arange(k, n), np.arange(n - k)] = band
+    A[np.diag_indices(n)] = np.sum(np.abs(A), axis=1) + 1
+
+    return A, rng.uniform(-1, 1, n)
+
+def get_matrix_sparse(n, rng, density=0.05):
+    """
+    Obtain a random symmetric diagonally dominant sparse matrix stored densely with a constant vector.
+
+    Parameters
+    ----------
+    n : int
+        Number of variables.
+    rng : numpy.random.Generator
+        Random number generator.
+    density : float (optional)
+        Fraction of non-zero off-diagonal elements.
+
+    Returns
+    -------
+    A, b : numpy.ndarray, numpy.ndarray
+        The coefficient matrix and the constant vector.
+    """
+
+    A = np.triu(rng.uniform(-1, 1, (n, n))*(rng.random((n, n)) < density), 1)
+    A = A + A.T
+    A[np.diag_indices(n)] = np.sum(np.abs(A), axis=1) + 1
+
+    return A, rng.uniform(-1, 1, n)
+
+def get_Poisson(n):
+    """
+    Obtain the source of the two-dimensional Poisson problem on the unit square with the grid spacing.
+
+    Parameters
+    ----------
+    n : int
+        Number of interior points along each axis, rounded down to the nearest 2^k - 1.
+
+    Returns
+    -------
+    F, h : numpy.ndarray, float
+        The values of the source at the interior points and the grid spacing.
+    """
+
+    n = 2**int(math.log2(n + 1)) - 1
+    h = 1/(n + 1)
+    X, Y = np.meshgrid(np.arange(1, n + 1)*h, np.arange(1, n + 1)*h, indexing='ij')
+
+    return 2*math.pi**2*np.sin(math.pi*X)*np.sin(math.pi*Y), h
+
+def get_root_polynomial(n):
+    """
+    Obtain the polynomial root problem T_n(x) = 0 for the Chebyshev polynomial of degree n with its derivative and a bracket.
+
+    The polynomial and its derivative n*U_(n - 1)(x) are evaluated by the three-term recurrence, hence each evaluation costs O(n) operations.
+
+    Parameters
+    ----------
+    n : int
+        Degree of the polynomial.
+
+    Returns
+    -------
+    fn, df, xi, xf : function, function, float, float
+        The function, its derivative and the initial and final values of a bracket containing the largest root cos(pi/(2*n)).
+    """
+
+    def fn(x):
+        t_prev, t = 1.0, x
+        for k in range(1, n):
+            t_prev, t = t, 2*x*t - t_prev
+        return t
+
+    def df(x):
+        u_prev, u = 1.0, 2*x
+        for k in range(1, n - 1):
+            u_prev, u = u, 2*x*u - u_prev
+        return n*(u if n > 1 else 1.0)
+
+    return fn, df, math.cos(math.pi/n), 1.0
+
+def get_root_transcendental(n):
+    """
+    Obtain the transcendental root problem x*exp(x) - n = 0 with its derivative, a fixed point function and a bracket.
+
+    Parameters
+    ----------
+    n : int
+        Constant of the problem.
+
+    Returns
+    -------
+    fn, df, g, xi, xf : function, function, function, float, float
+        The function, its derivative, the function g(x) = log(n/x) with the root as its fixed point and the initial and final values of a bracket containing the root.
+    """
+
+    return lambda x: x*math.exp(x) - n, lambda x: (1 + x)*math.exp(x), lambda x: math.log(n/x), 0.5, math.log(n) + 1
+
+def get_data_regression(N, rng):
+    """
+    Obtain a noisy straight line dataset.
+
+    Parameters
+    ----------
+    N : int
+        Number of observations.
+    rng : numpy.random.Generator
+        Random number generator.
+
+    Returns
+    -------
+    X, Y : list (float), list (float)
+        The data points and the observations.
+    """
+
+    X = np.sort(rng.uniform(-1, 1, N))
+
+    return X.tolist(), (2*X + 1 + 0.1*rng.standard_normal(N)).tolist()
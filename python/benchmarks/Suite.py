@@ -0,0 +1,422 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Authors: Sampreet Kalita
+# Created: 2026-10-19
+# Updated: 2026-10-19
+
+"""Module to benchmark the scaling of the solvers and to compare the results of two runs."""
+
+# dependencies
+import argparse
+import datetime
+import json
+import platform
+import sys
+import time
+import tracemalloc
+import numpy as np
+
+from benchmarks import Problems
+from modules.diagnostics.Instrument import Instrument
+from modules.eigen import Jacobi, Lanczos, Power
+from modules.interpolation import Newton
+from modules.regression import Linear
+from modules.root_finding import Bisection, ConjugateGradient, FalsePosition, FixedPoint, GaussianElimination, GaussJordanElimination, GaussSeidelIteration, JacobiIteration, Krylov, LUDecomposition, Multigrid, NewtonRaphson, Secant
+
+def get_case(name, family, make, ops=1, inst=True, nmax=None):
+    """
+    Obtain a benchmark case.
+
+    Parameters
+    ----------
+    name : String
+        Name of the solver as group.Module.function.
+    family : String
+        Family of the generated problems.
+    make : function
+        Function of the size and the random number generator returning the function preparing fresh arguments and the solver.
+    ops : int (optional)
+        Index of the operation count in the returned values of the solver, None if not returned.
+    inst : boolean (optional)
+        Option to pass an instrument to the solver as the keyword argument `inst`.
+    nmax : int (optional)
+        Maximum size of the problems.
+
+    Returns
+    -------
+    case : dict
+        The benchmark case.
+    """
+
+    return {'name': name, 'family': family, 'make': make, 'ops': ops, 'inst': inst, 'nmax': nmax}
+
+def get_lists(gen, vector=True):
+    """
+    Obtain the function preparing fresh list copies of a generated matrix and constant vector.
+
+    Parameters
+    ----------
+    gen : function
+        Generator of the matrix and the constant vector.
+    vector : boolean (optional)
+        Option to include the constant vector.
+
+    Returns
+    -------
+    make : function
+        The function of the size and the random number generator returning the function preparing the arguments.
+    """
+
+    def make(n, rng):
+        A, b = gen(n, rng)
+        return lambda: (A.tolist(), b.tolist()) if vector else (A.tolist(), )
+
+    return make
+
+def get_appended(make, extra):
+    """
+    Obtain the function preparing the arguments of a given function followed by extra arguments.
+
+    Parameters
+    ----------
+    make : function
+        The function of the size and the random number generator returning the function preparing the arguments.
+    extra : function
+        The function of the size returning the extra arguments.
+
+    Returns
+    -------
+    make : function
+        The function preparing all arguments.
+    """
+
+    def make_appended(n, rng):
+        prepare = make(n, rng)
+        return lambda: prepare() + extra(n)
+
+    return make_appended
+
+def get_cases():
+    """
+    Obtain the benchmark cases covering the solvers of all modules.
+
+    Returns
+    -------
+    cases : list (dict)
+        The benchmark cases.
+    """
+
+    # generators of dense, symmetric positive definite, diagonally dominant and banded matrices
+    dense = get_lists(Problems.get_matrix_dense)
+    spd = get_lists(Problems.get_matrix_SPD)
+    dominant = get_lists(Problems.get_matrix_dominant)
+    banded = get_lists(Problems.get_matrix_banded)
+
+    # extra arguments of the direct and iterative solvers, the latter starting from zero
+    direct = lambda n: (False, )
+    stationary = lambda n: ([0.0]*n, 1, 10*n, 1e-8, False)
+    krylov = lambda n: ([0.0]*n, 10*n, 1e-8, False)
+
+    def batched(n, rng):
+        A = np.array([Problems.get_matrix_dense(8, rng)[0] for i in range(n)])
+        B = rng.uniform(-1, 1, (n, 8))
+        return lambda: (A.copy(), B.copy())
+
+    def preconditioned(gen, get_preconditioner, extra):
+        def make(n, rng):
+            A, b = gen(n, rng)
+            M = get_preconditioner(A)
+            return lambda: (A, b, [0.0]*n) + extra(n) + (M, )
+        return make
+
+    def Poisson(n, rng):
+        F, h = Problems.get_Poisson(n)
+        return lambda: (F, h, np.zeros(F.shape), "V", "GaussSeidel", 2, 50, 1e-8, False)
+
+    def root(get_problem, args):
+        def make(n, rng):
+            problem = get_problem(n)
+            return lambda: args(*problem)
+        return make
+
+    def regression(n, rng):
+        X, Y = Problems.get_data_regression(100*n, rng)
+        return lambda: (X, Y)
+
+    def interpolation(n, rng):
+        X, Y = Problems.get_data_regression(n, rng)
+        return lambda: (X, Y, 0.0)
+
+    # root problems with the arguments of bracketing and open methods
+    poly = lambda n: (lambda fn, df, xi, xf: (fn, df, None, xi, xf))(*Problems.get_root_polynomial(n))
+    trans = Problems.get_root_transcendental
+    bracket = lambda fn, df, g, xi, xf: (fn, xi, xf, 1e-12)
+    secant = lambda fn, df, g, xi, xf: (fn, xi, xf, 1e-12, 1000)
+    newton = lambda fn, df, g, xi, xf: (fn, df, xf, 1e-12, 1000)
+    fixed = lambda fn, df, g, xi, xf: (g, xf, 1e-12, 1000)
+
+    return [
+        # direct solvers
+        get_case('root_finding.GaussianElimination.get_solution_basic', 'dense', get_appended(dense, direct)),
+        get_case('root_finding.GaussianElimination.get_solution_pivot', 'dense', get_appended(dense, direct)),
+        get_case('root_finding.GaussianElimination.get_solution_batched', 'dense-batch', get_appended(batched, direct), ops=2),
+        get_case('root_finding.GaussJordanElimination.get_solution_basic', 'dense', get_appended(dense, direct)),
+        get_case('root_finding.GaussJordanElimination.get_inverse', 'dense', get_appended(get_lists(Problems.get_matrix_dense, False), direct)),
+        get_case('root_finding.LUDecomposition.get_solution_basic', 'dense', get_appended(dense, direct)),
+        get_case('root_finding.LUDecomposition.get_solution_refined', 'dense', get_appended(dense, lambda n: (10, 1e-14, False)), ops=3),
+        get_case('root_finding.LUDecomposition.get_solution_Cholesky', 'spd', get_appended(spd, direct)),
+        get_case('eigen.Jacobi.get_eigens', 'spd', get_appended(get_lists(Problems.get_matrix_SPD, False), lambda n: (1e-8, 1e6, False)), ops=None, nmax=128),
+        get_case('eigen.Jacobi.get_eigens_cyclic', 'spd', get_appended(get_lists(Problems.get_matrix_SPD, False), lambda n: (1e-8, 50, False)), ops=None, nmax=128),
+        get_case('eigen.Jacobi.get_eigens_parallel', 'spd', get_appended(get_lists(Problems.get_matrix_SPD, False), lambda n: (1e-8, 50, False)), ops=None, nmax=128),
+        get_case('eigen.Power.get_eigens_deflated', 'spd', get_appended(get_lists(Problems.get_matrix_SPD, False), lambda n: (3, "power", 0, 1e-8, 1000, False)), ops=None, nmax=128),
+        get_case('eigen.Power.get_eigen_inverse', 'spd', get_appended(get_lists(Problems.get_matrix_SPD, False), lambda n: (0, None, 1e-8, 1000, False)), ops=None),
+        get_case('eigen.Lanczos.get_eigens_Lanczos', 'spd', get_appended(get_lists(Problems.get_matrix_SPD, False), lambda n: (4, "lowest", None, None, 1e-8, 100, False)), ops=None),
+        # stationary iterative solvers
+        get_case('root_finding.JacobiIteration.get_solution_basic', 'dominant', get_appended(dominant, stationary)),
+        get_case('root_finding.GaussSeidelIteration.get_solution_basic', 'dominant', get_appended(dominant, stationary)),
+        get_case('root_finding.GaussSeidelIteration.get_solution_multicolor', 'banded', get_appended(banded, stationary)),
+        get_case('root_finding.Multigrid.get_solution_Poisson', 'poisson', Poisson, ops=2),
+        # Krylov subspace solvers
+        get_case('root_finding.ConjugateGradient.get_solution_basic', 'spd', get_appended(spd, krylov), ops=2),
+        get_case('root_finding.Krylov.get_solution_PCG', 'sparse', preconditioned(Problems.get_matrix_sparse, lambda A: GaussSeidelIteration.get_preconditioner_SSOR(A, 1.0, False)[0], lambda n: (10*n, 1e-8, False)), ops=2),
+        get_case('root_finding.Krylov.get_solution_GMRES', 'banded', preconditioned(Problems.get_matrix_banded, lambda A: LUDecomposition.get_preconditioner_ILU(A, False)[0], lambda n: (20, 10*n, 1e-8, False)), ops=2),
+        get_case('root_finding.Krylov.get_solution_BiCGSTAB', 'dominant', get_appended(dominant, krylov), ops=2),
+        # scalar root finders
+        get_case('root_finding.Bisection.find_root_in_interval', 'polynomial', root(poly, bracket), ops=None),
+        get_case('root_finding.FalsePosition.find_root_in_interval', 'polynomial', root(poly, bracket), ops=None),
+        get_case('root_finding.Secant.find_root_uni', 'polynomial', root(poly, secant), ops=None),
+        get_case('root_finding.NewtonRaphson.find_root_uni', 'polynomial', root(poly, newton), ops=None),
+        get_case('root_finding.Bisection.find_root_in_interval', 'transcendental', root(trans, bracket), ops=None),
+        get_case('root_finding.FalsePosition.find_root_in_interval', 'transcendental', root(trans, bracket), ops=None),
+        get_case('root_finding.FixedPoint.find_root_uni', 'transcendental', root(trans, fixed), ops=None),
+        get_case('root_finding.Secant.find_root_uni', 'transcendental', root(trans, secant), ops=None),
+        get_case('root_finding.NewtonRaphson.find_root_uni', 'transcendental', root(trans, newton), ops=None),
+        # regression and interpolation
+        get_case('regression.Linear.get_straight_line_for_data', 'regression', regression, ops=None),
+        get_case('interpolation.Newton.find_value_with_degree_3', 'regression', interpolation, ops=None, nmax=16),
+    ]
+
+def get_solver(name):
+    """
+    Obtain the solver function from its name.
+
+    Parameters
+    ----------
+    name : String
+        Name of the solver as group.Module.function.
+
+    Returns
+    -------
+    fn : function
+        The solver function.
+    """
+
+    group, module, function = name.split('.')
+
+    return getattr(sys.modules['modules.{group}.{module}'.format(group=group, module=module)], function)
+
+def get_result(case, n, repeat, seed):
+    """
+    Benchmark a case for a given size.
+
+    The solver is timed as the best of the repeated runs on fresh arguments, then run once with an instrument to count the operations and once with `tracemalloc` to obtain the peak memory, so that neither affects the timing.
+
+    Parameters
+    ----------
+    case : dict
+        The benchmark case.
+    n : int
+        Size of the problem.
+    repeat : int
+        Number of timed runs.
+    seed : int
+        Seed of the random number generator.
+
+    Returns
+    -------
+    result : dict
+        The name, family, size, best time in seconds, operation count, instrumented counts, peak memory in bytes and status string.
+    """
+
+    # initialize values
+    result = {'name': case['name'], 'family': case['family'], 'n': n}
+
+    try:
+        fn = get_solver(case['name'])
+        prepare = case['make'](n, np.random.default_rng(seed))
+
+        # best time of the repeated runs
+        best = np.inf
+        for i in range(repeat):
+            args = prepare()
+            time_start = time.perf_counter()
+            ret = fn(*args)
+            best = min(best, time.perf_counter() - time_start)
+        result['time'] = best
+        result['ops'] = int(ret[case['ops']]) if case['ops'] is not None else None
+        result['msg'] = ret[-1] if isinstance(ret[-1], str) else None
+
+        # instrumented counts
+        result['counts'] = None
+        if case['inst']:
+            inst = Instrument()
+            fn(*prepare(), inst=inst)
+            result['counts'] = inst.get_summary()['counts']
+
+        # peak memory
+        args = prepare()
+        tracemalloc.start()
+        fn(*args)
+        result['peak_bytes'] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    except Exception as error:
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+        result['error'] = '{name}: {error}'.format(name=type(error).__name__, error=str(error).splitlines()[0])
+
+    return result
+
+def run(sizes, repeat=3, seed=0, pattern=None, debug=True):
+    """
+    Benchmark all cases for growing sizes.
+
+    Parameters
+    ----------
+    sizes : list (int)
+        Sizes of the problems.
+    repeat : int (optional)
+        Number of timed runs.
+    seed : int (optional)
+        Seed of the random number generator.
+    pattern : String (optional)
+        Substring of the names or families of the cases to run.
+    debug : boolean (optional)
+        Option to display steps.
+
+    Returns
+    -------
+    results : dict
+        The metadata of the run and the list of results.
+    """
+
+    # metadata of the run
+    meta = {
+        'date': datetime.datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'sizes': list(sizes),
+        'repeat': repeat,
+        'seed': seed
+    }
+
+    results = []
+    for case in get_cases():
+        if pattern is not None and pattern not in case['name'] and pattern != case['family']:
+            continue
+
+        for n in sizes:
+            if case['nmax'] is not None and n > case['nmax']:
+                continue
+
+            result = get_result(case, n, repeat, seed)
+            results.append(result)
+
+            # display
+            if debug:
+                counts = result.get('counts') or {}
+                status = result.get('error', '{time:.3e} s\t{ops} ops\t{fev} fev\t{peak} B'.format(time=result.get('time', np.nan), ops=result.get('ops'), fev=counts.get('fev'), peak=result.get('peak_bytes')))
+                print("{name} [{family}, n={n}]\t{status}".format(name=case['name'], family=case['family'], n=n, status=status))
+
+    return {'meta': meta, 'results': results}
+
+def compare(base, new, tolerance=0.25, min_time=1e-4, debug=True):
+    """
+    Compare the results of two runs and flag the regressions.
+
+    A case of the new run is flagged if its time exceeds that of the base run by more than the tolerance (for base times above `min_time` to ignore timer noise), if its operation count, function evaluation count or peak memory increases by more than the tolerance, or if it fails where the base run succeeded.
+
+    Parameters
+    ----------
+    base : dict
+        Results of the base run.
+    new : dict
+        Results of the new run.
+    tolerance : float (optional)
+        Relative tolerance of the increases.
+    min_time : float (optional)
+        Minimum time in seconds of the base run to compare the times.
+    debug : boolean (optional)
+        Option to display steps.
+
+    Returns
+    -------
+    regressions : list (dict)
+        The name, family, size and reason of each regression.
+    """
+
+    # index base results
+    index = {(res['name'], res['family'], res['n']): res for res in base['results']}
+
+    regressions = []
+    for res in new['results']:
+        ref = index.get((res['name'], res['family'], res['n']))
+        if ref is None or 'error' in ref:
+            continue
+
+        reasons = []
+        if 'error' in res:
+            reasons.append(res['error'])
+        else:
+            if ref['time'] >= min_time and res['time'] > (1 + tolerance)*ref['time']:
+                reasons.append('time {ratio:.2f}x'.format(ratio=res['time']/ref['time']))
+            if ref.get('ops') and res.get('ops') is not None and res['ops'] > (1 + tolerance)*ref['ops']:
+                reasons.append('ops {ratio:.2f}x'.format(ratio=res['ops']/ref['ops']))
+            if ref.get('counts') and res.get('counts') and res['counts']['fev'] > (1 + tolerance)*ref['counts']['fev']:
+                reasons.append('fev {ratio:.2f}x'.format(ratio=res['counts']['fev']/max(ref['counts']['fev'], 1)))
+            if ref.get('peak_bytes') and res['peak_bytes'] > (1 + tolerance)*ref['peak_bytes']:
+                reasons.append('memory {ratio:.2f}x'.format(ratio=res['peak_bytes']/ref['peak_bytes']))
+
+        if len(reasons) > 0:
+            regressions.append({'name': res['name'], 'family': res['family'], 'n': res['n'], 'reason': ', '.join(reasons)})
+
+            # display
+            if debug:
+                print("{name} [{family}, n={n}]\t{reason}".format(**regressions[-1]))
+
+    # display
+    if debug:
+        print("\n{count} regression(s) found".format(count=len(regressions)))
+
+    return regressions
+
+# command-line interface
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark the scaling of the solvers.")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    parser_run = commands.add_parser('run', help="run the benchmarks and write the results")
+    parser_run.add_argument('--sizes', type=int, nargs='+', default=[16, 32, 64], help="sizes of the problems")
+    parser_run.add_argument('--repeat', type=int, default=3, help="number of timed runs")
+    parser_run.add_argument('--seed', type=int, default=0, help="seed of the random number generator")
+    parser_run.add_argument('--filter', default=None, help="substring of the names or family of the cases to run")
+    parser_run.add_argument('--output', default='benchmarks.json', help="path of the results file")
+
+    parser_compare = commands.add_parser('compare', help="compare two results files and flag the regressions")
+    parser_compare.add_argument('base', help="path of the base results file")
+    parser_compare.add_argument('new', help="path of the new results file")
+    parser_compare.add_argument('--tolerance', type=float, default=0.25, help="relative tolerance of the increases")
+    parser_compare.add_argument('--min-time', type=float, default=1e-4, help="minimum base time in seconds to compare")
+
+    args = parser.parse_args()
+
+    if args.command == 'run':
+        results = run(args.sizes, args.repeat, args.seed, args.filter)
+        with open(args.output, 'w') as file:
+            json.dump(results, file, indent=1)
+    else:
+        with open(args.base) as file:
+            base = json.load(file)
+        with open(args.new) as file:
+            new = json.load(file)
+        sys.exit(1 if len(compare(base, new, args.tolerance, args.min_time)) > 0 else 0)
@@ -2,7 +2,7 @@
 # -*- coding: utf-8 -*-
 # Authors: Sampreet Kalita
 # Created: 2020-01-30
-# Updated: 2020-01-30
+# Updated: 2026-10-19
 
 """Example code to use root_finding -> GaussSeidelIteration module."""
 
@@ -37,3 +37,29 @@ if root != None:
     print("\n\tRoot: {x}\n\tElement-wise Operations: {ops}".format(x=root, ops=ops))
 else:
     print("\n\t{msg}.\n\tElement-wise Operations: {ops}".format(msg=msg, ops=ops))
+
+# Multicolor function
+print("\nGauss-Seidel Iteration Method: Multicolor")
+
+# input
+A = [[      4.0,    -1.0,   0.0,    -1.0,   0.0,    0.0     ],
+    [       -1.0,   4.0,    -1.0,   0.0,    -1.0,   0.0     ],
+    [       0.0,    -1.0,   4.0,    0.0,    0.0,    -1.0    ],
+    [       -1.0,   0.0,    0.0,    4.0,    -1.0,   0.0     ],
+    [       0.0,    -1.0,   0.0,    -1.0,   4.0,    -1.0    ],
+    [       0.0,    0.0,    -1.0,   0.0,    -1.0,   4.0     ]]
+b = [       1.0,    1.0,    1.0,    1.0,    1.0,    1.0     ]
+
+x = [0, 0, 0, 0, 0, 0]
+lamb = 1.0
+imax = 1e5
+et = 1e-6
+
+# function
+root, ops, msg = GaussSeidelIteration.get_solution_multicolor(A, b, x, lamb, imax, et, True)
+
+# output
+if root != None:
+    print("\n\tRoot: {x}\n\tElement-wise Operations: {ops}".format(x=root, ops=ops))
+else:
+    print("\n\t{msg}.\n\tElement-wise Operations: {ops}".format(msg=msg, ops=ops))
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Authors: Sampreet Kalita
+# Created: 2026-10-19
+# Updated: 2026-10-19
+
+"""Module to count categorized operations and time the phases of the solvers."""
+
+# dependencies
+import time
+
+# categories of the operations
+CATEGORIES = ['add', 'mul', 'div', 'sqrt', 'cmp', 'fev', 'mov']
+
+class Instrument():
+    """
+    Class to count the operations of the solvers by category and to time their phases.
+
+    The categories are additions and subtractions ("add"), multiplications ("mul"), divisions ("div"), square roots ("sqrt"), comparisons ("cmp"), function evaluations ("fev") and element moves ("mov"). The phases are named by the solvers, for example "factor", "substitute", "sweep" or "search", and are timed between successive calls of `mark` and `lap`, hence a solver returning early leaves no phase running.
+    """
+
+    def __init__(self):
+        """Class constructor for Instrument."""
+
+        self.reset()
+
+    def reset(self):
+        """Reset the counts and the timings."""
+
+        self.counts = {category: 0 for category in CATEGORIES}
+        self.times = {}                 # elapsed time of each phase in seconds
+        self.time_mark = time.perf_counter()
+
+    def count(self, category, n=1):
+        """
+        Count operations of a category.
+
+        Parameters
+        ----------
+        category : String
+            Category of the operations.
+        n : int (optional)
+            Number of operations.
+        """
+
+        self.counts[category] += n
+
+    def wrap(self, fn):
+        """
+        Wrap a function to count its evaluations.
+
+        Parameters
+        ----------
+        fn : function
+            Given function.
+
+        Returns
+        -------
+        fn_counted : function
+            The function counting each evaluation as a function evaluation ("fev").
+        """
+
+        def fn_counted(*args, **kwargs):
+            self.counts['fev'] += 1
+            return fn(*args, **kwargs)
+
+        return fn_counted
+
+    def mark(self):
+        """Mark the start of a phase."""
+
+        self.time_mark = time.perf_counter()
+
+    def lap(self, name):
+        """
+        Add the time elapsed since the last mark to a phase and mark the start of the next phase.
+
+        Parameters
+        ----------
+        name : String
+            Name of the phase.
+        """
+
+        time_now = time.perf_counter()
+        self.times[name] = self.times.get(name, 0) + time_now - self.time_mark
+        self.time_mark = time_now
+
+    def get_flops(self):
+        """
+        Obtain the number of floating-point operations.
+
+        Returns
+        -------
+        flops : int
+            The total count of additions, multiplications, divisions and square roots.
+        """
+
+        return self.counts['add'] + self.counts['mul'] + self.counts['div'] + self.counts['sqrt']
+
+    def get_summary(self):
+        """
+        Obtain the counts and the timings.
+
+        Returns
+        -------
+        summary : dict
+            The counts of each category, the number of floating-point operations and the elapsed time of each phase in seconds.
+        """
+
+        return {'counts': dict(self.counts), 'flops': self.get_flops(), 'times': dict(self.times)}
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Authors: Sampreet Kalita
+# Created: 2026-10-19
+# Updated: 2026-10-19
+
+"""Module to record structured per-step events of the solvers into a preallocated ring buffer."""
+
+# dependencies
+import csv
+import json
+import time
+import numpy as np
+
+# fields of each event
+FIELDS = ['kind', 'step', 'row', 'col', 'norm', 'time_ns']
+
+class Trace():
+    """
+    Class to record per-step events of the solvers.
+
+    The events are stored in a preallocated ring buffer so that recording costs O(1) without any formatting, the oldest events being overwritten once the buffer is full. A solver records events only if a trace is passed to it, hence tracing costs nothing when disabled.
+
+    Parameters
+    ----------
+    size : int (optional)
+        Maximum number of events to keep, at least one.
+    callback : function (optional)
+        Function called with the event as a dictionary each time an event is recorded.
+    """
+
+    def __init__(self, size=4096, callback=None):
+        """Class constructor for Trace."""
+
+        # check size
+        if int(size) < 1:
+            raise ValueError("Size of the trace should be at least one")
+
+        # initialize buffer
+        self.size = int(size)
+        self.callback = callback
+        self.buffer = np.zeros(self.size, dtype=[('kind', np.int16), ('step', np.int64), ('row', np.int64), ('col', np.int64), ('norm', np.float64), ('time_ns', np.int64)])
+        self.kinds = []                 # names of the kinds of events
+        self.codes = {}                 # codes of the kinds of events
+        self.count = 0                  # total number of recorded events
+        self.time_0 = time.perf_counter_ns()
+
+    def record(self, kind, step, row=-1, col=-1, norm=np.nan):
+        """
+        Record an event.
+
+        Parameters
+        ----------
+        kind : String
+            Kind of the step, for example "elimination", "swap", "substitution", "iteration" or "rotation".
+        step : int
+            Index of the step.
+        row : int (optional)
+            Row index of the step, for example of the pivot element.
+        col : int (optional)
+            Column index of the step.
+        norm : float (optional)
+            Norm or magnitude associated with the step, for example of the pivot element or the change of the solution.
+        """
+
+        # get code of the kind
+        code = self.codes.get(kind)
+        if code is None:
+            code = len(self.kinds)
+            self.codes[kind] = code
+            self.kinds.append(kind)
+
+        # update buffer
+        elapsed = time.perf_counter_ns() - self.time_0
+        self.buffer[self.count % self.size] = (code, step, row, col, norm, elapsed)
+        self.count += 1
+
+        # call hook
+        if self.callback is not None:
+            self.callback({'kind': kind, 'step': step, 'row': row, 'col': col, 'norm': norm, 'time_ns': elapsed})
+
+    def get_events(self):
+        """
+        Obtain the recorded events in order of recording.
+
+        Returns
+        -------
+        events : list (dict)
+            The events kept in the buffer, oldest first.
+        """
+
+        # order the buffer from the oldest event
+        if self.count > self.size:
+            start = self.count % self.size
+            records = np.concatenate((self.buffer[start:], self.buffer[:start]))
+        else:
+            records = self.buffer[:self.count]
+
+        return [{'kind': self.kinds[rec[0]], 'step': int(rec[1]), 'row': int(rec[2]), 'col': int(rec[3]), 'norm': float(rec[4]), 'time_ns': int(rec[5])} for rec in records]
+
+    def export_json(self, path):
+        """
+        Export the recorded events to a JSON file.
+
+        Parameters
+        ----------
+        path : String
+            Path of the file.
+        """
+
+        # replace NaN which is not valid JSON
+        events = [{key: (None if key == 'norm' and val != val else val) for key, val in event.items()} for event in self.get_events()]
+
+        with open(path, 'w') as file:
+            json.dump({'count': self.count, 'events': events}, file)
+
+    def export_csv(self, path):
+        """
+        Export the recorded events to a CSV file.
+
+        Parameters
+        ----------
+        path : String
+            Path of the file.
+        """
+
+        with open(path, 'w', newline='') as file:
+            writer = csv.DictWriter(file, fieldnames=FIELDS)
+            writer.writeheader()
+            writer.writerows(self.get_events())
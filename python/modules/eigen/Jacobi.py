@@ -2,12 +2,15 @@
 # -*- coding: utf-8 -*-
 # Authors: Sampreet Kalita
 # Created: 2020-02-13
-# Updated: 2020-02-17
+# Updated: 2026-10-19
 
 """Module to obtain eigenvalues and eigenvectors using Jacobi's Method."""
 
 # dependencies
 import math
+import numpy as np
+
+from modules.root_finding.PackedSymmetric import PackedSymmetric
 
 def get_mat_product(A, B):
     """
@@ -46,13 +49,15 @@ def get_mat_product(A, B):
     return C
 
 
-def get_eigens(A, et=1e-6, imax=1e6, debug=True):
+def get_eigens(A, et=1e-6, imax=1e6, debug=True, trace=None, inst=None):
     """
     Obtain the eigenvalues and eigenvectors of a symmetric matrix A using Jacobi's Method.
 
+    The rotated matrix is kept in packed symmetric storage and each rotation updates only the rows and columns p and q of the rotated matrix and the columns p and q of the rotation matrix in place. The largest off-diagonal element of each row is tracked between the rotations, hence a rotation costs O(n) operations unless the largest element of many rows is rotated.
+
     Parameters
     ----------
-    A : list
+    A : list or PackedSymmetric
         Given symmetric matrix.
     et : float (optional)
         Threshold of relative error.
@@ -60,6 +65,10 @@ def get_eigens(A, et=1e-6, imax=1e6, debug=True):
         Maximum number of iterations to consider.
     debug : boolean
         Option to display steps.
+    trace : Trace (optional)
+        Trace to record the steps.
+    inst : Instrument (optional)
+        Instrument to count the operations by category and time the phases.
 
     Returns
     -------
@@ -77,75 +86,509 @@ def get_eigens(A, et=1e-6, imax=1e6, debug=True):
         print("Matrix A:\t{A}".format(A=A))
 
     # initial diagonal matrix
-    D = [[A[i][j] for j in range(dim)] for i in range(dim)]
+    D = PackedSymmetric(A)
     # initial rotation matrix
-    R = [[1 if i==j else 0 for j in range(dim)] for i in range(dim)]
+    R = np.eye(dim)
+
+    # instrument
+    if inst is not None:
+        inst.mark()
+
+    # column and magnitude of the largest off-diagonal element of each row of the upper triangle
+    cols = np.zeros(dim, dtype=int)
+    maxs = np.zeros(dim)
+    for i in range(dim - 1):
+        cols[i], maxs[i] = get_row_max(D, i)
+
+    # instrument
+    if inst is not None:
+        inst.count("cmp", dim*(dim - 1)//2)
 
     # iterate until error threshold or max number of iterations is reached
     while(True):
         # get indices of maximum off-diagonal element
-        temp_max = D[0][1] if D[0][1] >= 0 else -D[0][1]
-        p = 0
-        q = 1
-        for i in range(dim - 1):
-            for j in range(i + 1, dim):
-                temp_abso = D[i][j] if D[i][j] > 0 else -D[i][j]
-                if temp_abso > temp_max:
-                    temp_max = temp_abso
-                    p = i
-                    q = j
+        p = int(np.argmax(maxs))
+        q = int(cols[p])
+        temp_max = maxs[p]
+
+        # instrument
+        if inst is not None:
+            inst.count("cmp", dim + 1)
+            inst.lap("search")
 
         if temp_max < et or ic >= imax:
             break 
 
         # start iteration
         ic += 1
+
+        # record
+        if trace is not None:
+            trace.record("rotation", ic, p, q, temp_max)
         if debug:
             print('\nIteration #\t{}\n-----------'.format(ic))
             
-        # form currrent rotation matrix
-        theta = math.pi/4
-        if D[q][q] != D[p][p]:
-            ratio = 2*D[p][q]/(D[q][q] - D[p][p])
-            theta = 0.5*math.atan(ratio)
-        c = math.cos(theta)
-        s = math.sin(theta)
-        temp_R = [[1 if i==j else 0 for j in range(dim)] for i in range(dim)]
-        temp_R[p][p] = c
-        temp_R[p][q] = s
-        temp_R[q][p] = -s
-        temp_R[q][q] = c
-        
-        # total rotation matrix
-        R = get_mat_product(temp_R, R)
-
-        # form current diagonal matrix
-        temp_D = [[D[i][j] for j in range(dim)] for i in range(dim)]
-        temp_D[p][q] = 0
-        temp_D[q][p] = 0
-        temp_D[p][p] = c**2*D[p][p] + s**2*D[q][q] - 2*c*s*D[p][q]
-        temp_D[q][q] = s**2*D[p][p] + c**2*D[q][q] + 2*c*s*D[p][q]
-        for j in range(dim):
-            if j != p and j != q:
-                temp_D[j][p] = c*D[j][p] - s*D[j][q]
-                temp_D[p][j] = temp_D[j][p]
-                temp_D[j][q] = c*D[j][q] + s*D[j][p]
-                temp_D[q][j] = temp_D[j][q]
-        
-        # update diagonal matrix
-        D = [[temp_D[i][j] for j in range(dim)] for i in range(dim)]
-        
+        # form currrent rotation
+        c, s = get_rotation(D.get(p, p), D.get(q, q), D.get(p, q))
+
+        # rotate diagonal and rotation matrices
+        D, R, ops = get_rotated(D, R, p, q, c, s)
+
+        # rows whose largest element is rotated
+        rows = [i for i in np.flatnonzero((cols == p) | (cols == q)).tolist() + [p, q] if i < dim - 1]
+
+        # compare the rotated elements of the other rows
+        for j in (p, q):
+            temp_abso = np.abs(D.data[D.get_indices(j)[:j]])
+            larger = temp_abso > maxs[:j]
+            cols[:j][larger] = j
+            maxs[:j][larger] = temp_abso[larger]
+
+        # search the rows whose largest element is rotated
+        for i in set(rows):
+            cols[i], maxs[i] = get_row_max(D, i)
+
+        # instrument
+        if inst is not None:
+            inst.count("sqrt", 2)
+            inst.count("div", 3)
+            inst.count("add", 4*dim + 6)
+            inst.count("mul", 8*dim + 14)
+            inst.count("cmp", p + q + len(rows)*dim)
+            inst.lap("rotate")
+
         if debug:
-            print('Matrix R: {}'.format(R))
+            print('Matrix R: {}'.format(R.tolist()))
             print('Matrix D: {}'.format(D))
             
     # eigenvalues and eigenvectors
-    eig_val = [D[i][i] for i in range(dim)]
-    eig_vec = [[R[j][i] for j in range(dim)] for i in range(dim)]
+    eig_val = [float(D.get(i, i)) for i in range(dim)]
+    eig_vec = R.T.tolist()
 
     return eig_val, eig_vec, ic, 'Eigenvalues and eigenvectors obtained'
-                    
 
+def get_eigens_cyclic(A, et=1e-6, imax=50, debug=True, trace=None, inst=None):
+    """
+    Obtain the eigenvalues and eigenvectors of a symmetric matrix A using Cyclic Jacobi's Method with Threshold Sweeps.
 
+    The rotations are performed row by row in a fixed order without searching for the largest off-diagonal element. During the first three sweeps the elements below a threshold proportional to the off-diagonal norm are skipped, and afterwards the elements negligible with respect to both of their diagonal elements are set to zero. The convergence is checked once per sweep on the Frobenius norm of the off-diagonal elements.
 
-            
+    Parameters
+    ----------
+    A : list or PackedSymmetric
+        Given symmetric matrix.
+    et : float (optional)
+        Threshold of the Frobenius norm of the off-diagonal elements.
+    imax : int (optional)
+        Maximum number of sweeps to consider.
+    debug : boolean
+        Option to display steps.
+    trace : Trace (optional)
+        Trace to record the steps.
+    inst : Instrument (optional)
+        Instrument to count the operations by category and time the phases.
+
+    Returns
+    -------
+    eig_val, eig_vec, ic, msg : float, int, String
+        The eigenvalues and the eigenvectors and the sweep count with status string.
+    """
+
+    # initialize values
+    dim = len(A)                        # dimension of the eigenvector
+    ic = 0                              # sweep counter
+    ic_rot = 0                          # rotation counter
+
+    # display
+    if debug:
+        print("Input\n-------")
+        print("Matrix A:\t{A}".format(A=A))
+
+    # initial diagonal matrix
+    D = PackedSymmetric(A)
+    # initial rotation matrix
+    R = np.eye(dim)
+    # positions of the off-diagonal elements in the packed storage
+    off = np.ones(len(D.data), dtype=bool)
+    off[[D.get_index(i, i) for i in range(dim)]] = False
+
+    # instrument
+    if inst is not None:
+        inst.mark()
+
+    # iterate until error threshold or max number of sweeps is reached
+    while(True):
+        # off-diagonal norm without cancellation against the diagonal
+        D_off = D.data[off]
+        norm_off = math.sqrt(2*(D_off @ D_off))
+
+        # instrument
+        if inst is not None:
+            inst.count("add", dim*(dim - 1)//2)
+            inst.count("mul", dim*(dim - 1)//2 + 1)
+            inst.count("sqrt", 1)
+            inst.count("cmp", 1)
+            inst.lap("check")
+
+        # display
+        if debug:
+            print('\nSweep #\t{}\n-----------'.format(ic))
+            print('Off-diagonal norm: {}'.format(norm_off))
+
+        if norm_off < et:
+            break
+
+        # check iteration threshold
+        if ic >= imax:
+            return [float(D.get(i, i)) for i in range(dim)], R.T.tolist(), ic, 'Maximum sweeps reached'
+
+        # start sweep
+        ic += 1
+        # threshold of the first sweeps
+        thresh = 0.2*norm_off/dim if ic <= 3 else 0
+
+        # for each off-diagonal element by rows
+        for p in range(dim - 1):
+            for q in range(p + 1, dim):
+                d_pq = D.get(p, q)
+                temp_abso = abs(d_pq)
+
+                # set negligible element to zero after the first sweeps
+                if ic > 4 and abs(D.get(p, p)) + 100*temp_abso == abs(D.get(p, p)) and abs(D.get(q, q)) + 100*temp_abso == abs(D.get(q, q)):
+                    D.set(p, q, 0)
+                    continue
+
+                # skip element below threshold
+                if temp_abso <= thresh or temp_abso == 0:
+                    continue
+
+                # rotate diagonal and rotation matrices
+                c, s = get_rotation(D.get(p, p), D.get(q, q), d_pq)
+                D, R, ops = get_rotated(D, R, p, q, c, s)
+                ic_rot += 1
+
+                # record
+                if trace is not None:
+                    trace.record("rotation", ic_rot, p, q, temp_abso)
+
+                # instrument
+                if inst is not None:
+                    inst.count("sqrt", 2)
+                    inst.count("div", 3)
+                    inst.count("add", 4*dim + 6)
+                    inst.count("mul", 8*dim + 14)
+
+        # instrument
+        if inst is not None:
+            inst.count("cmp", dim*(dim - 1))
+            inst.lap("rotate")
+
+        # display
+        if debug:
+            print('Rotations: {}'.format(ic_rot))
+            print('Matrix D: {}'.format(D))
+
+    # eigenvalues and eigenvectors
+    eig_val = [float(D.get(i, i)) for i in range(dim)]
+    eig_vec = R.T.tolist()
+
+    return eig_val, eig_vec, ic, 'Eigenvalues and eigenvectors obtained'
+
+def get_eigens_parallel(A, et=1e-6, imax=50, debug=True, trace=None, inst=None):
+    """
+    Obtain the eigenvalues and eigenvectors of a symmetric matrix A using Parallel Jacobi's Method with Round-Robin Ordering.
+
+    Each sweep is divided into the rounds of a round-robin tournament, such that every pair of indices meets once per sweep and the n/2 pairs of each round are disjoint. The rotations of disjoint pairs commute, hence all rotations of a round are applied to the columns and rows of the matrix and to the columns of the rotation matrix as single array operations. The elements below the threshold of the first three sweeps are skipped, the elements negligible with respect to both of their diagonal elements are set to zero afterwards, and the convergence is checked once per sweep on the Frobenius norm of the off-diagonal elements.
+
+    Parameters
+    ----------
+    A : list or numpy.ndarray or PackedSymmetric
+        Given symmetric matrix.
+    et : float (optional)
+        Threshold of the Frobenius norm of the off-diagonal elements.
+    imax : int (optional)
+        Maximum number of sweeps to consider.
+    debug : boolean
+        Option to display steps.
+    trace : Trace (optional)
+        Trace to record the steps.
+    inst : Instrument (optional)
+        Instrument to count the operations by category and time the phases.
+
+    Returns
+    -------
+    eig_val, eig_vec, ic, msg : float, int, String
+        The eigenvalues and the eigenvectors and the sweep count with status string.
+    """
+
+    # initialize values
+    D = np.array(A, dtype=float)        # rotated matrix
+    dim = len(D)                        # dimension of the eigenvector
+    ic = 0                              # sweep counter
+    ic_round = 0                        # round counter
+    # initial rotation matrix
+    R = np.eye(dim)
+    # rounds of disjoint pairs
+    rounds = get_rounds(dim)
+
+    # display
+    if debug:
+        print("Input\n-------")
+        print("Matrix A:\t{A}".format(A=D.tolist()))
+        print("Rounds per sweep:\t{count}".format(count=len(rounds)))
+
+    # instrument
+    if inst is not None:
+        inst.mark()
+
+    # iterate until error threshold or max number of sweeps is reached
+    while(True):
+        # off-diagonal norm without cancellation against the diagonal
+        D_off = D - np.diag(np.diagonal(D))
+        norm_off = math.sqrt(np.sum(D_off*D_off))
+
+        # instrument
+        if inst is not None:
+            inst.count("add", dim*dim)
+            inst.count("mul", dim*dim)
+            inst.count("sqrt", 1)
+            inst.count("cmp", 1)
+            inst.lap("check")
+
+        # display
+        if debug:
+            print('\nSweep #\t{}\n-----------'.format(ic))
+            print('Off-diagonal norm: {}'.format(norm_off))
+
+        if norm_off < et:
+            break
+
+        # check iteration threshold
+        if ic >= imax:
+            return np.diagonal(D).tolist(), R.T.tolist(), ic, 'Maximum sweeps reached'
+
+        # start sweep
+        ic += 1
+        # threshold of the first sweeps
+        thresh = 0.2*norm_off/dim if ic <= 3 else 0
+
+        # for each round
+        for P, Q in rounds:
+            ic_round += 1
+            d_pq = D[P, Q]
+
+            # set negligible elements to zero after the first sweeps
+            if ic > 4:
+                d_pp, d_qq = np.abs(D[P, P]), np.abs(D[Q, Q])
+                d_pq = np.where((d_pp + 100*np.abs(d_pq) == d_pp) & (d_qq + 100*np.abs(d_pq) == d_qq), 0, d_pq)
+
+            # cosines and sines of the rotations with the rotations below threshold skipped
+            c, s = get_rotations(D[P, P], D[Q, Q], d_pq, thresh)
+
+            # rotate columns and rows of the diagonal matrix
+            D_p, D_q = D[:, P], D[:, Q]
+            D[:, P], D[:, Q] = c*D_p - s*D_q, s*D_p + c*D_q
+            D_p, D_q = D[P], D[Q]
+            D[P], D[Q] = c[:, None]*D_p - s[:, None]*D_q, s[:, None]*D_p + c[:, None]*D_q
+            D[P, Q] = np.where((s != 0) | (d_pq == 0), 0, D[P, Q])
+            D[Q, P] = D[P, Q]
+
+            # rotate columns of the rotation matrix
+            R_p, R_q = R[:, P], R[:, Q]
+            R[:, P], R[:, Q] = c*R_p - s*R_q, s*R_p + c*R_q
+
+            # record
+            if trace is not None:
+                trace.record("rotation", ic_round, int(np.count_nonzero(s)), len(P), float(np.max(np.abs(d_pq), initial=0)))
+
+            # instrument
+            if inst is not None:
+                inst.count("sqrt", 2*len(P))
+                inst.count("div", 3*len(P))
+                inst.count("add", 6*dim*len(P) + 4*len(P))
+                inst.count("mul", 12*dim*len(P) + 3*len(P))
+                inst.count("cmp", 2*len(P))
+
+        # instrument
+        if inst is not None:
+            inst.lap("rotate")
+
+        # display
+        if debug:
+            print('Matrix D: {}'.format(D.tolist()))
+
+    # eigenvalues and eigenvectors
+    eig_val = np.diagonal(D).tolist()
+    eig_vec = R.T.tolist()
+
+    return eig_val, eig_vec, ic, 'Eigenvalues and eigenvectors obtained'
+
+def get_rounds(dim):
+    """
+    Obtain the rounds of a round-robin tournament of the indices, such that every pair of indices meets once and the pairs of each round are disjoint.
+
+    The first index stays in place while the others move by one position each round, and for an odd number of indices a dummy index is added whose pairs are dropped.
+
+    Parameters
+    ----------
+    dim : int
+        Number of indices.
+
+    Returns
+    -------
+    rounds : list (tuple (numpy.ndarray, numpy.ndarray))
+        The first and second indices of the pairs of each round with the first index smaller.
+    """
+
+    # initialize values
+    m = dim + dim%2                     # even number of players
+    players = list(range(m))
+    rounds = []
+
+    # for each round
+    for r in range(m - 1):
+        pairs = [(min(players[k], players[m - 1 - k]), max(players[k], players[m - 1 - k])) for k in range(m//2)]
+        pairs = [pair for pair in pairs if pair[1] < dim]
+        rounds.append((np.array([pair[0] for pair in pairs], dtype=int), np.array([pair[1] for pair in pairs], dtype=int)))
+
+        # move the players except the first
+        players = [players[0], players[-1]] + players[1:-1]
+
+    return rounds
+
+def get_rotations(d_pp, d_qq, d_pq, thresh=0):
+    """
+    Obtain the cosines and sines of the Jacobi rotations annihilating the off-diagonal elements of a batch of symmetric 2x2 matrices.
+
+    Parameters
+    ----------
+    d_pp : numpy.ndarray
+        First diagonal elements.
+    d_qq : numpy.ndarray
+        Second diagonal elements.
+    d_pq : numpy.ndarray
+        Off-diagonal elements.
+    thresh : float (optional)
+        Threshold of the off-diagonal elements, at or below which the rotations are skipped.
+
+    Returns
+    -------
+    c, s : numpy.ndarray, numpy.ndarray
+        The cosines and the sines of the rotation angles, one and zero for the skipped rotations.
+    """
+
+    # rotations to perform
+    active = (np.abs(d_pq) > thresh) & (d_pq != 0)
+    d_pq = np.where(active, d_pq, 1)
+
+    # tangents of the rotation angles, vanishing for overflowing ratios
+    with np.errstate(over='ignore'):
+        tau = (d_qq - d_pp)/(2*d_pq)
+        t = np.where(tau >= 0, 1.0, -1.0)/(np.abs(tau) + np.sqrt(1 + tau*tau))
+    t = np.where(active, t, 0)
+    c = 1/np.sqrt(1 + t*t)
+
+    return c, t*c
+
+def get_rotation(d_pp, d_qq, d_pq):
+    """
+    Obtain the cosine and sine of the Jacobi rotation annihilating the off-diagonal element of a symmetric 2x2 matrix.
+
+    The tangent is obtained as the smaller root of its quadratic equation, hence the rotation angle is at most pi/4 and no trigonometric functions are evaluated.
+
+    Parameters
+    ----------
+    d_pp : float
+        First diagonal element.
+    d_qq : float
+        Second diagonal element.
+    d_pq : float
+        Off-diagonal element.
+
+    Returns
+    -------
+    c, s : float, float
+        The cosine and the sine of the rotation angle.
+    """
+
+    # if already diagonal
+    if d_pq == 0:
+        return 1.0, 0.0
+
+    # tangent of the rotation angle
+    tau = (d_qq - d_pp)/(2*d_pq)
+    t = (1 if tau >= 0 else -1)/(abs(tau) + math.sqrt(1 + tau*tau))
+    c = 1/math.sqrt(1 + t*t)
+
+    return c, t*c
+
+def get_rotated(D, R, p, q, c, s):
+    """
+    Apply a Jacobi rotation in the plane (p, q) in place to a symmetric matrix in packed storage and to the accumulated rotation matrix.
+
+    Parameters
+    ----------
+    D : PackedSymmetric
+        Symmetric matrix, updated as G^T*D*G.
+    R : numpy.ndarray
+        Accumulated rotation matrix, updated as R*G.
+    p : int
+        First index of the plane.
+    q : int
+        Second index of the plane.
+    c : float
+        Cosine of the rotation angle.
+    s : float
+        Sine of the rotation angle.
+
+    Returns
+    -------
+    D, R, ops : PackedSymmetric, numpy.ndarray, int
+        The rotated matrices with the operation count.
+    """
+
+    # initialize values
+    dim = len(R)                        # dimension of the matrices
+    data = D.data
+    # positions of the rows p and q in the packed storage
+    index_p, index_q = D.get_indices(p), D.get_indices(q)
+    d_pp, d_qq, d_pq = data[index_p[p]], data[index_q[q]], data[index_p[q]]
+
+    # update rows and columns p and q
+    d_p, d_q = data[index_p], data[index_q]
+    data[index_p] = c*d_p - s*d_q
+    data[index_q] = s*d_p + c*d_q
+
+    # update the elements of the plane
+    data[index_p[p]] = c**2*d_pp + s**2*d_qq - 2*c*s*d_pq
+    data[index_q[q]] = s**2*d_pp + c**2*d_qq + 2*c*s*d_pq
+    data[index_p[q]] = 0
+
+    # update columns p and q of the rotation matrix
+    r_p, r_q = R[:, p].copy(), R[:, q].copy()
+    R[:, p] = c*r_p - s*r_q
+    R[:, q] = s*r_p + c*r_q
+
+    return D, R, 12*dim + 20
+
+def get_row_max(D, i):
+    """
+    Obtain the largest off-diagonal element of a row in the upper triangle of a symmetric matrix in packed storage.
+
+    Parameters
+    ----------
+    D : PackedSymmetric
+        Symmetric matrix.
+    i : int
+        Row index, less than n - 1.
+
+    Returns
+    -------
+    col, maxi : int, float
+        The column and the magnitude of the largest element.
+    """
+
+    temp_abso = np.abs(D.data[D.get_indices(i)[i + 1:]])
+    k = int(np.argmax(temp_abso))
+
+    return i + 1 + k, float(temp_abso[k])
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Authors: Sampreet Kalita
+# Created: 2026-10-19
+# Updated: 2026-10-19
+
+"""Module to obtain a few extreme eigenvalues and eigenvectors of large sparse symmetric matrices using Thick-Restart Lanczos Method."""
+
+# dependencies
+import math
+import numpy as np
+
+from modules.eigen.Jacobi import get_eigens_cyclic
+from modules.root_finding.ConjugateGradient import get_mat_vec
+
+def get_orthogonalized(V, w, count, reorth, kept=0, scale=1.0):
+    """
+    Obtain the component of a Lanczos vector orthogonal to the basis.
+
+    Parameters
+    ----------
+    V : numpy.ndarray
+        Basis of the Krylov subspace as columns.
+    w : numpy.ndarray
+        Given vector.
+    count : int
+        Number of columns of the basis to orthogonalize against.
+    reorth : String
+        Reorthogonalization, either "full" to orthogonalize against all columns twice, or "selective" to orthogonalize against the kept Ritz vectors and against all columns only when the loss of orthogonality exceeds the square root of the machine precision.
+    kept : int (optional)
+        Number of Ritz vectors kept at the last restart as the first columns of the basis.
+    scale : float (optional)
+        Norm of the vector before the three-term recurrence, to which the loss of orthogonality is relative.
+
+    Returns
+    -------
+    w, h, ops : numpy.ndarray, numpy.ndarray, int
+        The orthogonalized vector and the removed components along the columns with the operation count.
+    """
+
+    # initialize values
+    dim = len(w)                        # dimension of the vectors
+    h = np.zeros(count)
+
+    # orthogonalize against the kept Ritz vectors
+    if reorth == "selective":
+        h[:kept] = V[:, :kept].T @ w
+        w = w - V[:, :kept] @ h[:kept]
+        ops = 4*dim*kept
+
+        # estimate the loss of orthogonality
+        h_all = V[:, :count].T @ w
+        ops += 2*dim*count
+        if np.max(np.abs(h_all), initial=0) <= math.sqrt(np.finfo(float).eps)*scale:
+            return w, h, ops
+
+        passes = 1
+        w = w - V[:, :count] @ h_all
+        h += h_all
+        ops += 2*dim*count
+    else:
+        passes = 2
+        ops = 0
+
+    # orthogonalize against all columns
+    for i in range(passes):
+        h_i = V[:, :count].T @ w
+        w = w - V[:, :count] @ h_i
+        h += h_i
+        ops += 4*dim*count
+
+    return w, h, ops
+
+def get_eigens_Lanczos(A, k, which="lowest", m=None, x=None, et=1e-8, imax=100, debug=True, reorth="full", trace=None, inst=None):
+    """
+    Obtain k extreme eigenvalues and eigenvectors of a symmetric matrix A using Thick-Restart Lanczos Method.
+
+    The matrix is accessed only by matrix-vector products, hence it may be given as a sparse matrix, a linear operator or a matrix-vector product function, and the memory is O(n*m) for a basis of m vectors. Each cycle extends the basis to m vectors by the Lanczos recurrence with reorthogonalization and solves the projected m x m problem using `Jacobi.get_eigens_cyclic`. The cycle restarts with the Ritz vectors of the wanted end of the spectrum kept as the first columns of the basis, such that the projected matrix is diagonal with an arrow of the residual couplings, until the residual norms of the k wanted Ritz pairs are below the threshold.
+
+    Parameters
+    ----------
+    A : list (list (float)) or numpy.ndarray or LinearOperator or function
+        Given symmetric matrix, sparse matrix, linear operator or matrix-vector product function. The initial vector is required for a function.
+    k : int
+        Number of eigenpairs.
+    which : String (optional)
+        End of the spectrum, either "lowest" or "highest".
+    m : int (optional)
+        Number of basis vectors of each cycle. If not provided, it is taken as the larger of 2*k + 1 and 20.
+    x : list (float) (optional)
+        Initial vector.
+    et : float (optional)
+        Threshold of the residual norms of the normalized Ritz vectors relative to the largest Ritz value magnitude.
+    imax : int (optional)
+        Maximum number of restarts to consider.
+    debug : boolean
+        Option to display steps.
+    reorth : String (optional)
+        Reorthogonalization, either "full" or "selective".
+    trace : Trace (optional)
+        Trace to record the steps.
+    inst : Instrument (optional)
+        Instrument to count the operations by category and time the phases.
+
+    Returns
+    -------
+    eig_val, eig_vec, ic, msg : list (float), numpy.ndarray, int, String
+        The eigenvalues in the order of the selected end and the eigenvectors as rows and the restart count with status string.
+    """
+
+    # initialize values
+    dim = A.shape[0] if hasattr(A, 'nnz') else len(A) if hasattr(A, '__len__') else len(x)
+    ic = 0                              # restart counter
+    k = min(k, dim)                     # number of eigenpairs
+    m = min(max(2*k + 1, 20) if m is None else max(m, k + 1), dim)
+    mat_vec, ops_mv = get_mat_vec(A, dim)
+    eps = np.finfo(float).eps           # machine precision
+
+    # check selection and reorthogonalization
+    if which not in ["lowest", "highest"]:
+        return None, None, ic, 'Selection is unknown'
+    if reorth not in ["full", "selective"]:
+        return None, None, ic, 'Reorthogonalization is unknown'
+
+    # basis and projected matrix
+    V = np.zeros((dim, m + 1))
+    T = np.zeros((m, m))
+    x = np.random.default_rng(0).uniform(-1, 1, dim) if x is None else np.array(x, dtype=float)
+    V[:, 0] = x/math.sqrt(x @ x)
+    # number of Ritz vectors kept at the last restart
+    kept = 0
+    # norm of the residual coupling
+    beta = 0.0
+
+    # display
+    if debug:
+        print("Input\n-------")
+        print("Dimension:\t{dim}\nBasis vectors:\t{m}".format(dim=dim, m=m))
+
+    # instrument
+    if inst is not None:
+        inst.mark()
+
+    while(True):
+        # extend the basis by the Lanczos recurrence
+        for j in range(kept, m):
+            w = mat_vec(V[:, j])
+            norm_w = math.sqrt(w @ w)
+
+            # three-term recurrence with the arrow after a restart
+            if reorth == "selective":
+                alpha = V[:, j] @ w
+                w = w - alpha*V[:, j] - (T[j - 1, j]*V[:, j - 1] if j > kept else 0)
+                w, h, ops_o = get_orthogonalized(V, w, j + 1, reorth, kept, norm_w)
+                h[j] += alpha
+            else:
+                w, h, ops_o = get_orthogonalized(V, w, j + 1, reorth)
+
+            # update projected matrix
+            T[j, j] = h[j]
+            if j == kept and kept > 0:
+                T[:kept, j] = T[j, :kept] = h[:kept]
+            beta = math.sqrt(w @ w)
+
+            # invariant subspace with a new direction orthogonal to the basis
+            if beta <= eps*max(norm_w, 1):
+                w = np.random.default_rng(ic*m + j + 1).uniform(-1, 1, dim)
+                w, h, ops_r = get_orthogonalized(V, w, j + 1, "full")
+                V[:, j + 1] = w/math.sqrt(w @ w)
+                beta = 0.0
+            else:
+                V[:, j + 1] = w/beta
+            if j < m - 1:
+                T[j, j + 1] = T[j + 1, j] = beta
+
+            # instrument
+            if inst is not None:
+                inst.count("add", ops_mv//2 + ops_o//2 + 3*dim)
+                inst.count("mul", ops_mv//2 + ops_o//2 + 4*dim)
+                inst.count("div", dim)
+                inst.count("sqrt", 2)
+                inst.count("cmp", 1)
+
+        # instrument
+        if inst is not None:
+            inst.lap("lanczos")
+
+        # Ritz values and vectors of the projected matrix
+        theta, Y, ic_j, msg_j = get_eigens_cyclic(T, math.sqrt(eps)*max(math.sqrt(np.sum(T*T)), eps), 50, False)
+        theta = np.array(theta)
+        Y = np.array(Y).T
+        order = np.argsort(theta) if which == "lowest" else np.argsort(-theta)
+
+        # check projected problem
+        if msg_j != 'Eigenvalues and eigenvectors obtained':
+            return theta[order[:k]].tolist(), (V[:, :m] @ Y[:, order[:k]]).T, ic, 'Projected problem not solved'
+
+        # residual norms of the wanted Ritz pairs
+        res = beta*np.abs(Y[m - 1, order[:k]])
+        scale = max(np.max(np.abs(theta)), eps)
+        conv = int(np.count_nonzero(res <= et*scale))
+
+        # record
+        if trace is not None:
+            trace.record("restart", ic, conv, kept, float(np.max(res)))
+
+        # instrument
+        if inst is not None:
+            inst.count("add", m*m*ic_j + 3*k)
+            inst.count("mul", 2*m*m*ic_j + k)
+            inst.count("cmp", m*m + k)
+
+        # display
+        if debug:
+            print('\nRestart #\t{}\n-----------'.format(ic))
+            print('Ritz values: {}'.format(theta[order[:k]].tolist()))
+            print('Residual norms: {}'.format(res.tolist()))
+
+        # check residual threshold
+        if conv == k or m == dim:
+            return theta[order[:k]].tolist(), (V[:, :m] @ Y[:, order[:k]]).T, ic, 'Eigenvalues and eigenvectors obtained'
+
+        # check iteration threshold
+        if ic >= imax:
+            return theta[order[:k]].tolist(), (V[:, :m] @ Y[:, order[:k]]).T, ic, 'Maximum restarts reached'
+
+        # start restart
+        ic += 1
+
+        # keep the wanted Ritz vectors and half of the others
+        kept = min(k + (m - k)//2, m - 1)
+        V[:, :kept] = V[:, :m] @ Y[:, order[:kept]]
+        V[:, kept] = V[:, m]
+        T[:] = 0
+        T[:kept, :kept] = np.diag(theta[order[:kept]])
+        # couplings of the kept Ritz vectors with the residual vector
+        T[:kept, kept] = T[kept, :kept] = beta*Y[m - 1, order[:kept]]
+
+        # instrument
+        if inst is not None:
+            inst.count("add", dim*m*kept)
+            inst.count("mul", dim*m*kept + kept)
+            inst.count("mov", dim*(kept + 1))
+            inst.lap("restart")
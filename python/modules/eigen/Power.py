@@ -0,0 +1,493 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Authors: Sampreet Kalita
+# Created: 2026-10-19
+# Updated: 2026-10-19
+
+"""Module to obtain a few extreme eigenvalues and eigenvectors using Power, Inverse and Rayleigh Quotient Iteration."""
+
+# dependencies
+import math
+import numpy as np
+
+from modules.root_finding.ConjugateGradient import get_mat_vec
+from modules.root_finding.LUDecomposition import get_LU_pivot, get_solution_factors
+
+def get_initial(dim, x=None):
+    """
+    Obtain the normalized initial vector of the iterations.
+
+    Parameters
+    ----------
+    dim : int
+        Dimension of the eigenvector.
+    x : list (float) or numpy.ndarray (optional)
+        Given initial vector. If not provided, a seeded random vector is taken so that it is not orthogonal to the eigenvectors of structured matrices.
+
+    Returns
+    -------
+    x : numpy.ndarray
+        The normalized initial vector.
+    """
+
+    x = np.random.default_rng(0).uniform(-1, 1, dim) if x is None else np.array(x, dtype=float)
+
+    return x/math.sqrt(x @ x)
+
+def get_deflated(x, basis=None):
+    """
+    Obtain the component of a vector orthogonal to the given eigenvectors.
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        Given vector.
+    basis : numpy.ndarray (optional)
+        Orthonormal eigenvectors already obtained as columns.
+
+    Returns
+    -------
+    x, ops : numpy.ndarray, int
+        The deflated vector with the operation count.
+    """
+
+    if basis is None or basis.shape[1] == 0:
+        return x, 0
+
+    # project twice to keep orthogonality in floating point
+    for i in range(2):
+        x = x - basis @ (basis.T @ x)
+
+    return x, 8*len(x)*basis.shape[1]
+
+def get_eigen_power(A, x=None, et=1e-6, imax=1000, debug=True, trace=None, inst=None, basis=None):
+    """
+    Obtain the eigenvalue of largest magnitude and its eigenvector of a symmetric matrix A using Power Iteration.
+
+    Each iteration costs one matrix-vector product, hence the matrix may be given as a sparse matrix or a matrix-vector product function. The eigenvalue is the Rayleigh quotient of the iterate and the iterations converge with the ratio of the two largest eigenvalue magnitudes.
+
+    Parameters
+    ----------
+    A : list (list (float)) or numpy.ndarray or LinearOperator or function
+        Given symmetric matrix, sparse matrix, linear operator or matrix-vector product function. The initial vector is required for a function.
+    x : list (float) (optional)
+        Initial vector.
+    et : float (optional)
+        Threshold of the residual norm of the normalized eigenvector.
+    imax : int (optional)
+        Maximum number of iterations to consider.
+    debug : boolean
+        Option to display steps.
+    trace : Trace (optional)
+        Trace to record the steps.
+    inst : Instrument (optional)
+        Instrument to count the operations by category and time the phases.
+    basis : numpy.ndarray (optional)
+        Orthonormal eigenvectors already obtained as columns, against which the iterates are deflated.
+
+    Returns
+    -------
+    eig_val, eig_vec, ic, msg : float, list (float), int, String
+        The eigenvalue and the eigenvector and the iteration count with status string.
+    """
+
+    # initialize values
+    dim = A.shape[0] if hasattr(A, 'nnz') else len(A) if hasattr(A, '__len__') else len(x)
+    ic = 0                              # iteration counter
+    mat_vec, ops_mv = get_mat_vec(A, dim)
+    x, ops_d = get_deflated(get_initial(dim, x), basis)
+    x /= math.sqrt(x @ x)
+
+    # display
+    if debug:
+        print("Input\n-------")
+        print("Vector x:\t{x}".format(x=x.tolist()))
+
+    # instrument
+    if inst is not None:
+        inst.mark()
+
+    while(True):
+        # Rayleigh quotient and residual
+        A_x = mat_vec(x)
+        eig_val = float(x @ A_x)
+        norm_r = math.sqrt(np.sum((A_x - eig_val*x)**2))
+
+        # record
+        if trace is not None:
+            trace.record("iteration", ic, norm=norm_r)
+
+        # instrument
+        if inst is not None:
+            inst.count("add", ops_mv//2 + 3*dim)
+            inst.count("mul", ops_mv//2 + 3*dim)
+            inst.count("sqrt", 1)
+            inst.count("cmp", 2)
+            inst.lap("check")
+
+        # check residual threshold
+        if norm_r <= et:
+            return eig_val, x.tolist(), ic, 'Eigenvalue and eigenvector obtained'
+
+        # check iteration threshold
+        if ic >= imax:
+            return eig_val, x.tolist(), ic, 'Maximum iterations reached'
+
+        # update vector
+        y, ops_d = get_deflated(A_x, basis)
+        norm_y = math.sqrt(y @ y)
+        if norm_y == 0:
+            return 0.0, x.tolist(), ic, 'Eigenvalue and eigenvector obtained'
+        x = y/norm_y
+
+        # instrument
+        if inst is not None:
+            inst.count("add", ops_d//2 + dim)
+            inst.count("mul", ops_d//2 + dim)
+            inst.count("div", dim)
+            inst.count("sqrt", 1)
+            inst.lap("iterate")
+
+        # update iteration count
+        ic += 1
+
+        # display
+        if debug:
+            print("\nIteration #{ic}\n-------------------".format(ic=ic))
+            print("Eigenvalue:\t{val}".format(val=eig_val))
+            print("Residual:\t{r}".format(r=norm_r))
+
+def get_shifted_factors(A, shift, debug, inst=None):
+    """
+    Obtain the factors of the shifted matrix A - shift*I using LU Decomposition with Partial Pivoting.
+
+    If the shifted matrix is singular, the shift equals an eigenvalue and it is moved by the square root of the machine precision relative to the norm of A until the matrix is not singular, such that the inverse iterations converge to that eigenvalue in a single step.
+
+    Parameters
+    ----------
+    A : numpy.ndarray
+        Given symmetric matrix.
+    shift : float
+        Shift of the matrix.
+    debug : boolean
+        Option to display steps.
+    inst : Instrument (optional)
+        Instrument to count the operations by category and time the phases.
+
+    Returns
+    -------
+    L, U, p, shift, ops : numpy.ndarray, numpy.ndarray, list (int), float, int
+        The lower-triangular and upper-triangular matrices and the row permutation of the shifted matrix, and the shift used with the operation count.
+    """
+
+    # initialize values
+    dim = len(A)                        # dimension of the matrix
+    ops = 0                             # number of operations
+    # perturbation of a shift equal to an eigenvalue
+    delta = math.sqrt(np.finfo(float).eps)*max(np.max(np.abs(A), initial=0), 1)
+
+    while(True):
+        L, U, p, ops_f = get_LU_pivot(A - shift*np.eye(dim), debug, inst=inst)
+        ops += ops_f + dim
+
+        # instrument
+        if inst is not None:
+            inst.count("add", dim)
+            inst.count("cmp", dim)
+
+        if np.all(np.diagonal(U) != 0):
+            return L, U, p, shift, ops
+
+        # move the shift off the eigenvalue
+        shift += delta
+
+def get_eigen_inverse(A, shift=0, x=None, et=1e-6, imax=1000, debug=True, trace=None, inst=None, basis=None, factors=None):
+    """
+    Obtain the eigenvalue nearest to a given shift and its eigenvector of a symmetric matrix A using Shifted Inverse Iteration.
+
+    The matrix A - shift*I is decomposed once by `get_shifted_factors`, unless its factors are given, and each iteration solves with the factors by `get_solution_factors`, hence an iteration costs O(n^2) operations after the O(n^3) decomposition. The iterations converge with the ratio of the distances of the nearest and the second nearest eigenvalues to the shift, and a shift equal to an eigenvalue is moved slightly off it.
+
+    Parameters
+    ----------
+    A : list (list (float)) or numpy.ndarray
+        Given symmetric matrix.
+    shift : float (optional)
+        Shift near the required eigenvalue.
+    x : list (float) (optional)
+        Initial vector.
+    et : float (optional)
+        Threshold of the residual norm of the normalized eigenvector.
+    imax : int (optional)
+        Maximum number of iterations to consider.
+    debug : boolean
+        Option to display steps.
+    trace : Trace (optional)
+        Trace to record the steps.
+    inst : Instrument (optional)
+        Instrument to count the operations by category and time the phases.
+    basis : numpy.ndarray (optional)
+        Orthonormal eigenvectors already obtained as columns, against which the iterates are deflated.
+    factors : tuple (numpy.ndarray, numpy.ndarray, list (int)) (optional)
+        Lower-triangular and upper-triangular matrices and row permutation of A - shift*I obtained by `get_shifted_factors`, reused across calls.
+
+    Returns
+    -------
+    eig_val, eig_vec, ic, msg : float, list (float), int, String
+        The eigenvalue and the eigenvector and the iteration count with status string.
+    """
+
+    # initialize values
+    A = np.array(A, dtype=float)
+    dim = len(A)                        # dimension of the eigenvector
+    ic = 0                              # iteration counter
+    x, ops_d = get_deflated(get_initial(dim, x), basis)
+    x /= math.sqrt(x @ x)
+
+    # display
+    if debug:
+        print("Input\n-------")
+        print("Matrix A:\t{A}".format(A=A.tolist()))
+        print("Shift:\t{shift}".format(shift=shift))
+
+    # instrument
+    if inst is not None:
+        inst.mark()
+
+    # factors of the shifted matrix reused by all iterations
+    if factors is None:
+        L, U, p, shift, ops = get_shifted_factors(A, shift, debug, inst)
+    else:
+        L, U, p = factors
+
+    # instrument
+    if inst is not None:
+        inst.lap("decompose")
+
+    while(True):
+        # Rayleigh quotient and residual
+        A_x = A @ x
+        eig_val = float(x @ A_x)
+        norm_r = math.sqrt(np.sum((A_x - eig_val*x)**2))
+
+        # record
+        if trace is not None:
+            trace.record("iteration", ic, norm=norm_r)
+
+        # instrument
+        if inst is not None:
+            inst.count("add", dim*dim + 3*dim)
+            inst.count("mul", dim*dim + 3*dim)
+            inst.count("sqrt", 1)
+            inst.count("cmp", 2)
+            inst.lap("check")
+
+        # check residual threshold
+        if norm_r <= et:
+            return eig_val, x.tolist(), ic, 'Eigenvalue and eigenvector obtained'
+
+        # check iteration threshold
+        if ic >= imax:
+            return eig_val, x.tolist(), ic, 'Maximum iterations reached'
+
+        # update vector
+        y, ops_s = get_solution_factors(L, U, p, x, False, inst=inst)
+        y, ops_d = get_deflated(y, basis)
+        x = y/math.sqrt(y @ y)
+
+        # instrument
+        if inst is not None:
+            inst.count("add", ops_d//2 + dim)
+            inst.count("mul", ops_d//2 + dim)
+            inst.count("div", dim)
+            inst.count("sqrt", 1)
+            inst.lap("iterate")
+
+        # update iteration count
+        ic += 1
+
+        # display
+        if debug:
+            print("\nIteration #{ic}\n-------------------".format(ic=ic))
+            print("Eigenvalue:\t{val}".format(val=eig_val))
+            print("Residual:\t{r}".format(r=norm_r))
+
+def get_eigen_Rayleigh(A, x=None, et=1e-6, imax=50, debug=True, trace=None, inst=None, basis=None):
+    """
+    Obtain an eigenvalue and its eigenvector of a symmetric matrix A using Rayleigh Quotient Iteration.
+
+    Each iteration is an inverse iteration shifted by the current Rayleigh quotient, hence the matrix A - shift*I is decomposed again by `get_LU_pivot` in every iteration and the iterations converge cubically to the eigenvalue nearest to the Rayleigh quotient of the initial vector.
+
+    Parameters
+    ----------
+    A : list (list (float)) or numpy.ndarray
+        Given symmetric matrix.
+    x : list (float) (optional)
+        Initial vector.
+    et : float (optional)
+        Threshold of the residual norm of the normalized eigenvector.
+    imax : int (optional)
+        Maximum number of iterations to consider.
+    debug : boolean
+        Option to display steps.
+    trace : Trace (optional)
+        Trace to record the steps.
+    inst : Instrument (optional)
+        Instrument to count the operations by category and time the phases.
+    basis : numpy.ndarray (optional)
+        Orthonormal eigenvectors already obtained as columns, against which the iterates are deflated.
+
+    Returns
+    -------
+    eig_val, eig_vec, ic, msg : float, list (float), int, String
+        The eigenvalue and the eigenvector and the iteration count with status string.
+    """
+
+    # initialize values
+    A = np.array(A, dtype=float)
+    dim = len(A)                        # dimension of the eigenvector
+    ic = 0                              # iteration counter
+    x, ops_d = get_deflated(get_initial(dim, x), basis)
+    x /= math.sqrt(x @ x)
+
+    # display
+    if debug:
+        print("Input\n-------")
+        print("Matrix A:\t{A}".format(A=A.tolist()))
+
+    # instrument
+    if inst is not None:
+        inst.mark()
+
+    while(True):
+        # Rayleigh quotient and residual
+        A_x = A @ x
+        eig_val = float(x @ A_x)
+        norm_r = math.sqrt(np.sum((A_x - eig_val*x)**2))
+
+        # record
+        if trace is not None:
+            trace.record("iteration", ic, norm=norm_r)
+
+        # instrument
+        if inst is not None:
+            inst.count("add", dim*dim + 3*dim)
+            inst.count("mul", dim*dim + 3*dim)
+            inst.count("sqrt", 1)
+            inst.count("cmp", 2)
+            inst.lap("check")
+
+        # check residual threshold
+        if norm_r <= et:
+            return eig_val, x.tolist(), ic, 'Eigenvalue and eigenvector obtained'
+
+        # check iteration threshold
+        if ic >= imax:
+            return eig_val, x.tolist(), ic, 'Maximum iterations reached'
+
+        # decompose the matrix shifted by the Rayleigh quotient
+        L, U, p, ops = get_LU_pivot(A - eig_val*np.eye(dim), False, inst=inst)
+
+        # Rayleigh quotient equal to an eigenvalue
+        if np.any(np.diagonal(U) == 0):
+            return eig_val, x.tolist(), ic, 'Eigenvalue and eigenvector obtained'
+
+        # update vector
+        y, ops_s = get_solution_factors(L, U, p, x, False, inst=inst)
+        y, ops_d = get_deflated(y, basis)
+        x = y/math.sqrt(y @ y)
+
+        # instrument
+        if inst is not None:
+            inst.count("add", ops_d//2 + 2*dim)
+            inst.count("mul", ops_d//2 + dim)
+            inst.count("div", dim)
+            inst.count("sqrt", 1)
+            inst.count("cmp", dim)
+            inst.lap("iterate")
+
+        # update iteration count
+        ic += 1
+
+        # display
+        if debug:
+            print("\nIteration #{ic}\n-------------------".format(ic=ic))
+            print("Eigenvalue:\t{val}".format(val=eig_val))
+            print("Residual:\t{r}".format(r=norm_r))
+
+def get_eigens_deflated(A, k, method="power", shift=0, et=1e-6, imax=1000, debug=True, trace=None, inst=None):
+    """
+    Obtain k eigenvalues and eigenvectors of a symmetric matrix A by deflation.
+
+    The eigenpairs are obtained one after the other, and the iterates of each eigenpair are kept orthogonal to the eigenvectors already obtained, hence an iteration costs O(k*n^2) operations instead of the O(n^3) operations of a full diagonalization. The shifted matrix of the inverse iterations is decomposed once for all eigenpairs. Power Iteration obtains the eigenvalues of largest magnitude, Shifted Inverse Iteration the eigenvalues nearest to the shift, and Rayleigh Quotient Iteration k distinct eigenvalues starting from the shifted inverse iterate.
+
+    Parameters
+    ----------
+    A : list (list (float)) or numpy.ndarray or LinearOperator
+        Given symmetric matrix, or sparse matrix or linear operator for Power Iteration.
+    k : int
+        Number of eigenpairs.
+    method : String (optional)
+        Method of each eigenpair, either "power", "inverse" or "rayleigh".
+    shift : float (optional)
+        Shift of the inverse iterations.
+    et : float (optional)
+        Threshold of the residual norm of each normalized eigenvector.
+    imax : int (optional)
+        Maximum number of iterations to consider for each eigenpair.
+    debug : boolean
+        Option to display steps.
+    trace : Trace (optional)
+        Trace to record the steps.
+    inst : Instrument (optional)
+        Instrument to count the operations by category and time the phases.
+
+    Returns
+    -------
+    eig_val, eig_vec, ic, msg : list (float), list (list (float)), int, String
+        The eigenvalues and the eigenvectors and the total iteration count with status string.
+    """
+
+    # initialize values
+    dim = A.shape[0] if hasattr(A, 'nnz') else len(A)
+    ic = 0                              # iteration counter
+    eig_val = []
+    basis = np.zeros((dim, 0))
+
+    # check method
+    if method not in ["power", "inverse", "rayleigh"]:
+        return None, None, ic, 'Method is unknown'
+
+    # factors of the shifted matrix reused by all eigenpairs
+    if method != "power":
+        A = np.array(A, dtype=float)
+        L, U, p, shift, ops = get_shifted_factors(A, shift, debug, inst)
+
+    # for each eigenpair
+    for i in range(min(k, dim)):
+        # initial vector orthogonal to the eigenvectors already obtained
+        x = np.random.default_rng(i).uniform(-1, 1, dim)
+
+        if method == "power":
+            val, vec, ic_i, msg = get_eigen_power(A, x, et, imax, debug, trace, inst, basis)
+        elif method == "inverse":
+            val, vec, ic_i, msg = get_eigen_inverse(A, shift, x, et, imax, debug, trace, inst, basis, (L, U, p))
+        else:
+            val, vec, ic_s, msg = get_eigen_inverse(A, shift, x, 0, 2, debug, trace, inst, basis, (L, U, p))
+            val, vec, ic_i, msg = get_eigen_Rayleigh(A, vec, et, imax, debug, trace, inst, basis)
+            ic += ic_s
+
+        ic += ic_i
+
+        # display
+        if debug:
+            print("\nEigenpair #{i}\n-------------------".format(i=i))
+            print("Eigenvalue:\t{val}".format(val=val))
+
+        if msg == 'Maximum iterations reached':
+            return eig_val + [val], (basis.T.tolist() + [vec]), ic, msg
+
+        # update eigenvectors
+        eig_val.append(val)
+        basis = np.column_stack([basis, vec])
+
+    return eig_val, basis.T.tolist(), ic, 'Eigenvalues and eigenvectors obtained'
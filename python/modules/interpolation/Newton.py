@@ -2,14 +2,14 @@
 # -*- coding: utf-8 -*-
 # Authors: Sampreet Kalita
 # Created: 2019-04-07
-# Updated: 2019-12-22
+# Updated: 2026-10-19
 
 """Module to predict a value at a specified point using a given data-set via Newton Interpolation Formula."""
 
 # dependencies
 import numpy as np
 
-def find_f(X, Y, n, i):
+def find_f(X, Y, n, i, inst=None):
     """
     Find the coefficient values via recursion.
 
@@ -23,6 +23,8 @@ def find_f(X, Y, n, i):
         Number of elements in the functional.
     i : int
         Highest index of the functional elements.
+    inst : Instrument (optional)
+        Instrument to count the operations by category.
 
     Returns
     -------
@@ -31,14 +33,20 @@ def find_f(X, Y, n, i):
     """
     if i==0:
         return Y[0]
+
+    # instrument
+    if inst is not None:
+        inst.count("add", 2)
+        inst.count("div", 1)
+
     if n==2:
         # calculate the final value
         return (Y[i] - Y[i-1]) / (X[i] - X[i-1]) 
     else:
         # forward to next recursion
-        return (find_f(X, Y, n-1, i) - find_f(X, Y, n-1, i-1)) / (X[i] - X[0]) 
+        return (find_f(X, Y, n-1, i, inst) - find_f(X, Y, n-1, i-1, inst)) / (X[i] - X[0]) 
 
-def find_value_with_degree_3(X, Y, x):
+def find_value_with_degree_3(X, Y, x, inst=None):
     """
     Find the interpolated value at a specified point for the given data-set.
 
@@ -50,6 +58,8 @@ def find_value_with_degree_3(X, Y, x):
         List of observations
     x : float
         Point at which value is to be interpolated
+    inst : Instrument (optional)
+        Instrument to count the operations by category.
 
     Returns
     -------
@@ -59,12 +69,12 @@ def find_value_with_degree_3(X, Y, x):
 
     # initialize the values
     dim = len(X)                        # number of observations
-    b = np.zeros(dim, dtype=np.float)   # coefficients as numpy array
+    b = np.zeros(dim, dtype=float)      # coefficients as numpy array
     y = 0                               # the interpolated value
 
     # calculate the coefficients using the recursive function
     for i in range(0, dim):
-        b[i] = find_f(X, Y, i + 1, i)
+        b[i] = find_f(X, Y, i + 1, i, inst)
 
     # find the interpolated value at the given point
     for i in range(0, dim):
@@ -73,4 +83,9 @@ def find_value_with_degree_3(X, Y, x):
             temp_y *= (x - X[j])
         y += temp_y
 
+        # instrument
+        if inst is not None:
+            inst.count("add", i + 1)
+            inst.count("mul", i)
+
     return b.tolist(), y, None
\ No newline at end of file
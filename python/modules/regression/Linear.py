@@ -2,11 +2,11 @@
 # -*- coding: utf-8 -*-
 # Authors: Sampreet Kalita
 # Created: 2019-04-07
-# Updated: 2019-12-22
+# Updated: 2026-10-19
 
 """Module for Linear Regression to get a straight line for given data."""
 
-def get_straight_line_for_data(X, Y):
+def get_straight_line_for_data(X, Y, inst=None):
     """
     Find the straight line equation for given data.
 
@@ -16,6 +16,8 @@ def get_straight_line_for_data(X, Y):
         List of data points.
     Y : list (float)
         List of observations
+    inst : Instrument (optional)
+        Instrument to count the operations by category.
 
     Returns
     -------
@@ -38,4 +40,10 @@ def get_straight_line_for_data(X, Y):
     # calculate y-intercept
     c = (sum_y - m * sum_x) / n
 
+    # instrument
+    if inst is not None:
+        inst.count("add", 4*n + 3)
+        inst.count("mul", 2*n + 5)
+        inst.count("div", 2)
+
     return m, c, None
\ No newline at end of file
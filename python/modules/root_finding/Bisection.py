@@ -6,7 +6,7 @@
 
 """Module to find roots of a univariate function using Bisection Method."""
 
-def find_root_in_interval(fn, xi, xf, et=1e-6):
+def find_root_in_interval(fn, xi, xf, et=1e-6, inst=None):
     """
     Find the (approximate) root of a univariate function in a given interval using Bisection Method.
 
@@ -20,6 +20,8 @@ def find_root_in_interval(fn, xi, xf, et=1e-6):
         Final x-value of the selected interval.
     et : float (optional)
         Relative error threshold.
+    inst : Instrument (optional)
+        Instrument to count the function evaluations.
 
     Returns
     -------
@@ -27,6 +29,10 @@ def find_root_in_interval(fn, xi, xf, et=1e-6):
         The root and the iteration count with status message.
     """
 
+    # instrument
+    if inst is not None:
+        fn = inst.wrap(fn)
+
     # initialize values
     ic = 0
 
@@ -62,7 +68,7 @@ def find_root_in_interval(fn, xi, xf, et=1e-6):
 
     return xi, ic, "Root found"
 
-def find_all_roots(fn, xmin=-1e6, xmax=1e6, step=1e0, et=1e-6):
+def find_all_roots(fn, xmin=-1e6, xmax=1e6, step=1e0, et=1e-6, inst=None):
     """
     Find the (approximate) roots of a univariate function using Bisection Method.
 
@@ -78,6 +84,8 @@ def find_all_roots(fn, xmin=-1e6, xmax=1e6, step=1e0, et=1e-6):
         Step-size for the x-axis interval.
     et : float (optional)
         Relative error threshold.
+    inst : Instrument (optional)
+        Instrument to count the function evaluations.
 
     Returns
     -------
@@ -97,7 +105,7 @@ def find_all_roots(fn, xmin=-1e6, xmax=1e6, step=1e0, et=1e-6):
             break
 
         # search for root in interval
-        root, ii, msg = find_root_in_interval(fn, xi, xf, et)
+        root, ii, msg = find_root_in_interval(fn, xi, xf, et, inst)
         if root != None: 
             roots.append(root)
             ic += ii
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Authors: Sampreet Kalita
+# Created: 2026-10-19
+# Updated: 2026-10-19
+
+"""Module to obtain solutions of a system of linear equations with a symmetric positive definite matrix using Conjugate Gradient Method."""
+
+# dependencies
+import numpy as np
+
+from modules.root_finding.LinearOperator import LinearOperator
+
+def get_mat_vec(A, dim):
+    """
+    Obtain the matrix-vector product function of a given coefficient matrix.
+
+    A product is counted as one multiplication and one addition per non-zero element, hence 2*n^2 operations for a dense matrix, 2*nnz for a sparse matrix, the count of a linear operator, and 2*n for a function as for `LinearOperator`.
+
+    Parameters
+    ----------
+    A : list (list (float)) or numpy.ndarray or LinearOperator or function
+        Given coefficient matrix, sparse matrix (with attribute `nnz`), linear operator or function returning the product A*v for a vector v.
+    dim : int
+        Number of variables.
+
+    Returns
+    -------
+    mat_vec, ops : function, int
+        The matrix-vector product function with the operation count per product.
+    """
+
+    # linear operator
+    if isinstance(A, LinearOperator):
+        return lambda v: np.asarray(A.matvec(v), dtype=float), A.ops
+
+    # matrix-free function
+    if callable(A):
+        return lambda v: np.asarray(A(v), dtype=float), 2*dim
+
+    # sparse matrix
+    if hasattr(A, 'nnz'):
+        return lambda v: A @ v, 2*A.nnz
+
+    # dense matrix
+    A = np.asarray(A, dtype=float)
+    return lambda v: A @ v, 2*dim*dim
+
+def get_solution_basic(A, b, x, imax, et, debug, inst=None):
+    """
+    Obtain the solution for a given system of linear equations represented as A*x = b using Conjugate Gradient Method.
+
+    Parameters
+    ----------
+    A : list (list (float)) or numpy.ndarray or function
+        Given symmetric positive definite coefficient matrix, sparse matrix or matrix-vector product function.
+    b : list (float)
+        Given constant vector.
+    x : list (float)
+        Initial values of the variables.
+    imax : int
+        Maximum number of iterations.
+    et : float
+        Relative residual threshold.
+    debug : boolean
+        Option to display steps.
+    inst : Instrument (optional)
+        Instrument to count the operations by category and time the phases.
+
+    Returns
+    -------
+    sol, ic, ops, msg : list (float), int, int, String
+        The solution, the iteration count and the operation count with status string.
+    """
+
+    # initialize values
+    ops = 0                             # number of operations
+    dim = len(b)                        # number of variables
+    ic = 0                              # iteration counter
+    mat_vec, ops_mv = get_mat_vec(A, dim)
+    b = np.asarray(b, dtype=float)
+    x = np.array(x, dtype=float)
+
+    # display
+    if debug:
+        print("Input\n-------")
+        print("Vector b:\t{B}".format(B=b.tolist()))
+        print("Vector x:\t{x}".format(x=x.tolist()))
+
+    # initial residual and search direction
+    r = b - mat_vec(x)
+    p = r.copy()
+    rr = r @ r
+    norm_b = np.sqrt(b @ b)
+    if norm_b == 0:
+        norm_b = 1
+
+    # update operations
+    ops += ops_mv + 4*dim
+
+    # instrument
+    if inst is not None:
+        inst.count("add", ops_mv//2 + 3*dim)
+        inst.count("mul", ops_mv//2 + 2*dim)
+        inst.count("sqrt", 1)
+        inst.mark()
+
+    while(True):
+        # check residual threshold
+        if np.sqrt(rr) <= et*norm_b:
+            return x.tolist(), ic, ops, "Approx. solution obtained"
+
+        # check iteration threshold
+        if ic >= imax:
+            return x.tolist(), ic, ops, "Maximum iterations reached"
+
+        # step length along search direction
+        Ap = mat_vec(p)
+        pAp = p @ Ap
+        if pAp <= 0:
+            return None, ic, ops, "Matrix is not positive definite"
+        alpha = rr/pAp
+
+        # update solution and residual
+        x += alpha*p
+        r -= alpha*Ap
+        rr_new = r @ r
+
+        # update search direction
+        p = r + rr_new/rr*p
+        rr = rr_new
+
+        # update operations
+        ops += ops_mv + 10*dim
+
+        # instrument
+        if inst is not None:
+            inst.count("add", ops_mv//2 + 5*dim)
+            inst.count("mul", ops_mv//2 + 5*dim)
+            inst.count("div", 2)
+            inst.count("sqrt", 1)
+            inst.count("cmp", 2)
+            inst.lap("iterate")
+
+        # update iteration count
+        ic += 1
+
+        # display
+        if debug:
+            print("\nIteration #{ic}\n-------------------".format(ic=ic))
+            print("Vector x:\t{x}".format(x=x.tolist()))
+            print("Residual:\t{r}".format(r=np.sqrt(rr)))
@@ -6,7 +6,7 @@
 
 """Module to find roots of a function using Fixed Point Method."""
     
-def find_root_uni(g, xi, et=1e-6, imax=1e6):
+def find_root_uni(g, xi, et=1e-6, imax=1e6, inst=None):
     """
     Find the (approximate) root of a given function using Fixed Point Method.
 
@@ -20,6 +20,8 @@ def find_root_uni(g, xi, et=1e-6, imax=1e6):
         Threshold of relative error.
     imax : int (optional)
         Maximum number of iterations to consider.
+    inst : Instrument (optional)
+        Instrument to count the function evaluations.
 
     Returns
     -------
@@ -27,6 +29,10 @@ def find_root_uni(g, xi, et=1e-6, imax=1e6):
         The root and the iteration count with error string.
     """
 
+    # instrument
+    if inst is not None:
+        g = inst.wrap(g)
+
     # initialize values
     ic = 0
 
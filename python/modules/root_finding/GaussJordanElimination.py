@@ -2,16 +2,18 @@
 # -*- coding: utf-8 -*-
 # Authors: Sampreet Kalita
 # Created: 2019-04-07
-# Updated: 2020-01-30
+# Updated: 2026-10-19
 
 """Module to obtain solutions of a system of linear equations using Gauss-Jordan Elimination Method."""
 
 # dependencies
-import numpy as np
+from modules.root_finding.LUDecomposition import get_condition_estimate
 
-def get_solution_basic(A, b, debug):
+def get_solution_basic(A, b, debug, et=1e-12, inst=None, overwrite_a=True, overwrite_b=True, out=None, cond=False):
     """
-    Obtain the solution for a given system of linear equations represented as A*x = b using Gauss-Jordan Elimination Method.
+    Obtain the solution for a given system of linear equations represented as A*x = b using Gauss-Jordan Elimination Method with Partial Pivoting.
+
+    The matrix is reported singular during the elimination when the largest available pivot is below the threshold relative to the infinity-norm of the matrix. The pivots with the multipliers below them and the normalized pivot rows form the Lower-Triangular and the unit Upper-Triangular matrices of A[p], hence if they are kept, the condition number is estimated from them by `LUDecomposition.get_condition_estimate` in O(n^2) operations without a second decomposition.
 
     Parameters
     ----------
@@ -21,41 +23,104 @@ def get_solution_basic(A, b, debug):
         Given constant vector.
     debug : boolean
         Option to display steps.
+    et : float (optional)
+        Relative pivot threshold.
+    inst : Instrument (optional)
+        Instrument to count the operations by category and time the phases.
+    overwrite_a : boolean (optional)
+        Option to reduce the coefficient matrix in place, otherwise a copy is reduced.
+    overwrite_b : boolean (optional)
+        Option to reduce the constant vector in place, otherwise a copy is used.
+    out : list (float) (optional)
+        Buffer of length n to store the solution, used in place of the constant vector which is then left unchanged.
+    cond : boolean (optional)
+        Option to keep the factors of the elimination and to return an estimate of the condition number in 1-norm.
 
     Returns
     -------
     sol, ops, msg : float, int, String
-        The solution and the operation count with status string.
+        The solution and the operation count with status string. If `cond` is enabled, the estimate of the condition number follows the solution, or is infinite if the matrix is singular.
     """
 
     # initialize values
     ops = 0                             # number of operations
     dim = len(b)                        # number of variables
 
+    # copy inputs which are to be preserved, every row of the matrix as a shallow row copy
+    if not overwrite_a:
+        A = [list(row) for row in A]
+    if out is not None:
+        out[:] = b
+        b = out
+    elif not overwrite_b:
+        b = list(b)
+
     # display
     if debug:
         print("Input\n-------")
         print("Matrix A:\t{A}".format(A=A))
         print("Vector b:\t{B}".format(B=b))
 
-    # check if matrix is singular
-    if (np.linalg.det(A) == 0):
-        # display
-        if debug: 
-            print("Determinant is zero")
+    # infinity-norm of the matrix
+    norm = max([sum([abs(ele) for ele in row]) for row in A])
+
+    # update operations
+    ops += dim*dim
+
+    # instrument
+    if inst is not None:
+        inst.count("add", dim*dim)
+
+    # 1-norm of the matrix and factors of the elimination
+    if cond:
+        norm_1 = max([sum([abs(A[i][j]) for i in range(dim)]) for j in range(dim)])
+        L = [[0 for j in range(dim)] for i in range(dim)]
+        U = []
+        ops += dim*dim
+
+        # instrument
+        if inst is not None:
+            inst.count("add", dim*dim)
 
-        return None, ops, "Determinant is zero"
+    # instrument
+    if inst is not None:
+        inst.mark()
 
     # form upper-triangular matrix
     for j in range(dim):
+        # check for largest element
+        index = max(range(j, dim), key=lambda i: abs(A[i][j]))
+
+        # update operations
+        ops += dim - j
+
+        # instrument
+        if inst is not None:
+            inst.count("cmp", dim - j + 1)
+
+        if index != j:
+            # swap rows
+            A[index], A[j] = A[j], A[index]
+            b[index], b[j] = b[j], b[index]
+            if cond:
+                L[index], L[j] = L[j], L[index]
+
+            # instrument
+            if inst is not None:
+                inst.count("mov", 2)
+
+            # display
+            if debug:
+                print("Swapped row #{j} with row #{index}".format(j=j, index=index))
+
         # pivot element
         divisor = A[j][j]
-        if divisor == 0:
+        if abs(divisor) <= et*norm:
             # display
             if debug: 
-                print("Pivot element is zero")
+                print("Martix is singular")
 
-            return None, ops, "Pivot element is zero"
+            return (None, float('inf'), ops, "Martix is singular") if cond else (None, ops, "Martix is singular")
 
         A[j] = [ele/divisor for ele in A[j]]
         b[j] /= divisor
@@ -63,9 +128,20 @@ def get_solution_basic(A, b, debug):
         # update operations 
         ops += dim + 1
 
+        # keep the pivot and the normalized pivot row
+        if cond:
+            L[j][j] = divisor
+            U.append(list(A[j]))
+
+            # instrument
+            if inst is not None:
+                inst.count("mov", dim + 1)
+
         # elimination step
         for i in range(j+1, dim):
             multiplier = A[i][j]
+            if cond:
+                L[i][j] = multiplier
             for k in range(dim):
                 A[i][k] -= A[j][k] * multiplier 
             b[i] -= b[j] * multiplier 
@@ -89,21 +165,40 @@ def get_solution_basic(A, b, debug):
             # update operations 
             ops += dim - j
 
+        # instrument
+        if inst is not None:
+            inst.count("div", dim + 1)
+            inst.count("add", (dim - 1 - j)*(dim + 1) + j*(dim - j + 1))
+            inst.count("mul", (dim - 1 - j)*(dim + 1) + j*(dim - j + 1))
+
         # display
         if debug:
             print("\nReduction step #{j}\n-------------------".format(j=j))
             print("Matrix A:\t{A}".format(A=A))
             print("Vector b:\t{b}".format(b=b))
 
+    # instrument
+    if inst is not None:
+        inst.lap("eliminate")
+
     # display
     if debug:
         print("\nCompleted\n---------\n")
 
+    # estimate of the condition number from the factors of A[p]
+    if cond:
+        est, ops_c = get_condition_estimate(None, L, U, debug, inst, norm_1)
+        ops += ops_c
+
+        return b, est, ops, "Solution obtained"
+
     return b, ops, "Solution obtained"
 
-def get_inverse(A, debug):
+def get_inverse(A, debug, et=1e-12, inst=None, overwrite_a=True, out=None, cond=False):
     """
-    Obatin the inverse of a given matrix.
+    Obatin the inverse of a given matrix using Gauss-Jordan Elimination Method with Partial Pivoting.
+
+    The matrix is reported singular during the elimination when the largest available pivot is below the threshold relative to the infinity-norm of the matrix. The condition number in 1-norm is obtained exactly from the inverse in O(n^2) operations.
 
     Parameters
     ----------
@@ -111,32 +206,101 @@ def get_inverse(A, debug):
         Given matrix.
     debug : boolean
         Option to display steps.
+    et : float (optional)
+        Relative pivot threshold.
+    inst : Instrument (optional)
+        Instrument to count the operations by category and time the phases.
+    overwrite_a : boolean (optional)
+        Option to reduce the given matrix in place, otherwise a copy is reduced.
+    out : list (list (float)) (optional)
+        Buffer of n rows of length n to store the inverse.
+    cond : boolean (optional)
+        Option to return the condition number in 1-norm.
 
     Returns
     -------
     Ainv, ops, msg : float, int, String
-        The inverse and the operation count with status string.
+        The inverse and the operation count with status string. If `cond` is enabled, the condition number follows the inverse, or is infinite if the matrix is singular.
     """
 
     # initialize values
     ops = 0
     size = len(A[0])
-    Ainv = [[1 if i==j else 0 for i in range(size)] for j in range(size)]
 
-    # check if determinant is zero
-    if (np.linalg.det(A) == 0):
-        return None, ops, "Determinant is zero."
+    # copy inputs which are to be preserved, every row of the matrix as a shallow row copy
+    if not overwrite_a:
+        A = [list(row) for row in A]
+
+    # identity matrix to be reduced to the inverse
+    if out is not None:
+        for j in range(size):
+            out[j][:] = [1 if i==j else 0 for i in range(size)]
+        Ainv = out
+    else:
+        Ainv = [[1 if i==j else 0 for i in range(size)] for j in range(size)]
+
+    # infinity-norm of the matrix
+    norm = max([sum([abs(ele) for ele in row]) for row in A])
+
+    # update operations
+    ops += size*size
+
+    # instrument
+    if inst is not None:
+        inst.count("add", size*size)
+
+    # 1-norm of the matrix
+    if cond:
+        norm_1 = max([sum([abs(A[i][j]) for i in range(size)]) for j in range(size)])
+        ops += size*size
+
+        # instrument
+        if inst is not None:
+            inst.count("add", size*size)
+
+    # instrument
+    if inst is not None:
+        inst.mark()
 
     # form upper-triangular matrix
     for j in range(size):
+        # check for largest element
+        index = max(range(j, size), key=lambda i: abs(A[i][j]))
+
+        # update operations
+        ops += size - j
+
+        # instrument
+        if inst is not None:
+            inst.count("cmp", size - j + 1)
+
+        if index != j:
+            # swap rows
+            A[index], A[j] = A[j], A[index]
+            Ainv[index], Ainv[j] = Ainv[j], Ainv[index]
+
+            # instrument
+            if inst is not None:
+                inst.count("mov", 2)
+
+            # display
+            if debug:
+                print("Swapped row #{j} with row #{index}".format(j=j, index=index))
+
         # get divisor
         divisor = A[j][j]
-        if (divisor != 0):
-            A[j] = [ele / divisor for ele in A[j]]
-            Ainv[j] = [ele / divisor for ele in Ainv[j]]
+        if abs(divisor) <= et*norm:
+            # display
+            if debug: 
+                print("Martix is singular")
 
-            # update operations 
-            ops += size + 1
+            return (None, float('inf'), ops, "Martix is singular") if cond else (None, ops, "Martix is singular")
+
+        A[j] = [ele / divisor for ele in A[j]]
+        Ainv[j] = [ele / divisor for ele in Ainv[j]]
+
+        # update operations 
+        ops += size + 1
 
         # elimination step
         for i in range(j+1, size):
@@ -148,12 +312,22 @@ def get_inverse(A, debug):
             # update operations 
             ops += size + 1
 
+        # instrument
+        if inst is not None:
+            inst.count("div", 2*size)
+            inst.count("add", 2*(size - 1 - j)*size)
+            inst.count("mul", 2*(size - 1 - j)*size)
+
         # display
         if debug:
             print("\nElimination step #{j}\n-------------------".format(j=j))
             print("Matrix A:\t{A}".format(A=A))
             print("Matrix A_inv:\t{A_inv}".format(A_inv=Ainv))
 
+    # instrument
+    if inst is not None:
+        inst.lap("eliminate")
+
     # form identity matrix
     for i in range(size):
         for j in range(size - 1 - i + 1, size):
@@ -165,12 +339,33 @@ def get_inverse(A, debug):
             # update operations 
             ops += size + 1
 
+        # instrument
+        if inst is not None:
+            inst.count("add", 2*i*size)
+            inst.count("mul", 2*i*size)
+
         # display
         if debug:
             print("\nReduction step #{i}\n-------------------".format(i=i))
             print("Matrix A:\t{A}".format(A=A))
             print("Matrix A_inv:\t{A_inv}".format(A_inv=Ainv))
 
+    # instrument
+    if inst is not None:
+        inst.lap("reduce")
+
+    # condition number from the 1-norm of the inverse
+    if cond:
+        norm_inv = max([sum([abs(Ainv[i][j]) for i in range(size)]) for j in range(size)])
+        ops += size*size
+
+        # instrument
+        if inst is not None:
+            inst.count("add", size*size)
+            inst.count("mul", 1)
+
+        return Ainv, norm_1*norm_inv, ops, "Inverse obtained"
+
     return Ainv, ops, "Inverse obtained"
 
 
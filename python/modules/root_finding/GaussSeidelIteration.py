@@ -2,33 +2,59 @@
 # -*- coding: utf-8 -*-
 # Authors: Sampreet Kalita
 # Created: 2020-01-30
-# Updated: 2020-01-30
+# Updated: 2026-10-19
 
 """Module to obtain solutions of a system of linear equations using Gauss-Seidel Iteration Method."""
 
 # dependencies
 import math
+import numpy as np
 
-def get_solution_basic(A, b, x, lamb, imax, et, debug):
+from modules.root_finding.JacobiIteration import get_convergence, get_extreme_eigenvalues, get_norm, get_spectral_radius
+from modules.root_finding.LinearOperator import LinearOperator
+
+def get_solution_basic(A, b, x, lamb, imax, et, debug, criterion="change", order=math.inf, interval=1, adapt=0, trace=None, inst=None, overwrite_a=True, overwrite_b=True, out=None, imax_auto=100, et_auto=1e-3):
     """
     Obtain the solution for a given system of linear equations represented as A*x = b using Gauss-Seidel Iteration Method.
 
     Parameters
     ----------
-    A : list
-        Given coefficient matrix.
+    A : list or LinearOperator
+        Given coefficient matrix, or linear operator with row access solved using `get_solution_operator`.
     b : list
         Given constant vector.
     x : list
         Initial values of the variables.
-    lamb: float
-        Value of the weight.
+    lamb: float or String
+        Value of the weight, or "auto" to select the optimal weight of Successive Over-Relaxation from an estimate of the spectral radius of the Jacobi iteration matrix.
     imax : int
         Maximum number of iterations.
     et : float
         Relative error threshold.
     debug : boolean
         Option to display steps.
+    criterion : String (optional)
+        Stopping criterion, either "change" for the relative change of the solution, "residual" for the relative residual ||b - A*x||/||b|| or "both".
+    order : float (optional)
+        Order of the vector norm used by the stopping criterion, either math.inf or 2.
+    interval : int (optional)
+        Number of iterations between checks of the stopping criterion.
+    adapt : int (optional)
+        Number of iterations between re-estimations of the optimal weight from the observed rate of convergence. Zero disables the re-estimation.
+    trace : Trace (optional)
+        Trace to record the steps.
+    inst : Instrument (optional)
+        Instrument to count the operations by category and time the phases.
+    overwrite_a : boolean (optional)
+        Option to divide the rows of the coefficient matrix by their diagonal elements in place, otherwise a copy is divided.
+    overwrite_b : boolean (optional)
+        Option to divide the constant vector by the diagonal elements in place, otherwise a copy is divided.
+    out : list (float) (optional)
+        Buffer of length n to store the solution, initialized with the values of x which are then left unchanged. Otherwise the iterations are performed in x.
+    imax_auto : int (optional)
+        Maximum number of Lanczos iterations of the eigenvalue estimates for the "auto" weight.
+    et_auto : float (optional)
+        Relative error threshold of the eigenvalue estimates for the "auto" weight.
 
     Returns
     -------
@@ -36,11 +62,24 @@ def get_solution_basic(A, b, x, lamb, imax, et, debug):
         The solution and the operation count with status string.
     """
 
+    # matrix-free operator
+    if isinstance(A, LinearOperator):
+        return get_solution_operator(A, b, x, lamb, imax, et, debug, criterion, order, interval, trace, inst, out, imax_auto, et_auto)
+
     # initialize values
     ops = 0                             # number of operations
     dim = len(b)                        # number of variables
     ic = 0                              # iteration counter
 
+    # copy inputs which are to be preserved, every row of the matrix as a shallow row copy
+    if not overwrite_a:
+        A = [list(row) for row in A]
+    if not overwrite_b:
+        b = list(b)
+    if out is not None:
+        out[:] = x
+        x = out
+
     # display
     if debug:
         print("Input\n-------")
@@ -48,6 +87,14 @@ def get_solution_basic(A, b, x, lamb, imax, et, debug):
         print("Vector b:\t{B}".format(B=b))
         print("Vector x:\t{x}".format(x=x))
 
+    # instrument
+    if inst is not None:
+        inst.mark()
+
+    # diagonal elements and norm of the constant vector
+    diag = [A[i][i] for i in range(dim)]
+    norm_b = get_norm(b, order)
+
     # for each row
     for i in range(dim):
         divisor = A[i][i]
@@ -65,6 +112,20 @@ def get_solution_basic(A, b, x, lamb, imax, et, debug):
         # update operations
         ops += dim + 1
 
+        # instrument
+        if inst is not None:
+            inst.count("cmp", 1)
+            inst.count("div", dim + 1)
+
+    # select optimal weight
+    if lamb == "auto":
+        lamb, rho, ic_pred, ops_r = get_relaxation_factor(A, imax_auto, et_auto, et, diag)
+        ops += ops_r
+
+        # display
+        if debug:
+            print("\nSpectral radius:\t{rho}\nWeight:\t{lamb}\nPredicted iterations:\t{ic_pred}".format(rho=rho, lamb=lamb, ic_pred=ic_pred))
+
     # initial iteration
     for i in range(dim):
         temp = b[i]
@@ -76,9 +137,17 @@ def get_solution_basic(A, b, x, lamb, imax, et, debug):
 
     # update operations
     ops += dim - 1
+
+    # instrument
+    if inst is not None:
+        inst.count("add", dim*(dim - 1))
+        inst.count("mul", dim*(dim - 1))
+        inst.lap("setup")
     
     # update iteration count
     ic = 1
+    norm_dx_ref = 0
+    ratio_prev = 0
 
     # display
     if debug:
@@ -86,8 +155,8 @@ def get_solution_basic(A, b, x, lamb, imax, et, debug):
         print("Vector x:\t{x}".format(x=x))
 
     while(True):
-        # flag to check if relative error threshold is reached
-        flag = 1
+        # change in solution
+        dx = []
 
         # for each variable
         for i in range(dim):
@@ -101,31 +170,606 @@ def get_solution_basic(A, b, x, lamb, imax, et, debug):
 
             # update solution with weight
             x[i] = lamb*curr + (1 - lamb)*prev
+            dx.append(x[i] - prev)
 
             # update operations
             ops += dim - 1 + 2
 
-            # check relative error
-            if flag == 1 and x[i] != 0:
-                if abs((x[i] - prev)/x[i]) > et:
-                    flag = 0
+            # instrument
+            if inst is not None:
+                inst.count("add", dim + 1)
+                inst.count("mul", dim + 1)
         
         # update iteration count
         ic += 1
 
+        # re-estimate optimal weight from the rates of convergence observed over both halves of each interval
+        if adapt > 1 and ic % (adapt//2) == 0:
+            norm_dx = get_norm(dx, 2)
+            ratio = (norm_dx/norm_dx_ref)**(1/(adapt//2)) if norm_dx_ref > 0 else 0
+            norm_dx_ref = norm_dx
+
+            # the estimate is valid only below the optimal weight and once the rate has settled
+            if ic % adapt == 0 and lamb - 1 < ratio < 1 and abs(ratio - ratio_prev) <= 1e-2*(1 - ratio):
+                lamb_new, ic_pred = get_relaxation_factor_adaptive(ratio, lamb, et)
+                if lamb_new > lamb:
+                    lamb = lamb_new
+
+                    # display
+                    if debug:
+                        print("\nWeight:\t{lamb}\nPredicted iterations:\t{ic_pred}".format(lamb=lamb, ic_pred=ic_pred))
+            ratio_prev = ratio
+
+        # record
+        if trace is not None:
+            trace.record("iteration", ic, norm=get_norm(dx, math.inf))
+
         # display
         if debug:
             print("\nIteration #{ic}\n-------------------".format(ic=ic))
             print("Vector x:\t{x}".format(x=x))
 
+        # instrument
+        if inst is not None:
+            inst.lap("sweep")
+
         # check iteration threshold
         if ic > imax:
             return x, ops, "Maximum iterations reached"     
 
-        # check flag
-        if flag == 1:
-            return x, ops, "Approx. solution obtained"    
+        # check stopping criterion
+        if ic % interval == 0:
+            flag, ops_c = get_convergence(A, b, x, dx, diag, norm_b, criterion, order, et, inst)
+            ops += ops_c
+
+            # instrument
+            if inst is not None:
+                inst.lap("check")
+
+            if flag:
+                return x, ops, "Approx. solution obtained"
+
+def get_solution_operator(A, b, x, lamb, imax, et, debug, criterion="change", order=math.inf, interval=1, trace=None, inst=None, out=None, imax_auto=100, et_auto=1e-3):
+    """
+    Obtain the solution for a given system of linear equations represented as A*x = b with a matrix-free coefficient matrix using Gauss-Seidel Iteration Method.
+
+    The sweep visits the non-zero elements of each row given by the operator, hence each iteration costs O(nnz) operations and the memory is linear in the number of variables.
+
+    Parameters
+    ----------
+    A : LinearOperator
+        Given coefficient matrix as a linear operator with row access.
+    b : list (float) or numpy.ndarray
+        Given constant vector.
+    x : list (float) or numpy.ndarray
+        Initial values of the variables.
+    lamb: float or String
+        Value of the weight, or "auto" to select the optimal weight of Successive Over-Relaxation from an estimate of the spectral radius of the Jacobi iteration matrix.
+    imax : int
+        Maximum number of iterations.
+    et : float
+        Relative error threshold.
+    debug : boolean
+        Option to display steps.
+    criterion : String (optional)
+        Stopping criterion, either "change" for the relative change of the solution, "residual" for the relative residual ||b - A*x||/||b|| or "both".
+    order : float (optional)
+        Order of the vector norm used by the stopping criterion, either math.inf or 2.
+    interval : int (optional)
+        Number of iterations between checks of the stopping criterion.
+    trace : Trace (optional)
+        Trace to record the steps.
+    inst : Instrument (optional)
+        Instrument to count the operations by category and time the phases.
+    out : numpy.ndarray (optional)
+        Buffer of length n to store the solution, initialized with the values of x.
+    imax_auto : int (optional)
+        Maximum number of Lanczos iterations of the eigenvalue estimates for the "auto" weight.
+    et_auto : float (optional)
+        Relative error threshold of the eigenvalue estimates for the "auto" weight.
+
+    Returns
+    -------
+    sol, ops, msg : numpy.ndarray, int, String
+        The solution and the operation count with status string.
+    """
+
+    # initialize values
+    ops = 0                             # number of operations
+    dim = A.dim                         # number of variables
+    ic = 0                              # iteration counter
+    b = np.asarray(b, dtype=float)
+    if out is not None:
+        out[:] = x
+        x = out
+    else:
+        x = np.array(x, dtype=float)
+
+    # if rows are not available
+    if A.row is None:
+        return None, ops, "Row access is required"
+
+    # display
+    if debug:
+        print("Input\n-------")
+        print("Operator:\t{dim} variables".format(dim=dim))
+
+    # instrument
+    if inst is not None:
+        inst.mark()
+
+    # diagonal elements and norm of the constant vector
+    diag = A.get_diagonal()
+    norm_b = get_norm(b, order)
+
+    # if diagonal element is zero
+    if np.any(diag == 0):
+        return None, ops, "Diagonal element is zero"
+
+    # select optimal weight
+    if lamb == "auto":
+        lamb, rho, ic_pred, ops_r = get_relaxation_factor(A, imax_auto, et_auto, et)
+        ops += ops_r
+
+        # display
+        if debug:
+            print("\nSpectral radius:\t{rho}\nWeight:\t{lamb}\nPredicted iterations:\t{ic_pred}".format(rho=rho, lamb=lamb, ic_pred=ic_pred))
+
+    # instrument
+    if inst is not None:
+        inst.lap("setup")
+
+    while(True):
+        # change in solution
+        dx = np.zeros(dim)
+
+        # for each variable
+        for i in range(dim):
+            indices, values = A.get_row(i)
+
+            # get residual of the row
+            r = b[i] - values @ x[indices]
+
+            # update solution with weight
+            dx[i] = lamb*r/diag[i]
+            x[i] += dx[i]
+
+            # update operations
+            ops += 2*len(indices) + 3
+
+            # instrument
+            if inst is not None:
+                inst.count("add", len(indices) + 1)
+                inst.count("mul", len(indices) + 1)
+                inst.count("div", 1)
+
+        # update iteration count
+        ic += 1
+
+        # record
+        if trace is not None:
+            trace.record("iteration", ic, norm=get_norm(dx, math.inf))
+
+        # display
+        if debug:
+            print("\nIteration #{ic}\n-------------------".format(ic=ic))
+            print("Change:\t{dx}".format(dx=get_norm(dx, math.inf)))
+
+        # instrument
+        if inst is not None:
+            inst.lap("sweep")
+
+        # check iteration threshold
+        if ic > imax:
+            return x, ops, "Maximum iterations reached"
+
+        # check stopping criterion
+        if ic % interval == 0:
+            flag = True
+
+            # relative change of the solution
+            if criterion in ("change", "both"):
+                norm_x = get_norm(x, order)
+                flag = get_norm(dx, order) <= et*(norm_x if norm_x != 0 else 1)
+                ops += 2*dim
+
+            # relative residual
+            if flag and criterion in ("residual", "both"):
+                flag = get_norm(b - A.matvec(x), order) <= et*(norm_b if norm_b != 0 else 1)
+                ops += A.ops + 2*dim
+
+            # instrument
+            if inst is not None:
+                inst.lap("check")
+
+            if flag:
+                return x, ops, "Approx. solution obtained"
+
+def get_relaxation_factor(A, imax, et, et_sol, diag=None):
+    """
+    Obtain the optimal weight of Successive Over-Relaxation for a given coefficient matrix from an estimate of the spectral radius of its Jacobi iteration matrix.
+
+    The weight is optimal for consistently ordered matrices, for example those of stencils in lexicographic or red-black ordering. The spectrum of their Jacobi iteration matrix consists of pairs of opposite sign, hence the spectral radius is taken as the larger magnitude of the extreme eigenvalues from `get_extreme_eigenvalues`, and from Power Iteration only if the iteration matrix is not similar to a symmetric one.
+
+    Parameters
+    ----------
+    A : list (list (float)) or numpy.ndarray or LinearOperator
+        Given coefficient matrix, or the coefficient matrix with rows divided by their diagonal elements.
+    imax : int
+        Maximum number of Lanczos iterations.
+    et : float
+        Relative error threshold of the eigenvalue estimates.
+    et_sol : float
+        Relative error threshold of the solution for the predicted iteration count.
+    diag : list (float) (optional)
+        Diagonal elements of the coefficient matrix if its rows are divided by them.
+
+    Returns
+    -------
+    lamb, rho, ic_pred, ops : float, float, int, int
+        The optimal weight, the spectral radius of the over-relaxed iteration matrix and the predicted iteration count with the operation count.
+    """
+
+    # spectral radius of the Jacobi iteration matrix
+    mu_min, mu_max, err_min, err_max, ops = get_extreme_eigenvalues(A, imax, et, diag)
+    if mu_min is None:
+        rho_J, mu, ops = get_spectral_radius(A, imax, et)
+    else:
+        rho_J = max(abs(mu_min), abs(mu_max))
+    if rho_J >= 1:
+        return 1.0, rho_J**2, math.inf, ops
+
+    # optimal weight and spectral radius of the over-relaxed iteration matrix
+    lamb = 2/(1 + math.sqrt(1 - rho_J**2))
+    rho = lamb - 1
+
+    # predicted iteration count
+    ic_pred = math.ceil(math.log(et_sol)/math.log(rho)) if rho > 0 else 1
+
+    return lamb, rho, ic_pred, ops
+
+def get_relaxation_factor_adaptive(ratio, lamb, et_sol):
+    """
+    Obtain the optimal weight of Successive Over-Relaxation from the observed ratio of successive changes of the solution for the current weight.
+
+    Parameters
+    ----------
+    ratio : float
+        Observed ratio of the norms of successive changes of the solution.
+    lamb : float
+        Current value of the weight.
+    et_sol : float
+        Relative error threshold of the solution for the predicted iteration count.
+
+    Returns
+    -------
+    lamb, ic_pred : float, int
+        The optimal weight and the predicted iteration count.
+    """
+
+    # spectral radius of the Jacobi iteration matrix from the relation of the eigenvalues
+    rho_J_sq = min((ratio + lamb - 1)**2/(ratio*lamb**2), 1 - 1e-12)
 
+    # optimal weight and predicted iteration count
+    lamb = 2/(1 + math.sqrt(1 - rho_J_sq))
+    ic_pred = math.ceil(math.log(et_sol)/math.log(lamb - 1)) if lamb > 1 else 1
 
+    return lamb, ic_pred
+
+def get_colors(A):
+    """
+    Obtain a coloring of the variables such that no two variables of the same color are coupled by the given coefficient matrix using Greedy Coloring.
+
+    For stencil-structured matrices with lexicographic ordering, this yields the red-black (or multicolor) ordering.
+
+    Parameters
+    ----------
+    A : list (list (float)) or numpy.ndarray or LinearOperator
+        Given coefficient matrix, or linear operator with row access of a structurally symmetric matrix.
+
+    Returns
+    -------
+    colors : list (list (int))
+        Indices of the variables in each color class.
+    """
+
+    # initialize values
+    if isinstance(A, LinearOperator):
+        # coupled variables of each row from its non-zero elements
+        get_coupled = lambda i: A.get_row(i)[0]
+    else:
+        A = np.asarray(A)
+        # coupled variables of each row
+        coupled = A != 0
+        coupled = coupled | coupled.T
+        get_coupled = lambda i: coupled[i]
+    dim = len(A)                        # number of variables
+    color = np.full(dim, -1)            # color of each variable
+
+    # for each variable
+    for i in range(dim):
+        # colors already taken by coupled variables
+        taken = set(color[get_coupled(i)].tolist())
+
+        # assign the smallest free color
+        c = 0
+        while c in taken:
+            c += 1
+        color[i] = c
+
+    return [np.flatnonzero(color == c).tolist() for c in range(color.max() + 1)]
+
+def get_solution_multicolor(A, b, x, lamb, imax, et, debug, colors=None, criterion="change", order=math.inf, interval=1, trace=None, inst=None):
+    """
+    Obtain the solution for a given system of linear equations represented as A*x = b using Multicolor Gauss-Seidel Iteration Method.
+
+    The variables of each color class are mutually uncoupled, hence every color class is updated as a single array operation while the result of each sweep equals that of the lexicographic sweep over the reordered variables.
+
+    Parameters
+    ----------
+    A : list (list (float)) or numpy.ndarray or LinearOperator
+        Given coefficient matrix, or linear operator updated by a product per color class.
+    b : list (float)
+        Given constant vector.
+    x : list (float)
+        Initial values of the variables.
+    lamb: float
+        Value of the weight.
+    imax : int
+        Maximum number of iterations.
+    et : float
+        Relative error threshold.
+    debug : boolean
+        Option to display steps.
+    colors : list (list (int)) (optional)
+        Indices of the variables in each color class. If not provided, the coloring is detected using `get_colors`.
+    criterion : String (optional)
+        Stopping criterion, either "change" for the relative change of the solution, "residual" for the relative residual ||b - A*x||/||b|| or "both".
+    order : float (optional)
+        Order of the vector norm used by the stopping criterion, either math.inf or 2.
+    interval : int (optional)
+        Number of iterations between checks of the stopping criterion.
+    trace : Trace (optional)
+        Trace to record the steps.
+    inst : Instrument (optional)
+        Instrument to count the operations by category and time the phases.
+
+    Returns
+    -------
+    sol, ops, msg : list (float), int, String
+        The solution and the operation count with status string.
+    """
+
+    # initialize values
+    ops = 0                             # number of operations
+    dim = len(b)                        # number of variables
+    ic = 0                              # iteration counter
+    operator = isinstance(A, LinearOperator)
+    if not operator:
+        A = np.asarray(A, dtype=float)
+    b = np.asarray(b, dtype=float)
+    x = np.array(x, dtype=float)
+
+    # display
+    if debug:
+        print("Input\n-------")
+        print("Matrix A:\t{A}".format(A="{dim} variables".format(dim=dim) if operator else A.tolist()))
+        print("Vector b:\t{B}".format(B=b.tolist()))
+        print("Vector x:\t{x}".format(x=x.tolist()))
+
+    # instrument
+    if inst is not None:
+        inst.mark()
+
+    # diagonal elements and norm of the constant vector
+    diag = A.get_diagonal() if operator else A.diagonal()
+    norm_b = get_norm(b, order)
+    # matrix-vector product and its operation count
+    mat_vec, ops_mv = (A.matvec, A.ops) if operator else ((lambda v: A @ v), 2*dim*dim)
+
+    # if diagonal element is zero
+    if np.any(diag == 0):
+        return None, ops, "Diagonal element is zero"
+
+    # detect coloring
+    if colors is None:
+        colors = get_colors(A)
+
+    # display
+    if debug:
+        print("Colors:\t{colors}".format(colors=colors))
+
+    # rows, constants and diagonal elements of each color class, or masks for the operator
+    blocks = []
+    masks = []
+    for indices in colors:
+        indices = np.asarray(indices, dtype=int)
+        if operator:
+            mask = np.zeros(dim, dtype=bool)
+            mask[indices] = True
+            masks.append(mask)
+        else:
+            blocks.append((indices, A[indices], b[indices], diag[indices]))
+
+    # instrument
+    if inst is not None:
+        inst.lap("setup")
+
+    while(True):
+        prev = x.copy()
+
+        # update all variables of each color class by a product of the operator
+        if operator:
+            x, ops_s = get_sweep_multicolor(mat_vec, diag, b, x, masks, lamb)
+            ops += ops_s + len(masks)*ops_mv
+
+            # instrument
+            if inst is not None:
+                inst.count("add", len(masks)*(ops_mv//2 + dim) + dim)
+                inst.count("mul", len(masks)*ops_mv//2 + dim)
+                inst.count("div", dim)
+
+        # for each color class
+        else:
+            for indices, A_c, b_c, d_c in blocks:
+                # update all variables of the color class with weight
+                x[indices] += lamb*(b_c - A_c @ x)/d_c
+
+            # update operations
+            ops += 2*dim*(dim + 1) + dim
+
+            # instrument
+            if inst is not None:
+                inst.count("add", dim*(dim + 1))
+                inst.count("mul", dim*(dim + 1))
+                inst.count("div", dim)
+
+        # instrument
+        if inst is not None:
+            inst.count("mov", dim)
+            inst.lap("sweep")
+        
+        # update iteration count
+        ic += 1
+
+        # record
+        if trace is not None:
+            trace.record("iteration", ic, norm=float(np.max(np.abs(x - prev))))
+
+        # display
+        if debug:
+            print("\nIteration #{ic}\n-------------------".format(ic=ic))
+            print("Vector x:\t{x}".format(x=x.tolist()))
+
+        # check iteration threshold
+        if ic > imax:
+            return x.tolist(), ops, "Maximum iterations reached"
+
+        # check stopping criterion
+        if ic % interval == 0:
+            flag = True
+
+            # relative change of the solution
+            if criterion in ("change", "both"):
+                norm_x = get_norm(x, order)
+                flag = get_norm(x - prev, order) <= et*(norm_x if norm_x != 0 else 1)
+                ops += 2*dim
+
+                # instrument
+                if inst is not None:
+                    inst.count("add", dim)
+                    inst.count("cmp", 2*dim + 1)
+
+            # relative residual
+            if flag and criterion in ("residual", "both"):
+                flag = get_norm(b - mat_vec(x), order) <= et*(norm_b if norm_b != 0 else 1)
+                ops += ops_mv + 2*dim
+
+                # instrument
+                if inst is not None:
+                    inst.count("add", ops_mv//2)
+                    inst.count("mul", ops_mv//2)
+                    inst.count("cmp", dim + 1)
+
+            # instrument
+            if inst is not None:
+                inst.lap("check")
+
+            if flag:
+                return x.tolist(), ops, "Approx. solution obtained"
+
+def get_preconditioner_SSOR(A, lamb, debug):
+    """
+    Obtain the Symmetric Successive Over-Relaxation (SSOR) preconditioner of a given coefficient matrix.
+
+    The preconditioned vector is obtained by a forward and a backward Gauss-Seidel sweep with weight starting from zero.
+
+    Parameters
+    ----------
+    A : list (list (float)) or numpy.ndarray
+        Given coefficient matrix.
+    lamb: float
+        Value of the weight, between 0 and 2.
+    debug : boolean
+        Option to display steps.
+
+    Returns
+    -------
+    M, ops, msg : function, int, String
+        The function returning the preconditioned vector for a given vector with the operation count and status string.
+    """
+
+    # initialize values
+    A = np.array(A, dtype=float)
+    dim = len(A)                        # number of variables
+    diag = A.diagonal().copy()
+
+    # if diagonal element is zero
+    if np.any(diag == 0):
+        return None, 0, "Diagonal element is zero"
+
+    # display
+    if debug:
+        print("Weight:\t{lamb}".format(lamb=lamb))
+
+    def M(r):
+        # forward sweep
+        y = np.zeros(dim)
+        for i in range(dim):
+            y[i] = lamb*(r[i] - A[i, :i] @ y[:i])/diag[i]
+
+        # scale by diagonal
+        y *= (2 - lamb)/lamb*diag
+
+        # backward sweep
+        z = np.zeros(dim)
+        for i in range(dim - 1, -1, -1):
+            z[i] = lamb*(y[i] - A[i, i + 1:] @ z[i + 1:])/diag[i]
+
+        return z
+
+    return M, dim, "Preconditioner obtained"
+
+def get_sweep_multicolor(A, diag, b, x, masks, lamb):
+    """
+    Perform a single sweep of the Multicolor Gauss-Seidel Iteration Method for a given system of linear equations represented as A*x = b.
+
+    The sweep is vectorized over each color class and acts on arrays of any shape, hence it serves as a smoother for grid problems.
+
+    Parameters
+    ----------
+    A : numpy.ndarray or function
+        Given coefficient matrix or function returning the product A*x with the shape of x.
+    diag : numpy.ndarray or float
+        Diagonal elements of the coefficient matrix.
+    b : numpy.ndarray
+        Given constant vector.
+    x : numpy.ndarray
+        Current values of the variables, updated in place.
+    masks : list (numpy.ndarray)
+        Boolean masks of the variables in each color class.
+    lamb: float
+        Value of the weight.
+
+    Returns
+    -------
+    x, ops : numpy.ndarray, int
+        The updated values of the variables with the element-wise operation count excluding the matrix-vector products.
+    """
+
+    # initialize values
+    ops = 0                             # number of operations
+    diag = np.broadcast_to(diag, np.shape(x))
+
+    # for each color class
+    for mask in masks:
+        # get residual
+        r = b - (A(x) if callable(A) else A @ x)
+
+        # update all variables of the color class with weight
+        x[mask] += lamb*r[mask]/diag[mask]
+
+        # update operations
+        ops += np.size(x) + 3*int(np.count_nonzero(mask))
 
-            
+    return x, ops
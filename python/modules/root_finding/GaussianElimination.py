@@ -2,11 +2,14 @@
 # -*- coding: utf-8 -*-
 # Authors: Sampreet Kalita
 # Created: 2019-04-07
-# Updated: 2020-01-14
+# Updated: 2026-10-19
 
 """Module to obtain solutions of a system of linear equations using Gaussian Elimination Method."""
 
-def get_solution_basic(A, b, debug):
+# dependencies
+import numpy as np
+
+def get_solution_basic(A, b, debug, trace=None, inst=None, overwrite_a=True, overwrite_b=True, out=None):
     """
     Obtain the solution for a given system of linear equations represented as A*x = b using Upper-Triangular Gaussian Elimination Method.
 
@@ -18,6 +21,16 @@ def get_solution_basic(A, b, debug):
         Given constant vector.
     debug : boolean
         Option to display steps.
+    trace : Trace (optional)
+        Trace to record the steps.
+    inst : Instrument (optional)
+        Instrument to count the operations by category and time the phases.
+    overwrite_a : boolean (optional)
+        Option to reduce the coefficient matrix in place, otherwise a copy is reduced.
+    overwrite_b : boolean (optional)
+        Option to substitute in the constant vector in place, otherwise a copy is used.
+    out : list (float) (optional)
+        Buffer of length n to store the solution, used in place of the constant vector which is then left unchanged.
 
     Returns
     -------
@@ -29,12 +42,25 @@ def get_solution_basic(A, b, debug):
     ops = 0                             # number of operations
     dim = len(b)                        # number of variables
 
+    # copy inputs which are to be preserved, every row of the matrix as a shallow row copy
+    if not overwrite_a:
+        A = [list(row) for row in A]
+    if out is not None:
+        out[:] = b
+        b = out
+    elif not overwrite_b:
+        b = list(b)
+
     # display
     if debug:
         print("Input\n-------")
         print("Matrix A:\t{A}".format(A=A))
         print("Vector b:\t{B}".format(B=b))
 
+    # instrument
+    if inst is not None:
+        inst.mark()
+
     # form upper-triangular matrix
     for j in range(0, dim):
         # pivot element
@@ -56,12 +82,27 @@ def get_solution_basic(A, b, debug):
             # update operations 
             ops += dim
 
+        # record
+        if trace is not None:
+            trace.record("elimination", j, j, j, abs(divisor))
+
+        # instrument
+        if inst is not None:
+            inst.count("cmp", 1)
+            inst.count("add", (dim - 1 - j)*(dim + 1))
+            inst.count("mul", (dim - 1 - j)*(dim + 1))
+            inst.count("div", (dim - 1 - j)*(dim + 1))
+
         # display
         if debug:
             print("\nElimination step #{j}\n-------------------".format(j=j))
             print("Matrix A:\t{A}".format(A=A))
             print("Vector b:\t{b}".format(b=b))
 
+    # instrument
+    if inst is not None:
+        inst.lap("factor")
+
     # obtain solution by reverse substitution
     for i in range(0, dim):
         for j in range(dim - i, dim):
@@ -83,21 +124,38 @@ def get_solution_basic(A, b, debug):
         
         # update operations 
         ops += 1
+
+        # record
+        if trace is not None:
+            trace.record("substitution", i, dim - 1 - i, dim - 1 - i, abs(divisor))
+
+        # instrument
+        if inst is not None:
+            inst.count("cmp", 1)
+            inst.count("add", i)
+            inst.count("mul", i)
+            inst.count("div", 1)
                 
         # display
         if debug:
             print("\nBack substitution step #{i}\n-------------------------".format(i=i))
             print("Vector b:\t{b}".format(b=b))
 
+    # instrument
+    if inst is not None:
+        inst.lap("substitute")
+
     # display
     if debug:
         print("\nCompleted\n---------\n")
 
     return b, ops, "Solution obtained"
 
-def get_solution_pivot(A, B, debug):
+def get_solution_pivot(A, B, debug, trace=None, inst=None, overwrite_a=True, overwrite_b=True, out=None, strategy="scaled"):
     """
-    Obtain the solution for a given system of linear equations represented as A*X = B using Upper-Triangular Gaussian Elimination Method.
+    Obtain the solution for a given system of linear equations represented as A*X = B using Upper-Triangular Gaussian Elimination Method with Pivoting.
+
+    The rows and columns are not moved during the elimination. Instead, the pivots are tracked by permutation vectors, and the scale factors of scaled partial pivoting are obtained once from the given rows.
 
     Parameters
     ----------
@@ -107,6 +165,18 @@ def get_solution_pivot(A, B, debug):
         Given constant vector or matrix.
     debug : boolean
         Option to display steps.
+    trace : Trace (optional)
+        Trace to record the steps.
+    inst : Instrument (optional)
+        Instrument to count the operations by category and time the phases.
+    overwrite_a : boolean (optional)
+        Option to reduce the coefficient matrix in place, otherwise a copy is reduced.
+    overwrite_b : boolean (optional)
+        Option to substitute in the constant matrix in place, otherwise a copy is used. A constant vector is always copied into a matrix.
+    out : list (list (float)) (optional)
+        Buffer of n rows to store the solution.
+    strategy : String (optional)
+        Pivoting strategy, either "partial", "scaled" for scaled partial pivoting, "rook" or "complete". The search costs O(n^2) operations in total for partial and scaled partial pivoting, typically O(n^2) for rook pivoting and O(n^3) for complete pivoting.
 
     Returns
     -------
@@ -117,6 +187,12 @@ def get_solution_pivot(A, B, debug):
     # initialize values
     ops = 0                             # number of operations
     dim_x = len(A)                      # number of variables
+    rows = list(range(dim_x))           # row of each pivot
+    cols = list(range(dim_x))           # column of each pivot
+
+    # copy inputs which are to be preserved, every row of the matrix as a shallow row copy
+    if not overwrite_a:
+        A = [list(row) for row in A]
 
     # if B is a 1D vector, make it a matrix
     if not type(B[0]) == list:         
@@ -124,6 +200,8 @@ def get_solution_pivot(A, B, debug):
 
         # update operations
         ops += dim_x
+    elif not overwrite_b:
+        B = [list(row) for row in B]
 
     dim_n = len(B[0])                   # number of systems
 
@@ -133,62 +211,68 @@ def get_solution_pivot(A, B, debug):
         print("Matrix A:\t{A}".format(A=A))
         print("Matrix B:\t{B}".format(B=B))
 
-    # form upper-triangular matrix
-    for j in range(0, dim_x):
-        # scale elements
-        scales = []
-        for i in range(j, dim_x):
-            maxi_i = max([abs(ele) for ele in A[i]])
+    # instrument
+    if inst is not None:
+        inst.mark()
 
-            # if all elements are zero
-            if maxi_i == 0: 
-                # display
-                if debug: 
-                    print("Martix is singular")
+    # if strategy is unknown
+    if strategy not in ("partial", "scaled", "rook", "complete"):
+        return None, ops, "Pivoting strategy is unknown"
 
-                return None, ops, "Martix is singular"  
-            
-            # update scales
-            scales.append(abs(A[i][j])/maxi_i)
+    # scale factors of the rows
+    scales = None
+    if strategy == "scaled":
+        scales = [max([abs(ele) for ele in row]) for row in A]
+
+        # update operations
+        ops += dim_x*dim_x
+
+        # instrument
+        if inst is not None:
+            inst.count("cmp", dim_x*dim_x)
+
+        # if all elements of a row are zero
+        if 0 in scales:
+            # display
+            if debug: 
+                print("Martix is singular")
+
+            return None, ops, "Martix is singular"
 
-            # update operations
-            ops += dim_x
-        
         # display
         if debug:
             print("Scales:\t{}".format(scales))
 
-        # check for largest element
-        index = j
-        maxi = 0
-        for i in range(0, dim_x - j):
-            if abs(scales[i]) > maxi:
-                index = j + i
-                maxi = scales[i]
+    # form upper-triangular matrix
+    for j in range(0, dim_x):
+        # check for pivot element
+        index_r, index_c, ops_p = get_pivot(A, rows, cols, j, strategy, scales)
+        ops += ops_p
 
-            # update operations
-            ops += 1
-            
-        if index != j:
-            # swap rows of coefficient matrix
-            temp_row = A[index]
-            A[index] = A[j]
-            A[j] = temp_row
+        # instrument
+        if inst is not None:
+            inst.count("cmp", ops_p)
 
-            # swap rows of constant matrix
-            temp_row = B[index]
-            B[index] = B[j]
-            B[j] = temp_row
+        # swap pivots
+        for perm, index, kind in [(rows, index_r, "swap"), (cols, index_c, "swap_column")]:
+            if index != j:
+                perm[index], perm[j] = perm[j], perm[index]
 
-            # display
-            if debug:
-                print("Swapped row #{j} with row #{index}".format(j=j, index=index))
+                # record
+                if trace is not None:
+                    trace.record(kind, j, index, j)
 
-            # update operations
-            ops += 6
+                # instrument
+                if inst is not None:
+                    inst.count("mov", 2)
+
+                # display
+                if debug:
+                    print("Swapped {name} #{j} with {name} #{index}".format(name="row" if kind == "swap" else "column", j=j, index=index))
 
         # pivot element
-        divisor = A[j][j]
+        row_j = A[rows[j]]
+        divisor = row_j[cols[j]]
         if divisor == 0:
             # display
             if debug: 
@@ -196,16 +280,27 @@ def get_solution_pivot(A, B, debug):
 
             return None, ops, "Pivot element is zero"
 
-        # elimination step
+        # elimination step over the remaining columns
         for i in range(j+1, dim_x):
-            multiplier = A[i][j]
-            for k in range(0, dim_x):
-                A[i][k] -= A[j][k] * multiplier / divisor
+            row_i = A[rows[i]]
+            multiplier = row_i[cols[j]]/divisor
+            for k in cols[j:]:
+                row_i[k] -= row_j[k] * multiplier
             for k in range(0, dim_n):
-                B[i][k] -= B[j][k] * multiplier / divisor
+                B[rows[i]][k] -= B[rows[j]][k] * multiplier
                 
             # update operations 
-            ops += dim_x + dim_n
+            ops += dim_x - j + dim_n + 1
+
+        # record
+        if trace is not None:
+            trace.record("elimination", j, rows[j], cols[j], abs(divisor))
+
+        # instrument
+        if inst is not None:
+            inst.count("div", dim_x - 1 - j)
+            inst.count("add", (dim_x - 1 - j)*(dim_x - j + dim_n))
+            inst.count("mul", (dim_x - 1 - j)*(dim_x - j + dim_n))
 
         # display
         if debug:
@@ -213,39 +308,273 @@ def get_solution_pivot(A, B, debug):
             print("Matrix A:\t{A}".format(A=A))
             print("Matrix B:\t{B}".format(B=B))
 
+    # instrument
+    if inst is not None:
+        inst.lap("factor")
+
     # obtain solution by reverse substitution
     for i in range(0, dim_x):
+        row_i = A[rows[dim_x - 1 - i]]
+        sol_i = B[rows[dim_x - 1 - i]]
         for k in range(0, dim_n):
             for j in range(dim_x - i, dim_x):
-                B[dim_x - 1 - i][k] -= A[dim_x - 1 - i][j] * B[j][k]
+                sol_i[k] -= row_i[cols[j]] * B[rows[j]][k]
                 
                 # update operations 
                 ops += 1
             
-            divisor = A[dim_x - 1 - i][dim_x - 1 - i]
-            if divisor == 0:
-                # display
-                if debug: 
-                    print("Martix is singular")
-
-                return None, ops, "Martix is singular"
+            divisor = row_i[cols[dim_x - 1 - i]]
             
             # divide by element
-            B[dim_x - 1 - i][k] /= divisor
+            sol_i[k] /= divisor
             
             # update operations 
             ops += 1
                 
+        # record
+        if trace is not None:
+            trace.record("substitution", i, rows[dim_x - 1 - i], cols[dim_x - 1 - i], abs(divisor))
+
+        # instrument
+        if inst is not None:
+            inst.count("add", i*dim_n)
+            inst.count("mul", i*dim_n)
+            inst.count("div", dim_n)
+
         # display
         if debug:
             print("\nBack substitution step #{i}\n-------------------------".format(i=i))
             print("Matrix B:\t{B}".format(B=B))
 
+    # rows of the solution in the order of the variables
+    sol = [None for i in range(dim_x)]
+    for i in range(dim_x):
+        sol[cols[i]] = B[rows[i]]
+
+    # instrument
+    if inst is not None:
+        inst.count("mov", dim_x)
+        inst.lap("substitute")
+
+    # store solution in buffer
+    if out is not None:
+        for i in range(dim_x):
+            out[i][:] = sol[i]
+        B = out
+    else:
+        B[:] = sol
+
     # display
     if debug:
         print("\nCompleted\n---------\n")
 
     return B, ops, "Solutions obtained"
 
+def get_pivot(A, rows, cols, j, strategy, scales=None):
+    """
+    Obtain the pivot element of a given step of Gaussian Elimination Method from the permutation vectors of the rows and columns.
 
-            
+    Parameters
+    ----------
+    A : list (list (float))
+        Given coefficient matrix, reduced up to the given step.
+    rows : list (int)
+        Row of each pivot.
+    cols : list (int)
+        Column of each pivot.
+    j : int
+        Index of the step.
+    strategy : String
+        Pivoting strategy, either "partial", "scaled" for scaled partial pivoting, "rook" or "complete".
+    scales : list (float) (optional)
+        Scale factors of the rows for scaled partial pivoting.
+
+    Returns
+    -------
+    index_r, index_c, ops : int, int, int
+        The positions of the pivot in the row and column permutation vectors with the number of comparisons.
+    """
+
+    # initialize values
+    dim = len(rows)                     # number of variables
+    ops = 0                             # number of comparisons
+
+    # largest element of a column among the remaining rows
+    def get_max_col(c, weights=None):
+        return max(range(j, dim), key=lambda i: abs(A[rows[i]][cols[c]])/(1 if weights is None else weights[rows[i]]))
+
+    # largest element of a row among the remaining columns
+    def get_max_row(r):
+        return max(range(j, dim), key=lambda k: abs(A[rows[r]][cols[k]]))
+
+    # partial pivoting
+    if strategy == "partial" or strategy == "scaled":
+        return get_max_col(j, scales), j, dim - j
+
+    # rook pivoting alternates between the columns and rows till the element is largest in both
+    if strategy == "rook":
+        index_r, index_c = get_max_col(j), j
+        ops += dim - j
+        while True:
+            index_c_new = get_max_row(index_r)
+            ops += dim - j
+            if abs(A[rows[index_r]][cols[index_c_new]]) <= abs(A[rows[index_r]][cols[index_c]]):
+                return index_r, index_c, ops
+            index_c = index_c_new
+
+            index_r_new = get_max_col(index_c)
+            ops += dim - j
+            if abs(A[rows[index_r_new]][cols[index_c]]) <= abs(A[rows[index_r]][cols[index_c]]):
+                return index_r, index_c, ops
+            index_r = index_r_new
+
+    # complete pivoting
+    index_r, index_c = max(((i, k) for i in range(j, dim) for k in range(j, dim)), key=lambda ik: abs(A[rows[ik[0]]][cols[ik[1]]]))
+
+    return index_r, index_c, (dim - j)**2
+
+def get_solution_batched(A, B, debug, et=1e-12, trace=None, inst=None, overwrite_a=False, overwrite_b=False, out=None):
+    """
+    Obtain the solutions for a batch of independent systems of linear equations represented as A[l]*X[l] = B[l] using Upper-Triangular Gaussian Elimination Method with Partial Pivoting.
+
+    Each step of the elimination is vectorized across the batch while the pivot rows are chosen for each system separately.
+
+    Parameters
+    ----------
+    A : list or numpy.ndarray
+        Given coefficient matrices of shape (batch, n, n).
+    B : list or numpy.ndarray
+        Given constant vectors of shape (batch, n) or matrices of shape (batch, n, k).
+    debug : boolean
+        Option to display steps.
+    et : float (optional)
+        Relative pivot threshold below which a system is flagged singular.
+    trace : Trace (optional)
+        Trace to record the steps.
+    inst : Instrument (optional)
+        Instrument to count the operations by category and time the phases.
+    overwrite_a : boolean (optional)
+        Option to reduce the coefficient matrices in place if given as a float array, otherwise a copy is reduced.
+    overwrite_b : boolean (optional)
+        Option to substitute in the constant vectors or matrices in place if given as a float array, otherwise a copy is used.
+    out : numpy.ndarray (optional)
+        Buffer of the shape of B to store the solutions.
+
+    Returns
+    -------
+    sol, flags, ops, msg : numpy.ndarray, numpy.ndarray, int, String
+        The solutions with the shape of B (NaN for singular systems) and the singularity flags of the systems along with the operation count and status string.
+    """
+
+    # initialize values
+    ops = 0                             # number of operations
+    A = np.asarray(A, dtype=float) if overwrite_a else np.array(A, dtype=float)
+    B = np.asarray(B, dtype=float) if overwrite_b else np.array(B, dtype=float)
+    is_vector = B.ndim == 2
+    # if B is a batch of vectors, make it a batch of matrices
+    if is_vector:
+        B = B[:, :, np.newaxis]
+    batch, dim_x, _ = A.shape           # number of systems and variables
+    dim_n = B.shape[2]                  # number of right-hand sides
+    rows = np.arange(batch)             # index of each system
+    flags = np.zeros(batch, dtype=bool) # singularity flags
+
+    # infinity-norm of each matrix
+    norms = np.max(np.sum(np.abs(A), axis=2), axis=1)
+
+    # display
+    if debug:
+        print("Input\n-------")
+        print("Matrices A:\t{A}".format(A=A.shape))
+        print("Matrices B:\t{B}".format(B=B.shape))
+
+    # instrument
+    if inst is not None:
+        inst.mark()
+
+    # form upper-triangular matrices
+    for j in range(dim_x):
+        # check for largest element in each system
+        index = j + np.argmax(np.abs(A[:, j:, j]), axis=1)
+
+        # swap rows
+        A[rows, j], A[rows, index] = A[rows, index], A[rows, j].copy()
+        B[rows, j], B[rows, index] = B[rows, index], B[rows, j].copy()
+
+        # flag systems with negligible pivot elements
+        divisor = A[:, j, j].copy()
+        small = np.abs(divisor) <= et*norms
+        flags |= small
+        divisor[small] = 1
+
+        # elimination step
+        multiplier = A[:, j + 1:, j]/divisor[:, np.newaxis]
+        A[:, j + 1:, j:] -= multiplier[:, :, np.newaxis]*A[:, np.newaxis, j, j:]
+        B[:, j + 1:] -= multiplier[:, :, np.newaxis]*B[:, np.newaxis, j]
+
+        # update operations
+        ops += batch*(dim_x - j - 1)*(2*(dim_x - j) + 2*dim_n + 1)
+
+        # record
+        if trace is not None:
+            trace.record("elimination", j, j, j, float(np.min(np.abs(divisor))))
+
+        # instrument
+        if inst is not None:
+            inst.count("cmp", batch*(dim_x - j + 1))
+            inst.count("mov", batch*2*(dim_x + dim_n))
+            inst.count("div", batch*(dim_x - j - 1))
+            inst.count("add", batch*(dim_x - j - 1)*(dim_x - j + dim_n))
+            inst.count("mul", batch*(dim_x - j - 1)*(dim_x - j + dim_n))
+
+        # display
+        if debug:
+            print("\nElimination step #{j}\n-------------------".format(j=j))
+            print("Singular systems:\t{n}".format(n=int(flags.sum())))
+
+    # set diagonal of singular systems to avoid division by zero
+    diag = A[:, np.arange(dim_x), np.arange(dim_x)]
+    diag[flags] = 1
+
+    # instrument
+    if inst is not None:
+        inst.lap("factor")
+
+    # obtain solutions by reverse substitution
+    for i in range(dim_x - 1, -1, -1):
+        B[:, i] -= np.einsum('lj,ljk->lk', A[:, i, i + 1:], B[:, i + 1:])
+        B[:, i] /= diag[:, i, np.newaxis]
+
+        # update operations
+        ops += batch*dim_n*(2*(dim_x - 1 - i) + 1)
+
+        # instrument
+        if inst is not None:
+            inst.count("add", batch*dim_n*(dim_x - 1 - i))
+            inst.count("mul", batch*dim_n*(dim_x - 1 - i))
+            inst.count("div", batch*dim_n)
+
+    # mark solutions of singular systems
+    B[flags] = np.nan
+
+    # instrument
+    if inst is not None:
+        inst.lap("substitute")
+
+    # if B is a batch of vectors, return vectors
+    if is_vector:
+        B = B[:, :, 0]
+
+    # store solutions in buffer
+    if out is not None:
+        out[...] = B
+        B = out
+
+    # display
+    if debug:
+        print("\nCompleted\n---------\n")
+
+    if np.any(flags):
+        return B, flags, ops, "Solutions obtained with singular systems"
+
+    return B, flags, ops, "Solutions obtained"
@@ -2,33 +2,56 @@
 # -*- coding: utf-8 -*-
 # Authors: Sampreet Kalita
 # Created: 2020-01-30
-# Updated: 2020-01-30
+# Updated: 2026-10-19
 
 """Module to obtain solutions of a system of linear equations using Jacobi Iteration Method."""
 
 # dependencies
 import math
+import numpy as np
 
-def get_solution_basic(A, b, x, lamb, imax, et, debug):
+from modules.root_finding.LinearOperator import LinearOperator
+
+def get_solution_basic(A, b, x, lamb, imax, et, debug, criterion="change", order=math.inf, interval=1, trace=None, inst=None, overwrite_a=True, overwrite_b=True, out=None, imax_auto=100, et_auto=1e-3):
     """
     Obtain the solution for a given system of linear equations represented as A*x = b using Jacobi Iteration Method.
 
     Parameters
     ----------
-    A : list
-        Given coefficient matrix.
+    A : list or LinearOperator
+        Given coefficient matrix, or linear operator solved using `get_solution_operator`.
     b : list
         Given constant vector.
     x : list
         Initial values of the variables.
-    lamb: float
-        Value of the weight.
+    lamb: float or String
+        Value of the weight, or "auto" to select the optimal weight from an estimate of the spectral radius of the Jacobi iteration matrix.
     imax : int
         Maximum number of iterations.
     et : float
         Relative error threshold.
     debug : boolean
         Option to display steps.
+    criterion : String (optional)
+        Stopping criterion, either "change" for the relative change of the solution, "residual" for the relative residual ||b - A*x||/||b|| or "both".
+    order : float (optional)
+        Order of the vector norm used by the stopping criterion, either math.inf or 2.
+    interval : int (optional)
+        Number of iterations between checks of the stopping criterion.
+    trace : Trace (optional)
+        Trace to record the steps.
+    inst : Instrument (optional)
+        Instrument to count the operations by category and time the phases.
+    overwrite_a : boolean (optional)
+        Option to divide the rows of the coefficient matrix by their diagonal elements in place, otherwise a copy is divided.
+    overwrite_b : boolean (optional)
+        Option to divide the constant vector by the diagonal elements in place, otherwise a copy is divided.
+    out : list (float) (optional)
+        Buffer of length n to store the solution, initialized with the values of x which are then left unchanged.
+    imax_auto : int (optional)
+        Maximum number of Lanczos iterations of the eigenvalue estimates for the "auto" weight.
+    et_auto : float (optional)
+        Relative error threshold of the eigenvalue estimates for the "auto" weight.
 
     Returns
     -------
@@ -36,11 +59,26 @@ def get_solution_basic(A, b, x, lamb, imax, et, debug):
         The solution and the operation count with status string.
     """
 
+    # matrix-free operator
+    if isinstance(A, LinearOperator):
+        return get_solution_operator(A, b, x, lamb, imax, et, debug, criterion, order, interval, trace, inst, out, imax_auto, et_auto)
+
     # initialize values
     ops = 0                             # number of operations
     dim = len(b)                        # number of variables
     ic = 0                              # iteration counter
 
+    # copy inputs which are to be preserved, every row of the matrix as a shallow row copy
+    if not overwrite_a:
+        A = [list(row) for row in A]
+    if not overwrite_b:
+        b = list(b)
+    if out is not None:
+        out[:] = x
+        x = out
+    else:
+        x = list(x)
+
     # display
     if debug:
         print("Input\n-------")
@@ -48,6 +86,14 @@ def get_solution_basic(A, b, x, lamb, imax, et, debug):
         print("Vector b:\t{B}".format(B=b))
         print("Vector x:\t{x}".format(x=x))
 
+    # instrument
+    if inst is not None:
+        inst.mark()
+
+    # diagonal elements and norm of the constant vector
+    diag = [A[i][i] for i in range(dim)]
+    norm_b = get_norm(b, order)
+
     # for each row
     for i in range(dim):
         divisor = A[i][i]
@@ -65,6 +111,20 @@ def get_solution_basic(A, b, x, lamb, imax, et, debug):
         # update operations
         ops += dim + 1
 
+        # instrument
+        if inst is not None:
+            inst.count("cmp", 1)
+            inst.count("div", dim + 1)
+
+    # select optimal weight
+    if lamb == "auto":
+        lamb, rho, ic_pred, ops_r = get_relaxation_factor(A, imax_auto, et_auto, et, diag)
+        ops += ops_r
+
+        # display
+        if debug:
+            print("\nSpectral radius:\t{rho}\nWeight:\t{lamb}\nPredicted iterations:\t{ic_pred}".format(rho=rho, lamb=lamb, ic_pred=ic_pred))
+
     # initial iteration
     x_new = []
     # for each variable
@@ -76,9 +136,15 @@ def get_solution_basic(A, b, x, lamb, imax, et, debug):
         x_new.append(temp)
     
     # update solution
-    x = x_new
+    x[:] = x_new
     # update operations
     ops += dim - 1
+
+    # instrument
+    if inst is not None:
+        inst.count("add", dim*(dim - 1))
+        inst.count("mul", dim*(dim - 1))
+        inst.lap("setup")
     
     # update iteration count
     ic = 1
@@ -89,9 +155,6 @@ def get_solution_basic(A, b, x, lamb, imax, et, debug):
         print("Vector x:\t{x}".format(x=x))
 
     while(True):
-        # flag to check if relative error threshold is reached
-        flag = 1
-
         x_new = []
         # for each variable
         for i in range(dim):
@@ -107,30 +170,543 @@ def get_solution_basic(A, b, x, lamb, imax, et, debug):
             # update operations
             ops += dim - 1 + 2
 
-            # check relative error
-            if flag == 1 and x_new[i] != 0:
-                if abs((x_new[i] - x[i])/x_new[i]) > et:
-                    flag = 0
+            # instrument
+            if inst is not None:
+                inst.count("add", dim + 1)
+                inst.count("mul", dim + 1)
+
+        # change in solution
+        dx = [x_new[i] - x[i] for i in range(dim)]
         
         # update solution
-        x = x_new
+        x[:] = x_new
 
         # update iteration count
         ic += 1
 
+        # record
+        if trace is not None:
+            trace.record("iteration", ic, norm=get_norm(dx, math.inf))
+
         # display
         if debug:
             print("\nIteration #{ic}\n-------------------".format(ic=ic))
             print("Vector x:\t{x}".format(x=x))
 
+        # instrument
+        if inst is not None:
+            inst.lap("sweep")
+
         # check iteration threshold
         if ic > imax:
             return x, ops, "Maximum iterations reached"     
 
-        # check flag
-        if flag == 1:
-            return x, ops, "Approx. solution obtained"    
+        # check stopping criterion
+        if ic % interval == 0:
+            flag, ops_c = get_convergence(A, b, x, dx, diag, norm_b, criterion, order, et, inst)
+            ops += ops_c
+
+            # instrument
+            if inst is not None:
+                inst.lap("check")
+
+            if flag:
+                return x, ops, "Approx. solution obtained"
+
+def get_solution_operator(A, b, x, lamb, imax, et, debug, criterion="change", order=math.inf, interval=1, trace=None, inst=None, out=None, imax_auto=100, et_auto=1e-3):
+    """
+    Obtain the solution for a given system of linear equations represented as A*x = b with a matrix-free coefficient matrix using Jacobi Iteration Method.
+
+    Each iteration costs a single product with the operator and O(n) vector operations, hence the memory is linear in the number of variables.
+
+    Parameters
+    ----------
+    A : LinearOperator
+        Given coefficient matrix as a linear operator.
+    b : list (float) or numpy.ndarray
+        Given constant vector.
+    x : list (float) or numpy.ndarray
+        Initial values of the variables.
+    lamb: float or String
+        Value of the weight, or "auto" to select the optimal weight from an estimate of the spectral radius of the Jacobi iteration matrix.
+    imax : int
+        Maximum number of iterations.
+    et : float
+        Relative error threshold.
+    debug : boolean
+        Option to display steps.
+    criterion : String (optional)
+        Stopping criterion, either "change" for the relative change of the solution, "residual" for the relative residual ||b - A*x||/||b|| or "both".
+    order : float (optional)
+        Order of the vector norm used by the stopping criterion, either math.inf or 2.
+    interval : int (optional)
+        Number of iterations between checks of the stopping criterion.
+    trace : Trace (optional)
+        Trace to record the steps.
+    inst : Instrument (optional)
+        Instrument to count the operations by category and time the phases.
+    out : numpy.ndarray (optional)
+        Buffer of length n to store the solution, initialized with the values of x.
+    imax_auto : int (optional)
+        Maximum number of Lanczos iterations of the eigenvalue estimates for the "auto" weight.
+    et_auto : float (optional)
+        Relative error threshold of the eigenvalue estimates for the "auto" weight.
+
+    Returns
+    -------
+    sol, ops, msg : numpy.ndarray, int, String
+        The solution and the operation count with status string.
+    """
+
+    # initialize values
+    ops = 0                             # number of operations
+    dim = A.dim                         # number of variables
+    ic = 0                              # iteration counter
+    b = np.asarray(b, dtype=float)
+    if out is not None:
+        out[:] = x
+        x = out
+    else:
+        x = np.array(x, dtype=float)
+
+    # display
+    if debug:
+        print("Input\n-------")
+        print("Operator:\t{dim} variables".format(dim=dim))
+
+    # instrument
+    if inst is not None:
+        inst.mark()
+
+    # diagonal elements and norm of the constant vector
+    diag = A.get_diagonal()
+    norm_b = get_norm(b, order)
+
+    # if diagonal element is zero
+    if np.any(diag == 0):
+        return None, ops, "Diagonal element is zero"
+
+    # select optimal weight
+    if lamb == "auto":
+        lamb, rho, ic_pred, ops_r = get_relaxation_factor(A, imax_auto, et_auto, et)
+        ops += ops_r
+
+        # display
+        if debug:
+            print("\nSpectral radius:\t{rho}\nWeight:\t{lamb}\nPredicted iterations:\t{ic_pred}".format(rho=rho, lamb=lamb, ic_pred=ic_pred))
+
+    # instrument
+    if inst is not None:
+        inst.lap("setup")
+
+    while(True):
+        # update solution with weight
+        dx = lamb*(b - A.matvec(x))/diag
+        x += dx
+
+        # update operations
+        ops += A.ops + 4*dim
+
+        # update iteration count
+        ic += 1
+
+        # record
+        if trace is not None:
+            trace.record("iteration", ic, norm=get_norm(dx, math.inf))
+
+        # instrument
+        if inst is not None:
+            inst.count("add", A.ops//2 + 2*dim)
+            inst.count("mul", A.ops//2 + dim)
+            inst.count("div", dim)
+            inst.lap("sweep")
+
+        # display
+        if debug:
+            print("\nIteration #{ic}\n-------------------".format(ic=ic))
+            print("Change:\t{dx}".format(dx=get_norm(dx, math.inf)))
+
+        # check iteration threshold
+        if ic > imax:
+            return x, ops, "Maximum iterations reached"
+
+        # check stopping criterion
+        if ic % interval == 0:
+            flag = True
+
+            # relative change of the solution
+            if criterion in ("change", "both"):
+                norm_x = get_norm(x, order)
+                flag = get_norm(dx, order) <= et*(norm_x if norm_x != 0 else 1)
+                ops += 2*dim
+
+            # relative residual
+            if flag and criterion in ("residual", "both"):
+                flag = get_norm(b - A.matvec(x), order) <= et*(norm_b if norm_b != 0 else 1)
+                ops += A.ops + 2*dim
+
+            # instrument
+            if inst is not None:
+                inst.lap("check")
+
+            if flag:
+                return x, ops, "Approx. solution obtained"
+
+def get_spectral_radius(A, imax, et, shift=0):
+    """
+    Obtain an estimate of the spectral radius of the (shifted) Jacobi iteration matrix I - inv(D)*A - shift*I of a given coefficient matrix using Power Iteration Method.
+
+    Parameters
+    ----------
+    A : list (list (float)) or numpy.ndarray or LinearOperator
+        Given coefficient matrix.
+    imax : int
+        Maximum number of iterations.
+    et : float
+        Relative error threshold of the estimate.
+    shift : float (optional)
+        Shift of the iteration matrix.
+
+    Returns
+    -------
+    rho, mu, ops : float, float, int
+        The estimate of the spectral radius and of the corresponding eigenvalue with the operation count.
+    """
+
+    # initialize values
+    if isinstance(A, LinearOperator):
+        mat_vec, ops_mv = A.matvec, A.ops
+        diag = A.get_diagonal()
+    else:
+        A = np.asarray(A, dtype=float)
+        mat_vec, ops_mv = (lambda v: A @ v), 2*A.size
+        diag = A.diagonal()
+    dim = len(A)                        # number of variables
+    # deterministic starting vector with components along all eigenvectors
+    v = np.cos(np.arange(1, dim + 1)) + 1.5
+    v /= np.sqrt(v @ v)
+    rho = mu = 0
+
+    # iterate until error threshold or max number of iterations is reached
+    for ic in range(int(imax)):
+        w = v - mat_vec(v)/diag - shift*v
+        rho_new = np.sqrt(w @ w)
+        mu = v @ w
+        if rho_new == 0:
+            return 0.0, 0.0, (ic + 1)*(ops_mv + 5*dim)
+        v = w/rho_new
+
+        # check relative error
+        if abs(rho_new - rho) <= et*rho_new:
+            return rho_new, mu, (ic + 1)*(ops_mv + 5*dim)
+        rho = rho_new
+
+    return rho, mu, int(imax)*(ops_mv + 5*dim)
+
+def get_extreme_eigenvalues(A, imax, et, diag=None):
+    """
+    Obtain estimates of the smallest and largest eigenvalues of the Jacobi iteration matrix I - inv(D)*A of a given symmetric coefficient matrix using Lanczos Method with full reorthogonalization.
+
+    The iteration matrix is similar to the symmetric matrix sqrt(|D|)*(I - inv(D)*A)*inv(sqrt(|D|)) if the diagonal elements have the same sign, hence the Ritz values of the Lanczos iterations approach both ends of its real spectrum, including a pair of eigenvalues of opposite sign and equal magnitude for which Power Iteration does not converge to either.
+
+    Parameters
+    ----------
+    A : list (list (float)) or numpy.ndarray or LinearOperator
+        Given coefficient matrix, or the coefficient matrix with rows divided by their diagonal elements.
+    imax : int
+        Maximum number of Lanczos iterations.
+    et : float
+        Threshold of the residual norms of the extreme Ritz pairs relative to the largest Ritz value magnitude.
+    diag : list (float) (optional)
+        Diagonal elements of the coefficient matrix if its rows are divided by them.
+
+    Returns
+    -------
+    mu_min, mu_max, err_min, err_max, ops : float, float, float, float, int
+        The estimates of the smallest and the largest eigenvalues and their error bounds with the operation count, or None for the estimates if the diagonal elements differ in sign.
+    """
+
+    # initialize values
+    if isinstance(A, LinearOperator):
+        mat_vec, ops_mv = A.matvec, A.ops
+        diag_A = A.get_diagonal()
+    else:
+        A = np.asarray(A, dtype=float)
+        mat_vec, ops_mv = (lambda v: A @ v), 2*A.size
+        diag_A = A.diagonal()
+    diag = diag_A if diag is None else np.asarray(diag, dtype=float)
+    dim = len(A)                        # number of variables
+    ops = 0                             # number of operations
+
+    # check signs of the diagonal elements
+    if not (np.all(diag > 0) or np.all(diag < 0)):
+        return None, None, math.inf, math.inf, ops
+
+    # weights of the similarity transformation
+    weights = np.sqrt(np.abs(diag))
+    m = max(min(int(imax), dim), 1)     # number of Lanczos iterations
+    V = np.zeros((dim, m))
+    alphas = []
+    betas = []
+    # deterministic starting vector with components along all eigenvectors
+    v = np.cos(np.arange(1, dim + 1)) + 1.5
+    v /= np.sqrt(v @ v)
+
+    # for each Lanczos iteration
+    for j in range(m):
+        V[:, j] = v
+        u = v/weights
+        w = weights*(u - mat_vec(u)/diag_A)
+        alphas.append(float(v @ w))
+
+        # orthogonalize twice against the basis
+        for i in range(2):
+            w -= V[:, :j + 1] @ (V[:, :j + 1].T @ w)
+        beta = math.sqrt(w @ w)
+
+        # update operations
+        ops += ops_mv + (8*(j + 1) + 8)*dim
+
+        # invariant subspace or last iteration
+        if beta <= 1e-14*max(abs(alphas[-1]), 1) or j == m - 1:
+            break
+
+        # check residual norms of the extreme Ritz pairs
+        if (j + 1)%10 == 0:
+            mu, err = get_Ritz_values(alphas, betas, beta)
+            if max(err[0], err[-1]) <= et*max(abs(mu[0]), abs(mu[-1])):
+                break
+
+        betas.append(beta)
+        v = w/beta
+
+    # extreme Ritz values with the residual norms as error bounds
+    mu, err = get_Ritz_values(alphas, betas, beta)
+
+    return mu[0], mu[-1], err[0], err[-1], ops
+
+def get_Ritz_values(alphas, betas, beta):
+    """
+    Obtain the Ritz values of a Lanczos iteration in ascending order with the residual norms of the Ritz pairs.
+
+    Parameters
+    ----------
+    alphas : list (float)
+        Diagonal elements of the tridiagonal matrix.
+    betas : list (float)
+        Off-diagonal elements of the tridiagonal matrix.
+    beta : float
+        Norm of the residual vector of the last iteration.
+
+    Returns
+    -------
+    mu, err : list (float), list (float)
+        The Ritz values and the residual norms of the Ritz pairs.
+    """
+
+    # tridiagonal matrix
+    T = np.diag(alphas) + np.diag(betas, 1) + np.diag(betas, -1)
+
+    # Ritz values in ascending order and vectors as columns
+    mu, Y = np.linalg.eigh(T)
+
+    return mu.tolist(), np.abs(beta*Y[-1]).tolist()
+
+def get_relaxation_factor(A, imax, et, et_sol, diag=None):
+    """
+    Obtain the optimal weight of the Weighted Jacobi Iteration Method for a given symmetric coefficient matrix from the extreme eigenvalues of its Jacobi iteration matrix.
+
+    The weight centres the interval of the estimates widened by their error bounds. If the estimates are symmetric about zero within their error bounds and the relative error threshold, the weight is one, since for a spectrum of eigenvalues of opposite sign and equal magnitude any other weight does not converge.
+
+    Parameters
+    ----------
+    A : list (list (float)) or numpy.ndarray or LinearOperator
+        Given coefficient matrix, or the coefficient matrix with rows divided by their diagonal elements.
+    imax : int
+        Maximum number of Lanczos iterations.
+    et : float
+        Relative error threshold of the eigenvalue estimates.
+    et_sol : float
+        Relative error threshold of the solution for the predicted iteration count.
+    diag : list (float) (optional)
+        Diagonal elements of the coefficient matrix if its rows are divided by them.
+
+    Returns
+    -------
+    lamb, rho, ic_pred, ops : float, float, int, int
+        The optimal weight, the spectral radius of the weighted iteration matrix and the predicted iteration count with the operation count.
+    """
+
+    # extreme eigenvalues of the iteration matrix
+    mu_min, mu_max, err_min, err_max, ops = get_extreme_eigenvalues(A, imax, et, diag)
+
+    # spectral radius only if the iteration matrix is not similar to a symmetric one
+    if mu_min is None:
+        rho, mu, ops = get_spectral_radius(A, imax, et)
+        ic_pred = math.ceil(math.log(et_sol)/math.log(rho)) if 0 < rho < 1 else (1 if rho == 0 else math.inf)
+        return 1.0, rho, ic_pred, ops
+
+    # interval containing the spectrum
+    mu_lo, mu_hi = mu_min - err_min, mu_max + err_max
+    if mu_hi >= 1:
+        return 1.0, max(abs(mu_lo), abs(mu_hi)), math.inf, ops
+
+    # optimal weight centres the spectrum of the weighted iteration matrix
+    lamb = 1.0 if abs(mu_min + mu_max) <= err_min + err_max + et*max(abs(mu_min), abs(mu_max)) else 2/(2 - mu_lo - mu_hi)
+    rho_w = max(abs(1 - lamb*(1 - mu_lo)), abs(1 - lamb*(1 - mu_hi)))
+
+    # predicted iteration count
+    ic_pred = math.ceil(math.log(et_sol)/math.log(rho_w)) if 0 < rho_w < 1 else (1 if rho_w == 0 else math.inf)
+
+    return lamb, rho_w, ic_pred, ops
+
+def get_norm(v, order):
+    """
+    Obtain the norm of a given vector.
+
+    Parameters
+    ----------
+    v : list (float) or numpy.ndarray
+        Given vector.
+    order : float
+        Order of the norm, either math.inf or 2.
+
+    Returns
+    -------
+    norm : float
+        The norm of the vector.
+    """
+
+    v = np.abs(np.asarray(v, dtype=float))
+
+    return float(np.max(v, initial=0)) if order == math.inf else float(np.sqrt(v @ v))
+
+def get_convergence(A, b, x, dx, diag, norm_b, criterion, order, et, inst=None):
+    """
+    Check the stopping criterion of an iteration for a given system of linear equations with rows divided by their diagonal elements.
+
+    Parameters
+    ----------
+    A : list (list (float))
+        Given coefficient matrix with rows divided by their diagonal elements.
+    b : list (float)
+        Given constant vector with elements divided by the diagonal elements.
+    x : list (float)
+        Current values of the variables.
+    dx : list (float)
+        Change of the variables in the last iteration.
+    diag : list (float)
+        Diagonal elements of the original coefficient matrix.
+    norm_b : float
+        Norm of the original constant vector.
+    criterion : String
+        Stopping criterion, either "change", "residual" or "both".
+    order : float
+        Order of the vector norm, either math.inf or 2.
+    et : float
+        Relative error threshold.
+    inst : Instrument (optional)
+        Instrument to count the operations by category and time the phases.
+
+    Returns
+    -------
+    flag, ops : boolean, int
+        The flag denoting convergence with the operation count.
+    """
+
+    # initialize values
+    ops = 0                             # number of operations
+    dim = len(x)                        # number of variables
+    flag = True
+
+    # relative change of the solution
+    if criterion in ("change", "both"):
+        norm_x = get_norm(x, order)
+        flag = get_norm(dx, order) <= et*(norm_x if norm_x != 0 else 1)
+
+        # update operations
+        ops += 2*dim
+
+        # instrument
+        if inst is not None:
+            inst.count("cmp", 2*dim + 1)
+            inst.count("mul", 2*dim if order == 2 else 1)
+
+    # relative residual of the original system
+    if flag and criterion in ("residual", "both"):
+        r = np.asarray(diag)*(np.asarray(b) - np.asarray(A) @ np.asarray(x))
+        flag = get_norm(r, order) <= et*(norm_b if norm_b != 0 else 1)
+
+        # update operations
+        ops += 2*dim*dim + 2*dim
+
+        # instrument
+        if inst is not None:
+            inst.count("add", dim*dim)
+            inst.count("mul", dim*dim + dim)
+            inst.count("cmp", dim + 1)
+
+    return flag, ops
+
+def get_preconditioner(A, debug):
+    """
+    Obtain the Jacobi (diagonal) preconditioner of a given coefficient matrix.
+
+    Parameters
+    ----------
+    A : list (list (float)) or numpy.ndarray
+        Given coefficient matrix.
+    debug : boolean
+        Option to display steps.
+
+    Returns
+    -------
+    M, ops, msg : function, int, String
+        The function returning the preconditioned vector for a given vector with the operation count and status string.
+    """
+
+    # diagonal elements
+    diag = np.asarray(A, dtype=float).diagonal().copy()
+
+    # if diagonal element is zero
+    if np.any(diag == 0):
+        return None, 0, "Diagonal element is zero"
+
+    # display
+    if debug:
+        print("Diagonal:\t{d}".format(d=diag.tolist()))
+
+    return lambda r: r/diag, len(diag), "Preconditioner obtained"
+
+def get_sweep_weighted(A, diag, b, x, lamb):
+    """
+    Perform a single sweep of the Weighted Jacobi Iteration Method for a given system of linear equations represented as A*x = b.
+
+    The sweep is vectorized and acts on arrays of any shape, hence it serves as a smoother for grid problems.
+
+    Parameters
+    ----------
+    A : numpy.ndarray or function
+        Given coefficient matrix or function returning the product A*x with the shape of x.
+    diag : numpy.ndarray or float
+        Diagonal elements of the coefficient matrix.
+    b : numpy.ndarray
+        Given constant vector.
+    x : numpy.ndarray
+        Current values of the variables.
+    lamb: float
+        Value of the weight.
+
+    Returns
+    -------
+    x, ops : numpy.ndarray, int
+        The updated values of the variables with the element-wise operation count excluding the matrix-vector product.
+    """
 
+    # get residual
+    r = b - (A(x) if callable(A) else A @ x)
 
+    # update all variables with weight
+    x = x + lamb*r/diag
 
-            
+    return x, 4*np.size(x)
@@ -0,0 +1,414 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Authors: Sampreet Kalita
+# Created: 2026-10-19
+# Updated: 2026-10-19
+
+"""Module to obtain solutions of a system of linear equations using Preconditioned Krylov Subspace Methods."""
+
+# dependencies
+import numpy as np
+
+from modules.root_finding.ConjugateGradient import get_mat_vec
+
+def get_solution_PCG(A, b, x, imax, et, debug, M=None, inst=None):
+    """
+    Obtain the solution for a given system of linear equations represented as A*x = b where A is a symmetric positive definite matrix using Preconditioned Conjugate Gradient Method.
+
+    Parameters
+    ----------
+    A : list (list (float)) or numpy.ndarray or function
+        Given coefficient matrix, sparse matrix or matrix-vector product function.
+    b : list (float)
+        Given constant vector.
+    x : list (float)
+        Initial values of the variables.
+    imax : int
+        Maximum number of iterations.
+    et : float
+        Relative residual threshold.
+    debug : boolean
+        Option to display steps.
+    M : function (optional)
+        Symmetric positive definite preconditioner returning the preconditioned vector for a given vector. Each application is counted as `len(b)` operations.
+    inst : Instrument (optional)
+        Instrument to count the operations by category and time the phases.
+
+    Returns
+    -------
+    sol, ic, ops, msg : list (float), int, int, String
+        The solution, the iteration count and the operation count with status string.
+    """
+
+    # initialize values
+    ops = 0                             # number of operations
+    dim = len(b)                        # number of variables
+    ic = 0                              # iteration counter
+    mat_vec, ops_mv = get_mat_vec(A, dim)
+    if M is None:
+        M = lambda r: r.copy()
+    b = np.asarray(b, dtype=float)
+    x = np.array(x, dtype=float)
+
+    # display
+    if debug:
+        print("Input\n-------")
+        print("Vector b:\t{B}".format(B=b.tolist()))
+        print("Vector x:\t{x}".format(x=x.tolist()))
+
+    # initial residual and search direction
+    r = b - mat_vec(x)
+    z = M(r)
+    p = z.copy()
+    rz = r @ z
+    norm_b = np.sqrt(b @ b)
+    if norm_b == 0:
+        norm_b = 1
+
+    # update operations
+    ops += ops_mv + 4*dim
+
+    # instrument
+    if inst is not None:
+        inst.count("add", ops_mv//2 + 2*dim)
+        inst.count("mul", ops_mv//2 + 2*dim)
+        inst.mark()
+
+    while(True):
+        # check residual threshold
+        norm_r = np.sqrt(r @ r)
+        if norm_r <= et*norm_b:
+            return x.tolist(), ic, ops, "Approx. solution obtained"
+
+        # check iteration threshold
+        if ic >= imax:
+            return x.tolist(), ic, ops, "Maximum iterations reached"
+
+        # step length along search direction
+        Ap = mat_vec(p)
+        pAp = p @ Ap
+        if pAp <= 0:
+            return None, ic, ops, "Matrix is not positive definite"
+        alpha = rz/pAp
+
+        # update solution and residual
+        x += alpha*p
+        r -= alpha*Ap
+
+        # update search direction
+        z = M(r)
+        rz_new = r @ z
+        p = z + rz_new/rz*p
+        rz = rz_new
+
+        # update operations
+        ops += ops_mv + 13*dim
+
+        # instrument
+        if inst is not None:
+            inst.count("add", ops_mv//2 + 6*dim)
+            inst.count("mul", ops_mv//2 + 6*dim)
+            inst.count("div", 2)
+            inst.count("sqrt", 1)
+            inst.count("cmp", 2)
+            inst.lap("iterate")
+
+        # update iteration count
+        ic += 1
+
+        # display
+        if debug:
+            print("\nIteration #{ic}\n-------------------".format(ic=ic))
+            print("Vector x:\t{x}".format(x=x.tolist()))
+            print("Residual:\t{r}".format(r=norm_r))
+
+def get_solution_GMRES(A, b, x, m, imax, et, debug, M=None, inst=None):
+    """
+    Obtain the solution for a given system of linear equations represented as A*x = b using Restarted Generalized Minimal Residual Method (GMRES(m)) with right preconditioning.
+
+    Parameters
+    ----------
+    A : list (list (float)) or numpy.ndarray or function
+        Given coefficient matrix, sparse matrix or matrix-vector product function.
+    b : list (float)
+        Given constant vector.
+    x : list (float)
+        Initial values of the variables.
+    m : int
+        Number of iterations between restarts.
+    imax : int
+        Maximum number of iterations.
+    et : float
+        Relative residual threshold.
+    debug : boolean
+        Option to display steps.
+    M : function (optional)
+        Preconditioner returning the preconditioned vector for a given vector. Each application is counted as `len(b)` operations.
+    inst : Instrument (optional)
+        Instrument to count the operations by category and time the phases.
+
+    Returns
+    -------
+    sol, ic, ops, msg : list (float), int, int, String
+        The solution, the iteration count and the operation count with status string.
+    """
+
+    # initialize values
+    ops = 0                             # number of operations
+    dim = len(b)                        # number of variables
+    ic = 0                              # iteration counter
+    m = int(min(m, dim))                # dimension of the Krylov subspace
+    mat_vec, ops_mv = get_mat_vec(A, dim)
+    if M is None:
+        M = lambda r: r.copy()
+    b = np.asarray(b, dtype=float)
+    x = np.array(x, dtype=float)
+    norm_b = np.sqrt(b @ b)
+    if norm_b == 0:
+        norm_b = 1
+
+    # display
+    if debug:
+        print("Input\n-------")
+        print("Vector b:\t{B}".format(B=b.tolist()))
+        print("Vector x:\t{x}".format(x=x.tolist()))
+
+    # instrument
+    if inst is not None:
+        inst.mark()
+
+    # for each restart
+    while(True):
+        # initial residual
+        r = b - mat_vec(x)
+        beta = np.sqrt(r @ r)
+
+        # update operations
+        ops += ops_mv + 3*dim
+
+        # instrument
+        if inst is not None:
+            inst.count("add", ops_mv//2 + 2*dim)
+            inst.count("mul", ops_mv//2 + dim)
+            inst.count("sqrt", 1)
+            inst.count("cmp", 2)
+
+        # check residual threshold
+        if beta <= et*norm_b:
+            return x.tolist(), ic, ops, "Approx. solution obtained"
+
+        # check iteration threshold
+        if ic >= imax:
+            return x.tolist(), ic, ops, "Maximum iterations reached"
+
+        # orthonormal basis and upper Hessenberg matrix
+        V = np.zeros((m + 1, dim))
+        H = np.zeros((m + 1, m))
+        # Givens rotations and residual vector of the least-squares problem
+        cs = np.zeros(m)
+        sn = np.zeros(m)
+        g = np.zeros(m + 1)
+        g[0] = beta
+        V[0] = r/beta
+
+        # Arnoldi process
+        k = 0
+        while k < m and ic < imax:
+            w = mat_vec(M(V[k]))
+
+            # modified Gram-Schmidt orthogonalization
+            for j in range(k + 1):
+                H[j, k] = w @ V[j]
+                w -= H[j, k]*V[j]
+            H[k + 1, k] = np.sqrt(w @ w)
+
+            # update operations
+            ops += ops_mv + dim + 4*(k + 1)*dim + 2*dim
+
+            # apply previous rotations to the new column
+            for j in range(k):
+                temp = cs[j]*H[j, k] + sn[j]*H[j + 1, k]
+                H[j + 1, k] = -sn[j]*H[j, k] + cs[j]*H[j + 1, k]
+                H[j, k] = temp
+
+            # form new rotation
+            rho = np.hypot(H[k, k], H[k + 1, k])
+            if rho == 0:
+                return None, ic, ops, "Breakdown occurred"
+            cs[k] = H[k, k]/rho
+            sn[k] = H[k + 1, k]/rho
+            H[k, k] = rho
+            g[k + 1] = -sn[k]*g[k]
+            g[k] = cs[k]*g[k]
+
+            # update operations
+            ops += 6*k + 10
+
+            # instrument
+            if inst is not None:
+                inst.count("add", ops_mv//2 + 2*(k + 1)*dim + dim + 2*k)
+                inst.count("mul", ops_mv//2 + 2*(k + 1)*dim + dim + 4*k + 4)
+                inst.count("div", dim + 2)
+                inst.count("sqrt", 2)
+                inst.count("cmp", 3)
+
+            # next basis vector
+            norm_w = H[k + 1, k]
+            H[k + 1, k] = 0
+            if norm_w != 0:
+                V[k + 1] = w/norm_w
+
+            # update iteration count
+            k += 1
+            ic += 1
+
+            # display
+            if debug:
+                print("\nIteration #{ic}\n-------------------".format(ic=ic))
+                print("Residual:\t{r}".format(r=abs(g[k])))
+
+            # check residual threshold
+            if abs(g[k]) <= et*norm_b:
+                break
+
+        # solve the upper-triangular least-squares system
+        y = np.zeros(k)
+        for i in range(k - 1, -1, -1):
+            y[i] = (g[i] - H[i, i + 1:k] @ y[i + 1:k])/H[i, i]
+
+        # update solution
+        x += M(V[:k].T @ y)
+
+        # update operations
+        ops += k*k + 2*k*dim + dim
+
+        # instrument
+        if inst is not None:
+            inst.count("add", k*(k - 1)//2 + k*dim + dim)
+            inst.count("mul", k*(k - 1)//2 + k*dim)
+            inst.count("div", k)
+            inst.lap("iterate")
+
+        # display
+        if debug:
+            print("\nRestart\n-------------------")
+            print("Vector x:\t{x}".format(x=x.tolist()))
+
+def get_solution_BiCGSTAB(A, b, x, imax, et, debug, M=None, inst=None):
+    """
+    Obtain the solution for a given system of linear equations represented as A*x = b using Biconjugate Gradient Stabilized Method (BiCGSTAB) with right preconditioning.
+
+    Parameters
+    ----------
+    A : list (list (float)) or numpy.ndarray or function
+        Given coefficient matrix, sparse matrix or matrix-vector product function.
+    b : list (float)
+        Given constant vector.
+    x : list (float)
+        Initial values of the variables.
+    imax : int
+        Maximum number of iterations.
+    et : float
+        Relative residual threshold.
+    debug : boolean
+        Option to display steps.
+    M : function (optional)
+        Preconditioner returning the preconditioned vector for a given vector. Each application is counted as `len(b)` operations.
+    inst : Instrument (optional)
+        Instrument to count the operations by category and time the phases.
+
+    Returns
+    -------
+    sol, ic, ops, msg : list (float), int, int, String
+        The solution, the iteration count and the operation count with status string.
+    """
+
+    # initialize values
+    ops = 0                             # number of operations
+    dim = len(b)                        # number of variables
+    ic = 0                              # iteration counter
+    mat_vec, ops_mv = get_mat_vec(A, dim)
+    if M is None:
+        M = lambda r: r.copy()
+    b = np.asarray(b, dtype=float)
+    x = np.array(x, dtype=float)
+    norm_b = np.sqrt(b @ b)
+    if norm_b == 0:
+        norm_b = 1
+
+    # display
+    if debug:
+        print("Input\n-------")
+        print("Vector b:\t{B}".format(B=b.tolist()))
+        print("Vector x:\t{x}".format(x=x.tolist()))
+
+    # initial residual and shadow residual
+    r = b - mat_vec(x)
+    r_0 = r.copy()
+    rho = alpha = omega = 1.0
+    v = np.zeros(dim)
+    p = np.zeros(dim)
+
+    # update operations
+    ops += ops_mv + 2*dim
+
+    # instrument
+    if inst is not None:
+        inst.count("add", ops_mv//2 + dim)
+        inst.count("mul", ops_mv//2)
+        inst.count("mov", dim)
+        inst.mark()
+
+    while(True):
+        # check residual threshold
+        norm_r = np.sqrt(r @ r)
+        if norm_r <= et*norm_b:
+            return x.tolist(), ic, ops, "Approx. solution obtained"
+
+        # check iteration threshold
+        if ic >= imax:
+            return x.tolist(), ic, ops, "Maximum iterations reached"
+
+        # update search direction
+        rho_new = r_0 @ r
+        if rho_new == 0 or omega == 0:
+            return None, ic, ops, "Breakdown occurred"
+        p = r + rho_new/rho*alpha/omega*(p - omega*v)
+        rho = rho_new
+
+        # first half step
+        p_hat = M(p)
+        v = mat_vec(p_hat)
+        alpha = rho/(r_0 @ v)
+        s = r - alpha*v
+
+        # stabilizing half step
+        s_hat = M(s)
+        t = mat_vec(s_hat)
+        tt = t @ t
+        omega = (t @ s)/tt if tt != 0 else 0.0
+
+        # update solution and residual
+        x += alpha*p_hat + omega*s_hat
+        r = s - omega*t
+
+        # update operations
+        ops += 2*ops_mv + 22*dim
+
+        # instrument
+        if inst is not None:
+            inst.count("add", ops_mv + 11*dim)
+            inst.count("mul", ops_mv + 11*dim)
+            inst.count("div", 4)
+            inst.count("sqrt", 1)
+            inst.count("cmp", 4)
+            inst.lap("iterate")
+
+        # update iteration count
+        ic += 1
+
+        # display
+        if debug:
+            print("\nIteration #{ic}\n-------------------".format(ic=ic))
+            print("Vector x:\t{x}".format(x=x.tolist()))
+            print("Residual:\t{r}".format(r=norm_r))
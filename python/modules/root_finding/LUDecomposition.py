@@ -2,14 +2,15 @@
 # -*- coding: utf-8 -*-
 # Authors: Sampreet Kalita
 # Created: 2019-04-07
-# Updated: 2020-01-30
+# Updated: 2026-10-19
 
 """Module to obtain solutions of a system of linear equations using LU Decomposition Method."""
 
 # dependencies
 import math
+import numpy as np
 
-def get_solution_L(L, b, debug):
+def get_solution_L(L, b, debug, inst=None):
     """
     Obtain the solution for the Lower-Triangular matrix.
 
@@ -19,6 +20,8 @@ def get_solution_L(L, b, debug):
         Lower-triangular matrix
     debug : boolean
         Option to display steps.
+    inst : Instrument (optional)
+        Instrument to count the operations by category and time the phases.
 
     Returns
     -------
@@ -44,6 +47,12 @@ def get_solution_L(L, b, debug):
         # update operations
         ops += 1
 
+        # instrument
+        if inst is not None:
+            inst.count("add", i + 1)
+            inst.count("mul", i)
+            inst.count("div", 1)
+
     # display
     if debug:
         print("\nSolution of L\n-------------------")
@@ -51,7 +60,7 @@ def get_solution_L(L, b, debug):
 
     return y, ops
     
-def get_solution_U(U, y, debug):
+def get_solution_U(U, y, debug, inst=None):
     """
     Obtain the solution for the Upper-Triangular matrix.
 
@@ -61,6 +70,8 @@ def get_solution_U(U, y, debug):
         Upper-triangular matrix
     debug : boolean
         Option to display steps.
+    inst : Instrument (optional)
+        Instrument to count the operations by category and time the phases.
 
     Returns
     -------
@@ -84,6 +95,12 @@ def get_solution_U(U, y, debug):
         # update operations
         ops += 1
 
+        # instrument
+        if inst is not None:
+            inst.count("add", i + 1)
+            inst.count("mul", i)
+            inst.count("div", 1)
+
     # display
     if debug:
         print("\nSolution of U\n-------------------")
@@ -91,7 +108,148 @@ def get_solution_U(U, y, debug):
 
     return x, ops
 
-def get_LU_basic_OnesInL(A, debug):
+def get_solution_L_block(L, B, debug, block=64, width=None, inst=None):
+    """
+    Obtain the solution for the Lower-Triangular matrix and a block of constant vectors using Blocked Forward Substitution.
+
+    The contributions of the solved rows to each block of rows are subtracted by a single matrix-matrix product, hence the solves of all constant vectors share each pass over the matrix.
+
+    Parameters
+    ----------
+    L : list (list (float)) or numpy.ndarray
+        Lower-triangular matrix.
+    B : list (list (float)) or numpy.ndarray
+        Constant matrix of n rows, one column per system.
+    debug : boolean
+        Option to display steps.
+    block : int (optional)
+        Number of rows of each block.
+    width : int (optional)
+        Number of non-zero off-diagonals of a banded matrix, hence only the band is accessed.
+    inst : Instrument (optional)
+        Instrument to count the operations by category and time the phases.
+
+    Returns
+    -------
+    Y, ops : numpy.ndarray, int
+        The solution matrix with the operation count.
+    """
+
+    # initialize values
+    L = np.asarray(L, dtype=float)
+    Y = np.array(B, dtype=float)        # the solution matrix
+    dim, dim_n = Y.shape                # number of variables and systems
+
+    # for each block of rows
+    for i in range(0, dim, block):
+        rows = slice(i, min(i + block, dim))
+
+        # subtract the solved rows within the band
+        lo = 0 if width is None else max(0, i - width)
+        Y[rows] -= L[rows, lo:i] @ Y[lo:i]
+
+        # substitute within the block
+        for r in range(rows.start, rows.stop):
+            Y[r] = (Y[r] - L[r, i:r] @ Y[i:r])/L[r, r]
+
+    # update operations
+    nnz = get_band_count(dim, width)
+    ops = dim_n*nnz
+
+    # instrument
+    if inst is not None:
+        inst.count("add", dim_n*nnz)
+        inst.count("mul", dim_n*(nnz - dim))
+        inst.count("div", dim_n*dim)
+
+    # display
+    if debug:
+        print("\nSolution of L\n-------------------")
+        print("Matrix Y:\t{Y}".format(Y=Y.tolist()))
+
+    return Y, ops
+
+def get_solution_U_block(U, Y, debug, block=64, width=None, inst=None):
+    """
+    Obtain the solution for the Upper-Triangular matrix and a block of constant vectors using Blocked Back Substitution.
+
+    Parameters
+    ----------
+    U : list (list (float)) or numpy.ndarray
+        Upper-triangular matrix.
+    Y : list (list (float)) or numpy.ndarray
+        Constant matrix of n rows, one column per system.
+    debug : boolean
+        Option to display steps.
+    block : int (optional)
+        Number of rows of each block.
+    width : int (optional)
+        Number of non-zero off-diagonals of a banded matrix, hence only the band is accessed.
+    inst : Instrument (optional)
+        Instrument to count the operations by category and time the phases.
+
+    Returns
+    -------
+    X, ops : numpy.ndarray, int
+        The solution matrix with the operation count.
+    """
+
+    # initialize values
+    U = np.asarray(U, dtype=float)
+    X = np.array(Y, dtype=float)        # the solution matrix
+    dim, dim_n = X.shape                # number of variables and systems
+
+    # for each block of rows from the last
+    for i in range((dim - 1)//block*block, -1, -block):
+        rows = slice(i, min(i + block, dim))
+
+        # subtract the solved rows within the band
+        hi = dim if width is None else min(dim, rows.stop + width)
+        X[rows] -= U[rows, rows.stop:hi] @ X[rows.stop:hi]
+
+        # substitute within the block
+        for r in range(rows.stop - 1, rows.start - 1, -1):
+            X[r] = (X[r] - U[r, r + 1:rows.stop] @ X[r + 1:rows.stop])/U[r, r]
+
+    # update operations
+    nnz = get_band_count(dim, width)
+    ops = dim_n*nnz
+
+    # instrument
+    if inst is not None:
+        inst.count("add", dim_n*nnz)
+        inst.count("mul", dim_n*(nnz - dim))
+        inst.count("div", dim_n*dim)
+
+    # display
+    if debug:
+        print("\nSolution of U\n-------------------")
+        print("Matrix X:\t{X}".format(X=X.tolist()))
+
+    return X, ops
+
+def get_band_count(dim, width=None):
+    """
+    Obtain the number of elements of a triangular matrix within a band including the diagonal.
+
+    Parameters
+    ----------
+    dim : int
+        Number of rows.
+    width : int (optional)
+        Number of off-diagonals of the band. If not provided, the full triangle is counted.
+
+    Returns
+    -------
+    nnz : int
+        The number of elements.
+    """
+
+    width = dim - 1 if width is None else min(width, dim - 1)
+
+    return dim*(width + 1) - width*(width + 1)//2
+
+def get_LU_basic_OnesInL(A, debug, trace=None, inst=None):
     """
     Obtain the Lower-Triangular and Upper-Triangular matrices of a given matrix using Basic LU Decomposition with ones in L.
 
@@ -101,6 +259,10 @@ def get_LU_basic_OnesInL(A, debug):
         Given coefficient matrix.
     debug : boolean
         Option to display steps.
+    trace : Trace (optional)
+        Trace to record the steps.
+    inst : Instrument (optional)
+        Instrument to count the operations by category and time the phases.
 
     Returns
     -------
@@ -145,6 +307,16 @@ def get_LU_basic_OnesInL(A, debug):
             # update operations
             ops += 1
 
+        # record
+        if trace is not None:
+            trace.record("formation", j, j, j, abs(U[j][j]))
+
+        # instrument
+        if inst is not None:
+            inst.count("add", j*(j + 1)//2 + j + 1 + (dim - 1 - j)*(j + 1))
+            inst.count("mul", j*(j + 1)//2 + (dim - 1 - j)*j)
+            inst.count("div", dim - 1 - j)
+
         # display
         if debug:
             print("\nFormation step #{j}\n-------------------".format(j=j))
@@ -153,7 +325,7 @@ def get_LU_basic_OnesInL(A, debug):
 
     return L, U, ops
 
-def get_solution_basic(A, b, debug):
+def get_solution_basic(A, b, debug, trace=None, inst=None):
     """
     Obtain the solution for a given system of linear equations represented as A*x = b using Basic LU Decomposition Method.
 
@@ -161,14 +333,18 @@ def get_solution_basic(A, b, debug):
     ----------
     A : list (list (float))
         Given coefficient matrix.
-    b : list (float)
-        Given constant vector.
+    b : list (float) or list (list (float)) or numpy.ndarray
+        Given constant vector, or constant matrix of n rows solved using `get_solution_L_block` and `get_solution_U_block`.
     debug : boolean
         Option to display steps.
+    trace : Trace (optional)
+        Trace to record the steps.
+    inst : Instrument (optional)
+        Instrument to count the operations by category and time the phases.
 
     Returns
     -------
-    sol, ops, msg : list (float), int, String
+    sol, ops, msg : list (float) or numpy.ndarray, int, String
         The solution and the operation count with error string.
     """
 
@@ -181,117 +357,1537 @@ def get_solution_basic(A, b, debug):
         print("Matrix A:\t{A}".format(A=A))
         print("Vector b:\t{B}".format(B=b))
 
+    # instrument
+    if inst is not None:
+        inst.mark()
+
     # get L and U
-    L, U, ops = get_LU_basic_OnesInL(A, debug)
-    t_ops += ops
-    # get solution of L
-    y, ops = get_solution_L(L, b, debug)
-    t_ops += ops
-    # get solution of U
-    x, ops = get_solution_U(U, y, debug)
+    L, U, ops = get_LU_basic_OnesInL(A, debug, trace, inst)
     t_ops += ops
 
+    # instrument
+    if inst is not None:
+        inst.lap("factor")
+
+    # get solution of L and U for a block of constant vectors
+    if np.ndim(b) == 2:
+        y, ops = get_solution_L_block(L, b, debug, inst=inst)
+        t_ops += ops
+        x, ops = get_solution_U_block(U, y, debug, inst=inst)
+        t_ops += ops
+    else:
+        # get solution of L
+        y, ops = get_solution_L(L, b, debug, inst)
+        t_ops += ops
+        # get solution of U
+        x, ops = get_solution_U(U, y, debug, inst)
+        t_ops += ops
+
+    # instrument
+    if inst is not None:
+        inst.lap("substitute")
+
     return x, t_ops, "Solution obtained"
 
-def get_LU_Cholesky(A, debug):
+def get_LU_pivot(A, debug, dtype=np.float64, trace=None, inst=None):
     """
-    Obtain the Lower-Triangular matrix of a symmetric positive definitive matrix using Cholesky Decomposition.
+    Obtain the Lower-Triangular and Upper-Triangular matrices of a given matrix using LU Decomposition with ones in L and Partial Pivoting such that A[p] = L*U.
+
+    The elimination is vectorized over the trailing submatrix and performed in the given precision.
 
     Parameters
     ----------
-    A : list
+    A : list (list (float)) or numpy.ndarray
         Given matrix.
     debug : boolean
         Option to display steps.
+    dtype : numpy.dtype (optional)
+        Precision of the decomposition, for example numpy.float32 for a low-precision decomposition.
+    trace : Trace (optional)
+        Trace to record the steps.
+    inst : Instrument (optional)
+        Instrument to count the operations by category and time the phases.
 
     Returns
     -------
-    L, U, ops : list, list, int
-        The lower-triangular and upper-triangular matrices along with the operation count.
+    L, U, p, ops : numpy.ndarray, numpy.ndarray, list (int), int
+        The lower-triangular and upper-triangular matrices and the row permutation along with the operation count.
     """
 
     # initialize values
     ops = 0                             # number of operations
-    dim = len(A)                        # number of variables
+    LU = np.array(A, dtype=dtype)
+    dim = len(LU)                       # number of variables
+    p = list(range(dim))                # row permutation
+
+    # for each column
+    for j in range(dim):
+        # check for largest element
+        index = j + int(np.argmax(np.abs(LU[j:, j])))
+
+        # update operations
+        ops += dim - j
+
+        if index != j:
+            # swap rows
+            LU[[j, index]] = LU[[index, j]]
+            p[j], p[index] = p[index], p[j]
+
+            # instrument
+            if inst is not None:
+                inst.count("mov", 2*dim)
+
+            # record
+            if trace is not None:
+                trace.record("swap", j, index, j)
+
+        # elimination step
+        if LU[j, j] != 0:
+            LU[j + 1:, j] /= LU[j, j]
+            LU[j + 1:, j + 1:] -= np.outer(LU[j + 1:, j], LU[j, j + 1:])
+
+            # update operations
+            ops += (dim - j - 1)*(2*(dim - j - 1) + 1)
+
+            # instrument
+            if inst is not None:
+                inst.count("div", dim - j - 1)
+                inst.count("add", (dim - j - 1)**2)
+                inst.count("mul", (dim - j - 1)**2)
+
+        # instrument
+        if inst is not None:
+            inst.count("cmp", dim - j + 1)
+
+        # record
+        if trace is not None:
+            trace.record("elimination", j, j, j, abs(float(LU[j, j])))
+
+        # display
+        if debug:
+            print("\nFormation step #{j}\n-------------------".format(j=j))
+            print("Matrix LU:\t{LU}".format(LU=LU.tolist()))
+
     # lower-triangular matrix
-    L = [[0 for j in range(dim)] for i in range(dim)]
+    L = np.tril(LU, -1) + np.eye(dim, dtype=dtype)
+    # upper-triangular matrix
+    U = np.triu(LU)
 
-    # for each row
-    for k in range(dim):
-        # for each element of the row other than the k-th element
-        for i in range(k):
-            prod_sum = 0
-            # find the sum of previous elements of that row 
-            # multiplied by previous elements of k-th row
-            for j in range(i):
-                prod_sum += L[i][j]*L[k][j]
+    return L, U, p, ops
 
-                # update operations
-                ops += 1
+def get_solution_factors(L, U, p, b, debug, inst=None):
+    """
+    Obtain the solution for a given system of linear equations represented as A*x = b from the Lower-Triangular and Upper-Triangular matrices of A[p] in the precision of the matrices.
 
-            # update that element
-            L[k][i] = (A[k][i] - prod_sum)/L[i][i]
+    Parameters
+    ----------
+    L : numpy.ndarray
+        Lower-triangular matrix.
+    U : numpy.ndarray
+        Upper-triangular matrix.
+    p : list (int)
+        Row permutation.
+    b : list (float) or numpy.ndarray
+        Given constant vector, or constant matrix of n rows solved using `get_solution_L_block` and `get_solution_U_block`.
+    debug : boolean
+        Option to display steps.
+    inst : Instrument (optional)
+        Instrument to count the operations by category and time the phases.
 
-            # update operations 
-            ops += 2
+    Returns
+    -------
+    x, ops : numpy.ndarray, int
+        The solution with the operation count.
+    """
 
-        sq_sum = 0
-        # find the sum of squares of elements in the k-th row
-        # other than the k-th element 
-        for j in range(k):
-            sq_sum += L[k][j]**2
+    # initialize values
+    dim = len(L)                        # number of variables
+    # permuted constant vector
+    b = np.asarray(b)[p].astype(L.dtype)
 
-            # update operations 
-            ops += 1
-        
-        # update the k-th element
-        L[k][k] = math.sqrt(A[k][k] - sq_sum)
+    # block of constant vectors
+    if b.ndim == 2:
+        Y, ops_L = get_solution_L_block(L, b, debug, inst=inst)
+        X, ops_U = get_solution_U_block(U, Y, debug, inst=inst)
+
+        return X.astype(U.dtype), ops_L + ops_U
+
+    # solution of L
+    y = np.zeros(dim, dtype=L.dtype)
+    for i in range(dim):
+        y[i] = (b[i] - L[i, :i] @ y[:i])/L[i, i]
+
+    # solution of U
+    x = np.zeros(dim, dtype=U.dtype)
+    for i in range(dim - 1, -1, -1):
+        x[i] = (y[i] - U[i, i + 1:] @ x[i + 1:])/U[i, i]
+
+    # instrument
+    if inst is not None:
+        inst.count("add", dim*dim)
+        inst.count("mul", dim*(dim - 1))
+        inst.count("div", 2*dim)
 
     # display
     if debug:
-        print("Matrix L:\t{L}".format(L=L))
-
-    # upper-triangular matrix
-    U = [[L[j][i] for j in range(dim)] for i in range(dim)]
+        print("\nSolution of LU\n-------------------")
+        print("Vector x:\t{x}".format(x=x.tolist()))
 
-    return L, U, ops
+    return x, dim*(dim + 1)
 
-def get_solution_Cholesky(A, b, debug):
+def get_solution_refined(A, b, imax, et, debug, inst=None):
     """
-    Obtain the solution for a given system of linear equations represented as A*x = b where A is a symmetric positive definite matrix using Cholesky Decomposition.
+    Obtain the solution for a given system of linear equations represented as A*x = b using Mixed-Precision Iterative Refinement.
+
+    The matrix is decomposed once in single precision and the decomposition is reused to solve for the corrections of the residuals computed in double precision. The refinement stops when the relative correction falls below the threshold or stagnates.
 
     Parameters
     ----------
-    A : list (list (float))
-        Given matrix.
+    A : list (list (float)) or numpy.ndarray
+        Given coefficient matrix.
     b : list (float)
         Given constant vector.
+    imax : int
+        Maximum number of refinement steps.
+    et : float
+        Relative correction threshold.
     debug : boolean
         Option to display steps.
+    inst : Instrument (optional)
+        Instrument to count the operations by category and time the phases.
 
     Returns
     -------
-    sol, ops, msg : list (float), int, String
-        The solution and the operation count with error string.
+    sol, ic, err, ops, msg : list (float), int, float, int, String
+        The solution, the refinement step count and the normwise backward error with the operation count and status string.
     """
 
     # initialize values
-    t_ops = 0                           # total number of operations
+    ic = 0                              # refinement step counter
+    A = np.asarray(A, dtype=np.float64)
+    b = np.asarray(b, dtype=np.float64)
+    dim = len(b)                        # number of variables
+    norm_A = np.max(np.sum(np.abs(A), axis=1))
+    norm_b = np.max(np.abs(b))
 
     # display
     if debug:
         print("Input\n-------")
-        print("Matrix A:\t{A}".format(A=A))
-        print("Vector b:\t{B}".format(B=b))
+        print("Matrix A:\t{A}".format(A=A.tolist()))
+        print("Vector b:\t{B}".format(B=b.tolist()))
 
-    # get L and U
-    L, U, ops = get_LU_Cholesky(A, debug)
-    t_ops += ops
-    # get solution of L
-    y, ops = get_solution_L(L, b, debug)
-    t_ops += ops
-    # get solution of U
-    x, ops = get_solution_U(U, y, debug)
-    t_ops += ops
+    # instrument
+    if inst is not None:
+        inst.count("add", dim*dim)
+        inst.count("cmp", 2*dim)
+        inst.mark()
+
+    # get L and U in single precision
+    L, U, p, ops = get_LU_pivot(A, False, np.float32, inst=inst)
+    if np.any(U.diagonal() == 0):
+        return None, ic, math.inf, ops, "Martix is singular"
+
+    # instrument
+    if inst is not None:
+        inst.lap("factor")
+
+    # initial solution
+    x, ops_s = get_solution_factors(L, U, p, b, False, inst)
+    x = x.astype(np.float64)
+    ops += ops_s
+    norm_d_prev = math.inf
+
+    # instrument
+    if inst is not None:
+        inst.lap("substitute")
+
+    while(True):
+        # residual in double precision
+        r = b - A @ x
+        err = np.max(np.abs(r))/(norm_A*np.max(np.abs(x)) + norm_b)
+
+        # update operations
+        ops += 2*dim*dim + 4*dim
+
+        # instrument
+        if inst is not None:
+            inst.count("add", dim*dim + 1)
+            inst.count("mul", dim*dim + 1)
+            inst.count("div", 1)
+            inst.count("cmp", 2*dim)
+            inst.lap("residual")
+
+        # check iteration threshold
+        if ic >= imax:
+            return x.tolist(), ic, err, ops, "Maximum iterations reached"
+
+        # correction in single precision
+        d, ops_s = get_solution_factors(L, U, p, r, False, inst)
+        d = d.astype(np.float64)
+        norm_d = np.max(np.abs(d))
+        ops += ops_s
+
+        # instrument
+        if inst is not None:
+            inst.count("cmp", dim + 1)
+            inst.count("add", dim)
+            inst.lap("substitute")
+
+        # check stagnation
+        if norm_d > norm_d_prev/2:
+            return x.tolist(), ic, err, ops, "Refinement stagnated"
+
+        # update solution
+        x += d
+        norm_d_prev = norm_d
+
+        # update refinement step count
+        ic += 1
+
+        # display
+        if debug:
+            print("\nRefinement step #{ic}\n-------------------".format(ic=ic))
+            print("Vector x:\t{x}".format(x=x.tolist()))
+            print("Backward error:\t{err}".format(err=err))
+
+        # check relative correction
+        if norm_d <= et*np.max(np.abs(x)):
+            r = b - A @ x
+            err = np.max(np.abs(r))/(norm_A*np.max(np.abs(x)) + norm_b)
+            ops += 2*dim*dim + 4*dim
+
+            # instrument
+            if inst is not None:
+                inst.count("add", dim*dim + 1)
+                inst.count("mul", dim*dim + 1)
+                inst.count("div", 1)
+                inst.count("cmp", 2*dim)
+                inst.lap("residual")
+
+            return x.tolist(), ic, err, ops, "Approx. solution obtained"
+
+def get_condition_estimate(A, L, U, debug, inst=None, norm=None):
+    """
+    Obtain an estimate of the condition number in 1-norm of a given matrix from its Lower-Triangular and Upper-Triangular matrices using Hager's Method as refined by Higham.
+
+    Each step of the estimate costs two triangular solves, hence the estimate is obtained in O(n^2) operations after the decomposition. The factors may be those of the matrix with permuted rows, which has the same condition number in 1-norm.
+
+    Parameters
+    ----------
+    A : list (list (float)) or None
+        Given matrix, not required if its 1-norm is provided.
+    L : list (list (float))
+        Lower-triangular matrix of the given matrix.
+    U : list (list (float))
+        Upper-triangular matrix of the given matrix.
+    debug : boolean
+        Option to display steps.
+    inst : Instrument (optional)
+        Instrument to count the operations by category and time the phases.
+    norm : float (optional)
+        1-norm of the given matrix, for example if the matrix is overwritten by the decomposition.
+
+    Returns
+    -------
+    cond, ops : float, int
+        The estimate of the condition number with the operation count.
+    """
+
+    # initialize values
+    ops = 0                             # number of operations
+    dim = len(L)                        # number of variables
+    # transposed matrices for the solution of the transposed system
+    L_T = [[L[j][i] for j in range(dim)] for i in range(dim)]
+    U_T = [[U[j][i] for j in range(dim)] for i in range(dim)]
+
+    # instrument
+    if inst is not None:
+        inst.mark()
+
+    # 1-norm of the matrix
+    if norm is None:
+        norm = max([sum([abs(A[i][j]) for i in range(dim)]) for j in range(dim)])
+        ops += dim*dim
+
+        # instrument
+        if inst is not None:
+            inst.count("add", dim*dim)
+            inst.count("cmp", dim)
+
+    # if diagonal element is zero
+    for i in range(dim):
+        if U[i][i] == 0:
+            return math.inf, ops
+
+    # estimate the 1-norm of the inverse
+    x = [1/dim for i in range(dim)]
+    est = 0
+    for k in range(5):
+        # solve A*y = x
+        w, ops_L = get_solution_L(L, x, False, inst)
+        y, ops_U = get_solution_U(U, w, False, inst)
+        ops += ops_L + ops_U
+        est_new = sum([abs(ele) for ele in y])
+
+        # solve A^T*z = sign(y)
+        xi = [1 if ele >= 0 else -1 for ele in y]
+        w, ops_L = get_solution_L(U_T, xi, False, inst)
+        z, ops_U = get_solution_U(L_T, w, False, inst)
+        ops += ops_L + ops_U + 3*dim
+
+        # instrument
+        if inst is not None:
+            inst.count("add", 2*dim)
+            inst.count("mul", dim)
+            inst.count("cmp", 2*dim + 2)
+
+        # display
+        if debug:
+            print("\nEstimation step #{k}\n-------------------".format(k=k))
+            print("Estimate:\t{est}".format(est=est_new*norm))
+
+        # check for a local maximum
+        j = max(range(dim), key=lambda i: abs(z[i]))
+        if k > 0 and (est_new <= est or abs(z[j]) <= sum([z[i]*x[i] for i in range(dim)])):
+            est = max(est, est_new)
+            break
+        est = est_new
+
+        # next vector
+        x = [1 if i==j else 0 for i in range(dim)]
+
+    # alternative estimate guarding against special matrices
+    x = [(-1)**i*(1 + i/max(dim - 1, 1)) for i in range(dim)]
+    w, ops_L = get_solution_L(L, x, False, inst)
+    y, ops_U = get_solution_U(U, w, False, inst)
+    ops += ops_L + ops_U + 2*dim
+    est = max(est, 2*sum([abs(ele) for ele in y])/(3*dim))
+
+    # instrument
+    if inst is not None:
+        inst.count("add", 2*dim)
+        inst.count("div", dim + 1)
+        inst.count("cmp", 1)
+        inst.lap("estimate")
+
+    return norm*est, ops
+
+def get_permutation_sign(p):
+    """
+    Obtain the sign of a given permutation by counting its cycles.
+
+    Parameters
+    ----------
+    p : list (int)
+        Given permutation.
+
+    Returns
+    -------
+    sign : int
+        The sign of the permutation, 1 if even and -1 if odd.
+    """
+
+    # initialize values
+    dim = len(p)                        # number of elements
+    visited = [False for i in range(dim)]
+    sign = 1
+
+    # for each cycle
+    for i in range(dim):
+        j = i
+        length = 0
+        while not visited[j]:
+            visited[j] = True
+            j = p[j]
+            length += 1
+
+        # a cycle of even length is an odd permutation
+        if length > 0 and length % 2 == 0:
+            sign = -sign
+
+    return sign
+
+def get_log_determinant_factors(L, U, p=None):
+    """
+    Obtain the sign and the natural logarithm of the absolute value of the determinant of a given matrix from its Lower-Triangular and Upper-Triangular matrices.
+
+    The determinant is the product of the diagonal elements of both matrices and the sign of the row permutation, hence it is obtained in O(n) operations after the decomposition without overflow or underflow. The factors of `get_LU_basic_OnesInL`, `get_LU_pivot` and `get_LU_Cholesky` are accepted.
+
+    Parameters
+    ----------
+    L : list (list (float)) or numpy.ndarray
+        Lower-triangular matrix.
+    U : list (list (float)) or numpy.ndarray
+        Upper-triangular matrix.
+    p : list (int) (optional)
+        Row permutation such that A[p] = L*U.
+
+    Returns
+    -------
+    sign, logdet : float, float
+        The sign of the determinant, zero for a singular matrix, and the logarithm of its absolute value, -inf for a singular matrix.
+    """
+
+    # initialize values
+    dim = len(U)                        # number of variables
+    sign = 1.0 if p is None else float(get_permutation_sign(p))
+    logdet = 0.0
+
+    # for each diagonal element of both matrices
+    for i in range(dim):
+        for ele in (L[i][i], U[i][i]):
+            # if diagonal element is zero
+            if ele == 0:
+                return 0.0, -math.inf
+
+            if ele < 0:
+                sign = -sign
+            logdet += math.log(abs(ele))
+
+    return sign, logdet
+
+def get_determinant_factors(L, U, p=None):
+    """
+    Obtain the determinant of a given matrix from its Lower-Triangular and Upper-Triangular matrices.
+
+    Parameters
+    ----------
+    L : list (list (float)) or numpy.ndarray
+        Lower-triangular matrix.
+    U : list (list (float)) or numpy.ndarray
+        Upper-triangular matrix.
+    p : list (int) (optional)
+        Row permutation such that A[p] = L*U.
+
+    Returns
+    -------
+    det : float
+        The determinant, which may overflow or underflow for large matrices unlike `get_log_determinant_factors`.
+    """
+
+    sign, logdet = get_log_determinant_factors(L, U, p)
+
+    return sign*math.exp(logdet) if sign != 0 else 0.0
+
+def get_log_determinant(A, debug, inst=None):
+    """
+    Obtain the sign and the natural logarithm of the absolute value of the determinant of a given matrix using LU Decomposition with Partial Pivoting.
+
+    Parameters
+    ----------
+    A : list (list (float)) or numpy.ndarray
+        Given matrix.
+    debug : boolean
+        Option to display steps.
+    inst : Instrument (optional)
+        Instrument to count the operations by category and time the phases.
+
+    Returns
+    -------
+    sign, logdet, ops : float, float, int
+        The sign of the determinant and the logarithm of its absolute value along with the operation count.
+    """
+
+    # instrument
+    if inst is not None:
+        inst.mark()
+
+    # decomposition
+    L, U, p, ops = get_LU_pivot(A, debug, trace=None, inst=inst)
+
+    # instrument
+    if inst is not None:
+        inst.lap("factor")
+
+    # determinant from the diagonal
+    sign, logdet = get_log_determinant_factors(L, U, p)
+    ops += len(U)
+
+    # instrument
+    if inst is not None:
+        inst.count("add", len(U))
+        inst.count("fev", len(U))
+        inst.lap("determinant")
+
+    # display
+    if debug:
+        print("\nDeterminant\n-------------------")
+        print("Sign:\t{sign}\nLog-determinant:\t{logdet}".format(sign=sign, logdet=logdet))
+
+    return sign, logdet, ops
+
+def get_determinant(A, debug, inst=None):
+    """
+    Obtain the determinant of a given matrix using LU Decomposition with Partial Pivoting.
+
+    Parameters
+    ----------
+    A : list (list (float)) or numpy.ndarray
+        Given matrix.
+    debug : boolean
+        Option to display steps.
+    inst : Instrument (optional)
+        Instrument to count the operations by category and time the phases.
+
+    Returns
+    -------
+    det, ops : float, int
+        The determinant along with the operation count.
+    """
+
+    sign, logdet, ops = get_log_determinant(A, debug, inst)
+
+    return (sign*math.exp(logdet) if sign != 0 else 0.0), ops
+
+def get_LU_tiled(path, tile, debug, path_LU=None, inst=None):
+    """
+    Obtain the Lower-Triangular and Upper-Triangular matrices of a matrix stored on disk using Out-of-Core Left-Looking LU Decomposition with ones in L and Partial Pivoting such that A[p] = L*U.
+
+    The matrix is read from a `.npy` file as a memory map and factored one panel of columns at a time. Each panel receives the updates of all previous panels, which are streamed in as tiles, is factored in memory and is written back, hence the working set is a panel of n*tile elements and a tile of tile*tile elements. The factors are stored packed with the strictly lower part of L and the upper part of U in the same file. The matrix is taken as singular if a pivot does not exceed n*eps times its largest element magnitude, in which case the factorization stops.
+
+    Parameters
+    ----------
+    path : String
+        Path of the `.npy` file of the given square matrix of type float64.
+    tile : int
+        Number of columns of each panel and number of rows of each streamed tile.
+    debug : boolean
+        Option to display steps.
+    path_LU : String (optional)
+        Path of the `.npy` file to store the factors. If not provided, the factors overwrite the given matrix.
+    inst : Instrument (optional)
+        Instrument to count the operations by category and time the phases.
+
+    Returns
+    -------
+    path_LU, p, ops, msg : String, list (int), int, String
+        The path of the packed factors and the row permutation along with the operation count and status string, or None for the path and the permutation if the matrix is singular.
+    """
+
+    # initialize values
+    ops = 0                             # number of operations
+
+    # copy the matrix tile by tile
+    if path_LU is not None:
+        A = np.load(path, mmap_mode='r')
+        LU = np.lib.format.open_memmap(path_LU, mode='w+', dtype=np.float64, shape=A.shape)
+        for i in range(0, len(A), tile):
+            LU[i:i + tile] = A[i:i + tile]
+        LU.flush()
+        del A, LU
+    else:
+        path_LU = path
+
+    LU = np.load(path_LU, mmap_mode='r+')
+    dim = len(LU)                       # number of variables
+    p = np.arange(dim)                  # row permutation
+
+    # instrument
+    if inst is not None:
+        inst.mark()
+
+    # threshold of the pivots relative to the largest element magnitude streamed tile by tile
+    norm = max([float(np.max(np.abs(LU[i:i + tile]))) for i in range(0, dim, tile)], default=0.0)
+    et = dim*np.finfo(np.float64).eps*norm
+
+    # instrument
+    if inst is not None:
+        inst.count("cmp", dim*dim)
+
+    # for each panel
+    for k in range(0, dim, tile):
+        cols = slice(k, min(k + tile, dim))
+        width = cols.stop - k
+
+        # panel with the rows in the current order
+        panel = np.array(LU[:, cols])[p]
+
+        # for each previous panel
+        for j in range(0, k, tile):
+            # block of U by forward substitution with the diagonal tile of L
+            T = np.array(LU[j:j + tile, j:j + tile])
+            for i in range(1, tile):
+                panel[j + i] -= T[i, :i] @ panel[j:j + i]
+
+            # update the rows below with the tiles of L
+            for i in range(j + tile, dim, tile):
+                panel[i:i + tile] -= LU[i:i + tile, j:j + tile] @ panel[j:j + tile]
+
+            # update operations
+            ops += tile*(tile - 1)*width + 2*(dim - j - tile)*tile*width
+
+            # instrument
+            if inst is not None:
+                inst.count("add", (tile*(tile - 1)//2 + (dim - j - tile)*tile)*width)
+                inst.count("mul", (tile*(tile - 1)//2 + (dim - j - tile)*tile)*width)
+
+        # factor the panel
+        for jj in range(width):
+            c = k + jj
+
+            # check for largest element
+            index = c + int(np.argmax(np.abs(panel[c:, jj])))
+
+            # update operations
+            ops += dim - c
+
+            if index != c:
+                # swap rows of the panel and of the previous panels on disk
+                panel[[c, index]] = panel[[index, c]]
+                p[[c, index]] = p[[index, c]]
+                if k > 0:
+                    LU[[c, index], :k] = LU[[index, c], :k]
+
+                # instrument
+                if inst is not None:
+                    inst.count("mov", 2*(k + width))
+
+            # instrument
+            if inst is not None:
+                inst.count("cmp", dim - c + 1)
+
+            # if the pivot is negligible
+            if abs(panel[c, jj]) <= et:
+                # display
+                if debug:
+                    print("Matrix is singular")
+
+                return None, None, ops, "Matrix is singular"
+
+            # elimination step
+            panel[c + 1:, jj] /= panel[c, jj]
+            panel[c + 1:, jj + 1:] -= np.outer(panel[c + 1:, jj], panel[c, jj + 1:])
+
+            # update operations
+            ops += (dim - c - 1)*(2*(width - jj - 1) + 1)
+
+            # instrument
+            if inst is not None:
+                inst.count("div", dim - c - 1)
+                inst.count("add", (dim - c - 1)*(width - jj - 1))
+                inst.count("mul", (dim - c - 1)*(width - jj - 1))
+
+        # write back the panel
+        LU[:, cols] = panel
+
+        # display
+        if debug:
+            print("\nPanel #{k}\n-------------------".format(k=k//tile))
+            print("Columns:\t{start} to {stop}".format(start=k, stop=cols.stop - 1))
+
+    LU.flush()
+
+    # instrument
+    if inst is not None:
+        inst.lap("factor")
+
+    return path_LU, p.tolist(), ops, "Factors obtained"
+
+def get_solution_tiled(path_LU, p, b, tile, debug, inst=None):
+    """
+    Obtain the solution for a given system of linear equations represented as A*x = b from the packed factors of A[p] stored on disk by `get_LU_tiled`.
+
+    The triangular solves stream the factors in tiles of tile*tile elements, hence only the vectors are kept in memory.
+
+    Parameters
+    ----------
+    path_LU : String
+        Path of the `.npy` file of the packed factors.
+    p : list (int)
+        Row permutation.
+    b : list (float) or numpy.ndarray
+        Given constant vector.
+    tile : int
+        Number of rows and columns of each streamed tile.
+    debug : boolean
+        Option to display steps.
+    inst : Instrument (optional)
+        Instrument to count the operations by category and time the phases.
+
+    Returns
+    -------
+    x, ops, msg : numpy.ndarray, int, String
+        The solution with the operation count and status string.
+    """
+
+    # initialize values
+    LU = np.load(path_LU, mmap_mode='r')
+    dim = len(LU)                       # number of variables
+
+    # if diagonal element of U is zero
+    if any(np.any(np.diagonal(LU[i:i + tile, i:i + tile]) == 0) for i in range(0, dim, tile)):
+        return None, 0, "Matrix is singular"
+
+    # permuted constant vector
+    x = np.asarray(b, dtype=np.float64)[p]
+
+    # instrument
+    if inst is not None:
+        inst.mark()
+
+    # solution of L
+    for i in range(0, dim, tile):
+        rows = slice(i, min(i + tile, dim))
+        for j in range(0, i, tile):
+            x[rows] -= LU[rows, j:j + tile] @ x[j:j + tile]
+        T = np.array(LU[rows, rows])
+        for ii in range(1, len(T)):
+            x[i + ii] -= T[ii, :ii] @ x[i:i + ii]
+
+    # solution of U
+    for i in range((dim - 1)//tile*tile, -1, -tile):
+        rows = slice(i, min(i + tile, dim))
+        for j in range(rows.stop, dim, tile):
+            x[rows] -= LU[rows, j:j + tile] @ x[j:j + tile]
+        T = np.array(LU[rows, rows])
+        for ii in range(len(T) - 1, -1, -1):
+            x[i + ii] = (x[i + ii] - T[ii, ii + 1:] @ x[i + ii + 1:rows.stop])/T[ii, ii]
+
+    # instrument
+    if inst is not None:
+        inst.count("add", dim*(dim - 1))
+        inst.count("mul", dim*(dim - 1))
+        inst.count("div", dim)
+        inst.lap("substitute")
+
+    # display
+    if debug:
+        print("\nSolution of LU\n-------------------")
+        print("Vector x:\t{x}".format(x=x.tolist()))
+
+    return x, dim*(dim + 1), "Solution obtained"
+
+def get_LU_Cholesky(A, debug, trace=None, inst=None):
+    """
+    Obtain the Lower-Triangular matrix of a symmetric positive definitive matrix using Cholesky Decomposition.
+
+    Only the lower triangle of the matrix is read, hence a matrix in packed symmetric storage is accepted.
+
+    Parameters
+    ----------
+    A : list or PackedSymmetric
+        Given matrix.
+    debug : boolean
+        Option to display steps.
+    trace : Trace (optional)
+        Trace to record the steps.
+    inst : Instrument (optional)
+        Instrument to count the operations by category and time the phases.
+
+    Returns
+    -------
+    L, U, ops : list, list, int
+        The lower-triangular and upper-triangular matrices along with the operation count.
+    """
+
+    # initialize values
+    ops = 0                             # number of operations
+    dim = len(A)                        # number of variables
+    # lower-triangular matrix
+    L = [[0 for j in range(dim)] for i in range(dim)]
+
+    # for each row
+    for k in range(dim):
+        # for each element of the row other than the k-th element
+        for i in range(k):
+            prod_sum = 0
+            # find the sum of previous elements of that row 
+            # multiplied by previous elements of k-th row
+            for j in range(i):
+                prod_sum += L[i][j]*L[k][j]
+
+                # update operations
+                ops += 1
+
+            # update that element
+            L[k][i] = (A[k][i] - prod_sum)/L[i][i]
+
+            # update operations 
+            ops += 2
+
+        sq_sum = 0
+        # find the sum of squares of elements in the k-th row
+        # other than the k-th element 
+        for j in range(k):
+            sq_sum += L[k][j]**2
+
+            # update operations 
+            ops += 1
+        
+        # update the k-th element
+        L[k][k] = math.sqrt(A[k][k] - sq_sum)
+
+        # instrument
+        if inst is not None:
+            inst.count("add", k*(k + 1)//2 + k + 1)
+            inst.count("mul", k*(k - 1)//2 + k)
+            inst.count("div", k)
+            inst.count("sqrt", 1)
+
+        # record
+        if trace is not None:
+            trace.record("formation", k, k, k, L[k][k])
+
+    # display
+    if debug:
+        print("Matrix L:\t{L}".format(L=L))
+
+    # upper-triangular matrix
+    U = [[L[j][i] for j in range(dim)] for i in range(dim)]
+
+    return L, U, ops
+
+def get_solution_Cholesky(A, b, debug, trace=None, inst=None):
+    """
+    Obtain the solution for a given system of linear equations represented as A*x = b where A is a symmetric positive definite matrix using Cholesky Decomposition.
+
+    Parameters
+    ----------
+    A : list (list (float)) or PackedSymmetric
+        Given matrix.
+    b : list (float) or list (list (float)) or numpy.ndarray
+        Given constant vector, or constant matrix of n rows solved using `get_solution_L_block` and `get_solution_U_block`.
+    debug : boolean
+        Option to display steps.
+    trace : Trace (optional)
+        Trace to record the steps.
+    inst : Instrument (optional)
+        Instrument to count the operations by category and time the phases.
+
+    Returns
+    -------
+    sol, ops, msg : list (float) or numpy.ndarray, int, String
+        The solution and the operation count with error string.
+    """
+
+    # initialize values
+    t_ops = 0                           # total number of operations
+
+    # display
+    if debug:
+        print("Input\n-------")
+        print("Matrix A:\t{A}".format(A=A))
+        print("Vector b:\t{B}".format(B=b))
+
+    # instrument
+    if inst is not None:
+        inst.mark()
+
+    # get L and U
+    L, U, ops = get_LU_Cholesky(A, debug, trace, inst)
+    t_ops += ops
+
+    # instrument
+    if inst is not None:
+        inst.lap("factor")
+
+    # get solution of L and U for a block of constant vectors
+    if np.ndim(b) == 2:
+        y, ops = get_solution_L_block(L, b, debug, inst=inst)
+        t_ops += ops
+        x, ops = get_solution_U_block(U, y, debug, inst=inst)
+        t_ops += ops
+    else:
+        # get solution of L
+        y, ops = get_solution_L(L, b, debug, inst)
+        t_ops += ops
+        # get solution of U
+        x, ops = get_solution_U(U, y, debug, inst)
+        t_ops += ops
+
+    # instrument
+    if inst is not None:
+        inst.lap("substitute")
+
+    return x, t_ops, "Solution obtained"
+
+def get_band(A, width):
+    """
+    Obtain the lower band of a symmetric banded matrix in band storage.
+
+    Parameters
+    ----------
+    A : list (list (float)) or numpy.ndarray or PackedSymmetric
+        Given matrix.
+    width : int
+        Number of non-zero sub-diagonals.
+
+    Returns
+    -------
+    A_b : numpy.ndarray
+        The band of n rows and width + 1 columns such that A_b[k, d] is the element (k, k - d), zero outside the matrix.
+    """
+
+    # initialize values
+    dim = len(A)                        # number of variables
+    A_b = np.zeros((dim, width + 1))
+
+    # sub-diagonals of a numpy.ndarray
+    if isinstance(A, np.ndarray):
+        for d in range(min(width, dim - 1) + 1):
+            A_b[d:, d] = np.diagonal(A, -d)
+
+        return A_b
+
+    # elements of the band of each row
+    for k in range(dim):
+        for d in range(min(width, k) + 1):
+            A_b[k, d] = A[k][k - d]
+
+    return A_b
+
+def get_LU_Cholesky_banded(A, width, debug, trace=None, inst=None):
+    """
+    Obtain the Lower-Triangular matrix of a symmetric positive definite banded matrix in band storage using Banded Cholesky Decomposition.
+
+    The factor of a banded matrix has the same band, hence only the elements within the band are read and stored, using O(n*width) memory, and the decomposition costs O(n*width^2) operations.
+
+    Parameters
+    ----------
+    A : list (list (float)) or numpy.ndarray or PackedSymmetric
+        Given matrix, of which only the lower band is read.
+    width : int
+        Number of non-zero sub-diagonals.
+    debug : boolean
+        Option to display steps.
+    trace : Trace (optional)
+        Trace to record the steps.
+    inst : Instrument (optional)
+        Instrument to count the operations by category and time the phases.
+
+    Returns
+    -------
+    L, ops : numpy.ndarray, int
+        The lower-triangular matrix in band storage such that L[k, d] is the element (k, k - d), along with the operation count. The matrix is None if the given matrix is not positive definite.
+    """
+
+    # initialize values
+    ops = 0                             # number of operations
+    L = get_band(A, width)              # band of the lower-triangular matrix
+    dim = len(L)                        # number of variables
+
+    # for each row
+    for k in range(dim):
+        lo = max(0, k - width)
+
+        # for each element of the row within the band other than the k-th element
+        for i in range(lo, k):
+            # elements (i, lo:i) and (k, lo:i) of the band
+            L[k, k - i] = (L[k, k - i] - L[i, i - lo:0:-1] @ L[k, k - lo:k - i:-1])/L[i, 0]
+
+        # update the k-th element
+        sq = L[k, 0] - L[k, 1:k - lo + 1] @ L[k, 1:k - lo + 1]
+
+        # update operations
+        ops += (k - lo)*(k - lo + 1) + 2*(k - lo) + 1
+
+        # instrument
+        if inst is not None:
+            inst.count("add", (k - lo)*(k - lo + 1)//2 + k - lo + 1)
+            inst.count("mul", (k - lo)*(k - lo - 1)//2 + k - lo)
+            inst.count("div", k - lo)
+            inst.count("cmp", 1)
+
+        # if matrix is not positive definite
+        if sq <= 0:
+            return None, ops
+
+        L[k, 0] = math.sqrt(sq)
+
+        # instrument
+        if inst is not None:
+            inst.count("sqrt", 1)
+
+        # record
+        if trace is not None:
+            trace.record("formation", k, k, k, L[k, 0])
+
+    # display
+    if debug:
+        print("Band of L:\t{L}".format(L=L.tolist()))
+
+    return L, ops
+
+def get_solution_banded(L, B, debug, inst=None):
+    """
+    Obtain the solution for a given system of linear equations represented as L*L^T*X = B from the Lower-Triangular matrix in band storage.
+
+    Parameters
+    ----------
+    L : numpy.ndarray
+        Lower-triangular matrix in band storage such that L[k, d] is the element (k, k - d).
+    B : numpy.ndarray
+        Given constant matrix of n rows.
+    debug : boolean
+        Option to display steps.
+    inst : Instrument (optional)
+        Instrument to count the operations by category and time the phases.
+
+    Returns
+    -------
+    X, ops : numpy.ndarray, int
+        The solution with the operation count.
+    """
+
+    # initialize values
+    dim, width = L.shape[0], L.shape[1] - 1
+    Y = np.zeros(B.shape)
+    X = np.zeros(B.shape)
+
+    # solution of L
+    for k in range(dim):
+        lo = max(0, k - width)
+        Y[k] = (B[k] - L[k, k - lo:0:-1] @ Y[lo:k])/L[k, 0]
+
+    # solution of L^T with the elements (k + d, k) of column k
+    for k in range(dim - 1, -1, -1):
+        hi = min(dim, k + width + 1)
+        X[k] = (Y[k] - L[np.arange(k + 1, hi), np.arange(1, hi - k)] @ X[k + 1:hi])/L[k, 0]
+
+    # update operations
+    nnz = get_band_count(dim, width)
+    ops = 2*B.shape[1]*nnz
+
+    # instrument
+    if inst is not None:
+        inst.count("add", B.shape[1]*nnz)
+        inst.count("mul", B.shape[1]*(nnz - dim))
+        inst.count("div", B.shape[1]*2*dim)
+
+    # display
+    if debug:
+        print("\nSolution of L and L^T\n-------------------")
+        print("Matrix X:\t{X}".format(X=X.tolist()))
+
+    return X, ops
+
+def get_solution_Cholesky_banded(A, b, width, debug, trace=None, inst=None):
+    """
+    Obtain the solution for a given system of linear equations represented as A*x = b where A is a symmetric positive definite banded matrix using Banded Cholesky Decomposition.
+
+    Parameters
+    ----------
+    A : list (list (float)) or numpy.ndarray or PackedSymmetric
+        Given matrix, of which only the lower band is read.
+    b : list (float) or list (list (float)) or numpy.ndarray
+        Given constant vector, or constant matrix of n rows.
+    width : int
+        Number of non-zero sub-diagonals.
+    debug : boolean
+        Option to display steps.
+    trace : Trace (optional)
+        Trace to record the steps.
+    inst : Instrument (optional)
+        Instrument to count the operations by category and time the phases.
+
+    Returns
+    -------
+    sol, ops, msg : numpy.ndarray, int, String
+        The solution and the operation count with error string.
+    """
+
+    # initialize values
+    t_ops = 0                           # total number of operations
+    b = np.asarray(b, dtype=float)
+
+    # display
+    if debug:
+        print("Input\n-------")
+        print("Width:\t{width}".format(width=width))
+        print("Vector b:\t{B}".format(B=b.tolist()))
+
+    # instrument
+    if inst is not None:
+        inst.mark()
+
+    # get band of L
+    L, ops = get_LU_Cholesky_banded(A, width, debug, trace, inst)
+    t_ops += ops
+
+    # if matrix is not positive definite
+    if L is None:
+        return None, t_ops, "Matrix is not positive definite"
+
+    # instrument
+    if inst is not None:
+        inst.lap("factor")
+
+    # get solution of L and L^T within the band
+    x, ops = get_solution_banded(L, b.reshape(len(b), -1), debug, inst)
+    t_ops += ops
+
+    # instrument
+    if inst is not None:
+        inst.lap("substitute")
+
+    return x.reshape(b.shape), t_ops, "Solution obtained"
+
+def get_LDL(A, debug, trace=None, inst=None):
+    """
+    Obtain the Lower-Triangular and Block-Diagonal matrices of a symmetric matrix using LDL Decomposition with Bunch-Kaufman Pivoting such that A[p][:, p] = L*D*L^T.
+
+    The diagonal blocks of D are of size 1 or 2, hence indefinite matrices are decomposed stably without square roots. The trailing matrix stays symmetric, hence only its lower triangle is swapped, read and updated column by column, and the decomposition costs about n^3/3 operations.
+
+    Parameters
+    ----------
+    A : list (list (float)) or numpy.ndarray or PackedSymmetric
+        Given symmetric matrix.
+    debug : boolean
+        Option to display steps.
+    trace : Trace (optional)
+        Trace to record the steps.
+    inst : Instrument (optional)
+        Instrument to count the operations by category and time the phases.
+
+    Returns
+    -------
+    L, D, p, ops : numpy.ndarray, numpy.ndarray, list (int), int
+        The lower-triangular matrix with ones on the diagonal, the block-diagonal matrix and the symmetric permutation along with the operation count.
+    """
+
+    # initialize values
+    ops = 0                             # number of operations
+    A = np.array(A, dtype=float)
+    dim = len(A)                        # number of variables
+    p = list(range(dim))                # symmetric permutation
+    L = np.eye(dim)
+    D = np.zeros((dim, dim))
+    # threshold minimizing the growth of the elements
+    alpha = (1 + math.sqrt(17))/8
+
+    k = 0
+    while k < dim:
+        # largest off-diagonal element of the column
+        abs_kk = abs(A[k, k])
+        if k < dim - 1:
+            index = k + 1 + int(np.argmax(np.abs(A[k + 1:, k])))
+            col_max = abs(A[index, k])
+        else:
+            index, col_max = k, 0
+
+        # update operations
+        ops += dim - k
+
+        # select 1x1 or 2x2 pivot
+        size, index_p = 1, k
+        if abs_kk < alpha*col_max:
+            # largest off-diagonal element of the row of the candidate
+            row_max = max(np.max(np.abs(A[index, k:index])), np.max(np.abs(A[index + 1:, index]), initial=0))
+
+            # update operations
+            ops += dim - k
+
+            if abs_kk*row_max < alpha*col_max*col_max:
+                if abs(A[index, index]) >= alpha*row_max:
+                    index_p = index
+                else:
+                    size, index_p = 2, index
+
+        # instrument
+        if inst is not None:
+            inst.count("cmp", (dim - k)*(1 if index_p == k and size == 1 else 2) + 3)
+
+        # swap rows and columns within the lower triangle of the trailing matrix
+        kk = k + size - 1
+        if index_p != kk:
+            A[[kk, index_p], k:kk] = A[[index_p, kk], k:kk]
+            A[index_p + 1:, [kk, index_p]] = A[index_p + 1:, [index_p, kk]]
+            A[kk + 1:index_p, kk], A[index_p, kk + 1:index_p] = A[index_p, kk + 1:index_p].copy(), A[kk + 1:index_p, kk].copy()
+            A[kk, kk], A[index_p, index_p] = A[index_p, index_p], A[kk, kk]
+            L[[kk, index_p], :k] = L[[index_p, kk], :k]
+            p[kk], p[index_p] = p[index_p], p[kk]
+
+            # record
+            if trace is not None:
+                trace.record("swap", k, index_p, kk)
+
+            # instrument
+            if inst is not None:
+                inst.count("mov", 2*dim)
+
+        # remaining variables
+        m = dim - k - size
+
+        # 1x1 pivot
+        if size == 1:
+            D[k, k] = A[k, k]
+            if A[k, k] != 0:
+                L[k + 1:, k] = A[k + 1:, k]/A[k, k]
+                for j in range(k + 1, dim):
+                    A[j:, j] -= L[j:, k]*A[j, k]
+
+            # update operations
+            ops += m + m*(m + 1)
+
+            # instrument
+            if inst is not None:
+                inst.count("div", m)
+                inst.count("add", m*(m + 1)//2)
+                inst.count("mul", m*(m + 1)//2)
+
+        # 2x2 pivot
+        else:
+            E = np.array([[A[k, k], A[k + 1, k]], [A[k + 1, k], A[k + 1, k + 1]]])
+            det = E[0, 0]*E[1, 1] - E[1, 0]*E[1, 0]
+            E_inv = np.array([[E[1, 1], -E[1, 0]], [-E[1, 0], E[0, 0]]])/det
+            C = A[k + 2:, k:k + 2].copy()
+            D[k:k + 2, k:k + 2] = E
+            L[k + 2:, k:k + 2] = C @ E_inv
+            for j in range(k + 2, dim):
+                A[j:, j] -= L[j:, k:k + 2] @ C[j - k - 2]
+
+            # update operations
+            ops += 10 + 6*m + 2*m*(m + 1)
+
+            # instrument
+            if inst is not None:
+                inst.count("div", 4)
+                inst.count("add", 1 + 2*m + m*(m + 1))
+                inst.count("mul", 2 + 4*m + m*(m + 1))
+
+        # record
+        if trace is not None:
+            trace.record("elimination", k, k, size, abs(A[k, k]))
+
+        # display
+        if debug:
+            print("\nFormation step #{k}\n-------------------".format(k=k))
+            print("Pivot size:\t{size}".format(size=size))
+            print("Matrix L:\t{L}".format(L=L.tolist()))
+
+        k += size
+
+    # display
+    if debug:
+        print("Matrix D:\t{D}".format(D=D.tolist()))
+
+    return L, D, p, ops
+
+def get_solution_factors_LDL(L, D, p, b, debug, inst=None):
+    """
+    Obtain the solution for a given system of linear equations represented as A*x = b from the Lower-Triangular and Block-Diagonal matrices of A[p][:, p].
+
+    Parameters
+    ----------
+    L : numpy.ndarray
+        Lower-triangular matrix with ones on the diagonal.
+    D : numpy.ndarray
+        Block-diagonal matrix with blocks of size 1 or 2.
+    p : list (int)
+        Symmetric permutation.
+    b : list (float) or list (list (float)) or numpy.ndarray
+        Given constant vector, or constant matrix of n rows.
+    debug : boolean
+        Option to display steps.
+    inst : Instrument (optional)
+        Instrument to count the operations by category and time the phases.
+
+    Returns
+    -------
+    x, ops : numpy.ndarray, int
+        The solution with the operation count.
+    """
+
+    # initialize values
+    ops = 0                             # number of operations
+    dim = len(L)                        # number of variables
+    b = np.asarray(b, dtype=float)
+    # permuted constant matrix
+    B = b[p].reshape(dim, -1)
+
+    # solution of L
+    Z, ops_L = get_solution_L_block(L, B, debug, inst=inst)
+    ops += ops_L
+
+    # solution of D by blocks
+    i = 0
+    while i < dim:
+        if i < dim - 1 and D[i + 1, i] != 0:
+            Z[i:i + 2] = np.linalg.solve(D[i:i + 2, i:i + 2], Z[i:i + 2])
+            ops += 6*len(Z[0]) + 4
+            i += 2
+        else:
+            Z[i] /= D[i, i]
+            ops += len(Z[0])
+            i += 1
+
+    # solution of L^T
+    W, ops_U = get_solution_U_block(L.T, Z, debug, inst=inst)
+    ops += ops_U
+
+    # reverse permutation
+    X = np.zeros_like(W)
+    X[p] = W
+
+    # display
+    if debug:
+        print("\nSolution of LDL\n-------------------")
+        print("Vector x:\t{x}".format(x=X.tolist()))
+
+    return X.reshape(b.shape), ops
+
+def get_solution_LDL(A, b, debug, trace=None, inst=None):
+    """
+    Obtain the solution for a given system of linear equations represented as A*x = b where A is a symmetric matrix using LDL Decomposition with Bunch-Kaufman Pivoting.
+
+    Parameters
+    ----------
+    A : list (list (float)) or numpy.ndarray
+        Given symmetric matrix, possibly indefinite.
+    b : list (float) or list (list (float)) or numpy.ndarray
+        Given constant vector, or constant matrix of n rows.
+    debug : boolean
+        Option to display steps.
+    trace : Trace (optional)
+        Trace to record the steps.
+    inst : Instrument (optional)
+        Instrument to count the operations by category and time the phases.
+
+    Returns
+    -------
+    sol, ops, msg : numpy.ndarray, int, String
+        The solution and the operation count with error string.
+    """
+
+    # initialize values
+    t_ops = 0                           # total number of operations
+
+    # display
+    if debug:
+        print("Input\n-------")
+        print("Matrix A:\t{A}".format(A=np.asarray(A).tolist()))
+        print("Vector b:\t{B}".format(B=np.asarray(b).tolist()))
+
+    # instrument
+    if inst is not None:
+        inst.mark()
+
+    # get L and D
+    L, D, p, ops = get_LDL(A, debug, trace, inst)
+    t_ops += ops
+
+    # instrument
+    if inst is not None:
+        inst.lap("factor")
+
+    # if a pivot is zero
+    i = 0
+    while i < len(D):
+        size = 2 if i < len(D) - 1 and D[i + 1, i] != 0 else 1
+        if size == 1 and D[i, i] == 0:
+            return None, t_ops, "Matrix is singular"
+        i += size
+
+    # get solution of L, D and L^T
+    x, ops = get_solution_factors_LDL(L, D, p, b, debug, inst)
+    t_ops += ops
+
+    # instrument
+    if inst is not None:
+        inst.lap("substitute")
+
+    return x, t_ops, "Solution obtained"
+
+def get_LU_incomplete(A, debug, inst=None):
+    """
+    Obtain the Lower-Triangular and Upper-Triangular matrices of a given matrix using Incomplete LU Decomposition with ones in L and no fill-in (ILU(0)).
+
+    Parameters
+    ----------
+    A : list (list (float)) or numpy.ndarray
+        Given matrix.
+    debug : boolean
+        Option to display steps.
+    inst : Instrument (optional)
+        Instrument to count the operations by category.
+
+    Returns
+    -------
+    L, U, ops : list, list, int
+        The lower-triangular and upper-triangular matrices along with the operation count, or None for the matrices if a diagonal element of U is zero.
+    """
+
+    # initialize values
+    ops = 0                             # number of operations
+    LU = np.array(A, dtype=float)
+    dim = len(LU)                       # number of variables
+    pattern = LU != 0                   # sparsity pattern of the matrix
+
+    # for each row
+    for i in range(1, dim):
+        # for each non-zero element left of the diagonal
+        for k in np.flatnonzero(pattern[i, :i]):
+            # if diagonal element is zero
+            if LU[k, k] == 0:
+                return None, None, ops
+
+            LU[i, k] /= LU[k, k]
+
+            # eliminate only within the sparsity pattern
+            mask = pattern[i, k + 1:]
+            LU[i, k + 1:][mask] -= LU[i, k]*LU[k, k + 1:][mask]
+
+            # update operations
+            ops += 1 + int(mask.sum())
+
+            # instrument
+            if inst is not None:
+                inst.count("div", 1)
+                inst.count("add", int(mask.sum()))
+                inst.count("mul", int(mask.sum()))
+                inst.count("cmp", 1)
+
+        # display
+        if debug:
+            print("\nFormation step #{i}\n-------------------".format(i=i))
+            print("Matrix LU:\t{LU}".format(LU=LU.tolist()))
+
+    # lower-triangular matrix
+    L = (np.tril(LU, -1) + np.eye(dim)).tolist()
+    # upper-triangular matrix
+    U = np.triu(LU).tolist()
+
+    return L, U, ops
+
+def get_preconditioner_ILU(A, debug):
+    """
+    Obtain the Incomplete LU (ILU(0)) preconditioner of a given coefficient matrix.
+
+    Parameters
+    ----------
+    A : list (list (float)) or numpy.ndarray
+        Given coefficient matrix.
+    debug : boolean
+        Option to display steps.
+
+    Returns
+    -------
+    M, ops, msg : function, int, String
+        The function returning the preconditioned vector for a given vector with the operation count and status string.
+    """
+
+    # get L and U
+    L, U, ops = get_LU_incomplete(A, debug)
+
+    # if diagonal element is zero
+    if L is None or np.any(np.diagonal(U) == 0):
+        return None, ops, "Diagonal element of U is zero"
+
+    L = np.array(L)
+    U = np.array(U)
+    dim = len(L)                        # number of variables
+
+    def M(r):
+        # solution of L
+        y = np.zeros(dim)
+        for i in range(dim):
+            y[i] = r[i] - L[i, :i] @ y[:i]
+
+        # solution of U
+        z = np.zeros(dim)
+        for i in range(dim - 1, -1, -1):
+            z[i] = (y[i] - U[i, i + 1:] @ z[i + 1:])/U[i, i]
+
+        return z
 
-    return x, t_ops, "Solution obtained"
\ No newline at end of file
+    return M, ops, "Preconditioner obtained"
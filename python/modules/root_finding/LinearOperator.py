@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Authors: Sampreet Kalita
+# Created: 2026-10-19
+# Updated: 2026-10-19
+
+"""Module to represent coefficient matrices implicitly by their action on vectors."""
+
+# dependencies
+import numpy as np
+
+class LinearOperator():
+    """
+    Class to represent a square coefficient matrix by its matrix-vector product, its diagonal and optionally its rows, without storing the matrix.
+
+    The iterative solvers of the Jacobi and Gauss-Seidel modules accept an operator in place of the coefficient matrix. The Jacobi and Multicolor Gauss-Seidel Iteration Methods need only the products and the diagonal, while the lexicographic Gauss-Seidel Iteration Method and the detection of a coloring need the rows.
+
+    Parameters
+    ----------
+    dim : int
+        Number of variables.
+    matvec : function
+        Function returning the product A*v as a numpy.ndarray for a given numpy.ndarray v.
+    diagonal : list (float) or numpy.ndarray or function
+        Diagonal elements of the matrix, or a function returning them.
+    row : function (optional)
+        Function returning the column indices and the values of the non-zero elements (including the diagonal) of a given row as two numpy.ndarray.
+    ops : int (optional)
+        Number of operations per product, counted as one multiplication and one addition per non-zero element. If not provided, it is taken as 2*dim.
+    """
+
+    def __init__(self, dim, matvec, diagonal, row=None, ops=None):
+        """Class constructor for LinearOperator."""
+
+        self.dim = int(dim)
+        self.matvec = matvec
+        self.diagonal = diagonal
+        self.row = row
+        self.ops = 2*self.dim if ops is None else int(ops)
+
+    def __call__(self, v):
+        """Obtain the product A*v so that the operator serves as a matrix-vector product function."""
+
+        return self.matvec(v)
+
+    def __len__(self):
+        """Obtain the number of variables."""
+
+        return self.dim
+
+    def get_diagonal(self):
+        """
+        Obtain the diagonal elements.
+
+        Returns
+        -------
+        diag : numpy.ndarray
+            The diagonal elements of the matrix.
+        """
+
+        return np.asarray(self.diagonal() if callable(self.diagonal) else self.diagonal, dtype=float)
+
+    def get_row(self, i):
+        """
+        Obtain the non-zero elements of a row.
+
+        Parameters
+        ----------
+        i : int
+            Index of the row.
+
+        Returns
+        -------
+        indices, values : numpy.ndarray, numpy.ndarray
+            The column indices and the values of the non-zero elements including the diagonal.
+        """
+
+        return self.row(i)
+
+def get_operator(A):
+    """
+    Obtain the linear operator of a given dense matrix or sparse matrix with row access.
+
+    Parameters
+    ----------
+    A : list (list (float)) or numpy.ndarray or sparse matrix
+        Given coefficient matrix. A sparse matrix should provide `nnz`, `diagonal()` and `getrow(i)` as the CSR matrices of SciPy do.
+
+    Returns
+    -------
+    op : LinearOperator
+        The linear operator of the matrix.
+    """
+
+    # sparse matrix
+    if hasattr(A, 'nnz'):
+        def row(i):
+            R = A.getrow(i)
+            return R.indices, R.data
+
+        return LinearOperator(A.shape[0], lambda v: A @ v, A.diagonal(), row, 2*A.nnz)
+
+    # dense matrix
+    A = np.asarray(A, dtype=float)
+
+    def row(i):
+        indices = np.flatnonzero(A[i])
+        return indices, A[i, indices]
+
+    return LinearOperator(len(A), lambda v: A @ v, A.diagonal(), row, 2*A.size)
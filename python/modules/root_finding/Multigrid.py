@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Authors: Sampreet Kalita
+# Created: 2026-10-19
+# Updated: 2026-10-19
+
+"""Module to obtain solutions of the Poisson equation on structured grids using Geometric Multigrid Method."""
+
+# dependencies
+import numpy as np
+
+from modules.root_finding import GaussianElimination, GaussSeidelIteration, JacobiIteration
+
+def get_laplacian(U, h):
+    """
+    Obtain the negative discrete Laplacian of a grid function with zero Dirichlet boundary values using the second-order central difference stencil.
+
+    Parameters
+    ----------
+    U : numpy.ndarray
+        Values of the grid function at the interior points of a 1D, 2D or 3D grid.
+    h : float
+        Grid spacing.
+
+    Returns
+    -------
+    AU : numpy.ndarray
+        Values of the negative Laplacian at the interior points.
+    """
+
+    # central element of the stencil
+    AU = 2*U.ndim*U
+
+    # subtract neighbours along each axis
+    for axis in range(U.ndim):
+        V = np.moveaxis(U, axis, 0)
+        N = np.zeros(V.shape)
+        N[1:] += V[:-1]
+        N[:-1] += V[1:]
+        AU = AU - np.moveaxis(N, 0, axis)
+
+    return AU/h**2
+
+def get_restriction(R):
+    """
+    Restrict a grid function to the next coarser grid using Full Weighting.
+
+    Parameters
+    ----------
+    R : numpy.ndarray
+        Values at the interior points of the fine grid with 2*n + 1 points along each axis.
+
+    Returns
+    -------
+    R_c : numpy.ndarray
+        Values at the interior points of the coarse grid with n points along each axis.
+    """
+
+    # apply the one-dimensional weights [1, 2, 1]/4 along each axis
+    for axis in range(R.ndim):
+        R = np.moveaxis(R, axis, 0)
+        R = (R[0:-2:2] + 2*R[1:-1:2] + R[2::2])/4
+        R = np.moveaxis(R, 0, axis)
+
+    return R
+
+def get_prolongation(E):
+    """
+    Prolongate a grid function to the next finer grid using Linear Interpolation.
+
+    Parameters
+    ----------
+    E : numpy.ndarray
+        Values at the interior points of the coarse grid with n points along each axis.
+
+    Returns
+    -------
+    E_f : numpy.ndarray
+        Values at the interior points of the fine grid with 2*n + 1 points along each axis.
+    """
+
+    # interpolate along each axis
+    for axis in range(E.ndim):
+        E = np.moveaxis(E, axis, 0)
+        P = np.pad(E, [(1, 1)] + [(0, 0)]*(E.ndim - 1))
+        E_f = np.zeros((2*E.shape[0] + 1, ) + E.shape[1:])
+        E_f[1::2] = E
+        E_f[0::2] = (P[:-1] + P[1:])/2
+        E = np.moveaxis(E_f, 0, axis)
+
+    return E
+
+def get_solution_coarse(F, h, inst=None):
+    """
+    Obtain the solution on the coarsest grid using Gaussian Elimination Method with Scaled Partial Pivoting.
+
+    Parameters
+    ----------
+    F : numpy.ndarray
+        Values of the source at the interior points of the coarsest grid.
+    h : float
+        Grid spacing of the coarsest grid.
+    inst : Instrument (optional)
+        Instrument to count the operations by category and time the phases.
+
+    Returns
+    -------
+    U, ops : numpy.ndarray, int
+        The solution at the interior points with the operation count.
+    """
+
+    # assemble the coefficient matrix column-wise
+    dim = F.size
+    A = [[0.0 for j in range(dim)] for i in range(dim)]
+    for j in range(dim):
+        e = np.zeros(dim)
+        e[j] = 1.0
+        col = get_laplacian(e.reshape(F.shape), h).ravel()
+        for i in range(dim):
+            A[i][j] = col[i]
+
+    # solve directly
+    sol, ops, msg = GaussianElimination.get_solution_pivot(A, F.ravel().tolist(), False, inst=inst)
+
+    return np.array(sol).reshape(F.shape), ops
+
+def get_cycle(F, U, h, gamma, smoother, nu_1, nu_2, inst=None):
+    """
+    Perform a single multigrid cycle for the Poisson equation on a given grid.
+
+    Parameters
+    ----------
+    F : numpy.ndarray
+        Values of the source at the interior points.
+    U : numpy.ndarray
+        Current values of the solution at the interior points.
+    h : float
+        Grid spacing.
+    gamma : int
+        Number of recursive coarse-grid corrections, 1 for V-cycle and 2 for W-cycle.
+    smoother : String
+        Smoother to use, either "Jacobi" or "GaussSeidel".
+    nu_1 : int
+        Number of pre-smoothing sweeps.
+    nu_2 : int
+        Number of post-smoothing sweeps.
+    inst : Instrument (optional)
+        Instrument to count the operations by category and time the phases.
+
+    Returns
+    -------
+    U, ops : numpy.ndarray, int
+        The updated solution with the operation count.
+    """
+
+    # initialize values
+    ops = 0                             # number of operations
+    size = U.size                       # number of grid points
+    ops_mv = (2*U.ndim + 2)*size        # operations per Laplacian
+
+    # coarsest grid
+    if min(U.shape) <= 3:
+        U, ops = get_solution_coarse(F, h, inst)
+
+        # instrument
+        if inst is not None:
+            inst.lap("coarse")
+
+        return U, ops
+
+    # diagonal element of the stencil
+    diag = 2*U.ndim/h**2
+    A = lambda V: get_laplacian(V, h)
+
+    # red-black coloring of the grid
+    parity = np.indices(U.shape).sum(axis=0) % 2
+    masks = [parity == 0, parity == 1]
+
+    def smooth(U, nu):
+        ops = 0
+        for i in range(nu):
+            if smoother == "Jacobi":
+                U, ops_sweep = JacobiIteration.get_sweep_weighted(A, diag, F, U, 2*U.ndim/(2*U.ndim + 1))
+                ops += ops_mv
+
+                # instrument
+                if inst is not None:
+                    inst.count("add", (2*U.ndim + 2)*size)
+                    inst.count("mul", 2*size)
+                    inst.count("div", 2*size)
+            else:
+                U, ops_sweep = GaussSeidelIteration.get_sweep_multicolor(A, diag, F, U, masks, 1.0)
+                ops += 2*ops_mv
+
+                # instrument
+                if inst is not None:
+                    inst.count("add", (4*U.ndim + 3)*size)
+                    inst.count("mul", 3*size)
+                    inst.count("div", 3*size)
+            ops += ops_sweep
+        return U, ops
+
+    # instrument
+    if inst is not None:
+        inst.mark()
+
+    # pre-smoothing
+    U, ops_sm = smooth(U, nu_1)
+    ops += ops_sm
+
+    # instrument
+    if inst is not None:
+        inst.lap("smooth")
+
+    # restrict residual to coarse grid
+    R_c = get_restriction(F - A(U))
+    ops += ops_mv + 2*size
+
+    # instrument
+    if inst is not None:
+        inst.count("add", (2*U.ndim + 2)*size)
+        inst.count("mul", size)
+        inst.count("div", size)
+        inst.lap("restrict")
+
+    # recursive coarse-grid correction
+    E_c = np.zeros(R_c.shape)
+    for i in range(gamma):
+        E_c, ops_c = get_cycle(R_c, E_c, 2*h, gamma, smoother, nu_1, nu_2, inst)
+        ops += ops_c
+
+    # prolongate correction to fine grid
+    U = U + get_prolongation(E_c)
+    ops += 2*size
+
+    # instrument
+    if inst is not None:
+        inst.count("add", size)
+        inst.count("div", size)
+        inst.lap("prolongate")
+
+    # post-smoothing
+    U, ops_sm = smooth(U, nu_2)
+    ops += ops_sm
+
+    # instrument
+    if inst is not None:
+        inst.lap("smooth")
+
+    return U, ops
+
+def get_solution_Poisson(F, h, U, cycle, smoother, nu, imax, et, debug, inst=None):
+    """
+    Obtain the solution of the Poisson equation -Laplacian(u) = f with zero Dirichlet boundary values on a 1D, 2D or 3D structured grid using Geometric Multigrid Method.
+
+    The number of interior points along each axis should be 2^k - 1 so that the grid can be coarsened until an axis has at most 3 points, where the equation is solved directly.
+
+    Parameters
+    ----------
+    F : list or numpy.ndarray
+        Values of the source at the interior points.
+    h : float
+        Grid spacing.
+    U : list or numpy.ndarray
+        Initial values of the solution at the interior points.
+    cycle : String
+        Type of the cycle, either "V" or "W".
+    smoother : String
+        Smoother to use, either "Jacobi" (weighted) or "GaussSeidel" (red-black).
+    nu : int
+        Number of pre-smoothing and post-smoothing sweeps.
+    imax : int
+        Maximum number of cycles.
+    et : float
+        Relative residual threshold.
+    debug : boolean
+        Option to display steps.
+    inst : Instrument (optional)
+        Instrument to count the operations by category and time the phases.
+
+    Returns
+    -------
+    sol, ic, ops, msg : list, int, int, String
+        The solution, the cycle count and the operation count with status string.
+    """
+
+    # initialize values
+    ops = 0                             # number of operations
+    ic = 0                              # cycle counter
+    gamma = 2 if cycle == "W" else 1    # number of coarse-grid corrections
+    F = np.asarray(F, dtype=float)
+    U = np.array(U, dtype=float)
+    norm_f = np.sqrt(np.sum(F**2))
+    if norm_f == 0:
+        norm_f = 1
+
+    # check grid
+    if F.shape != U.shape:
+        return None, ic, ops, "Shapes of the source and the solution differ"
+    if any(n < 1 or (n + 1) & n != 0 for n in F.shape):
+        return None, ic, ops, "Number of points along an axis is not 2^k - 1"
+
+    # display
+    if debug:
+        print("Input\n-------")
+        print("Grid:\t{shape}\n\tCycle:\t{cycle}\n\tSmoother:\t{smoother}".format(shape=F.shape, cycle=cycle, smoother=smoother))
+
+    while(True):
+        # instrument
+        if inst is not None:
+            inst.mark()
+
+        # check residual threshold
+        norm_r = np.sqrt(np.sum((F - get_laplacian(U, h))**2))
+        ops += (2*U.ndim + 4)*U.size
+
+        # instrument
+        if inst is not None:
+            inst.count("add", (2*U.ndim + 1)*U.size)
+            inst.count("mul", 2*U.size)
+            inst.count("div", U.size)
+            inst.count("sqrt", 1)
+            inst.count("cmp", 1)
+            inst.lap("residual")
+        if norm_r <= et*norm_f:
+            return U.tolist(), ic, ops, "Approx. solution obtained"
+
+        # check iteration threshold
+        if ic >= imax:
+            return U.tolist(), ic, ops, "Maximum iterations reached"
+
+        # perform cycle
+        U, ops_c = get_cycle(F, U, h, gamma, smoother, nu, nu, inst)
+        ops += ops_c
+
+        # update cycle count
+        ic += 1
+
+        # display
+        if debug:
+            print("\nCycle #{ic}\n-------------------".format(ic=ic))
+            print("Residual:\t{r}".format(r=norm_r))
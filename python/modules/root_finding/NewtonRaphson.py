@@ -2,14 +2,16 @@
 # -*- coding: utf-8 -*-
 # Authors: Sampreet Kalita
 # Created: 2019-03-26
-# Updated: 2020-01-12
+# Updated: 2026-10-19
 
 """Module to find roots of a function using Newton-Raphson Method."""
 
 # dependencies
-import numpy as np
+import math
+
+from modules.root_finding.LUDecomposition import get_log_determinant
     
-def find_root_uni(fn, df, xi, et=1e-6, imax=1e6):
+def find_root_uni(fn, df, xi, et=1e-6, imax=1e6, inst=None):
     """
     Find the (approximate) root of a given univariate function using Newton-Raphson Method.
 
@@ -25,6 +27,8 @@ def find_root_uni(fn, df, xi, et=1e-6, imax=1e6):
         Relative error threshold.
     imax : int (optional)
         Maximum number of iterations to consider.
+    inst : Instrument (optional)
+        Instrument to count the function evaluations.
 
     Returns
     -------
@@ -32,6 +36,11 @@ def find_root_uni(fn, df, xi, et=1e-6, imax=1e6):
         The root and the iteration count with error string.
     """
 
+    # instrument
+    if inst is not None:
+        fn = inst.wrap(fn)
+        df = inst.wrap(df)
+
     # initialize values
     ic = 0
 
@@ -67,7 +76,7 @@ def find_root_uni(fn, df, xi, et=1e-6, imax=1e6):
 
     return xi, ic, "Root found"
 
-def find_root_multi(Fn, Dn, X, em=1, imax=1e6):
+def find_root_multi(Fn, Dn, X, em=1, imax=1e6, inst=None):
     """
     Find the (approximate) root of a given system of multivariate function using Newton-Raphson Method.
 
@@ -83,6 +92,8 @@ def find_root_multi(Fn, Dn, X, em=1, imax=1e6):
         Error margin.
     imax : int (optional)
         Maximum number of iterations to consider.
+    inst : Instrument (optional)
+        Instrument to count the function evaluations and the operations of the determinants by category.
 
     Returns
     -------
@@ -90,6 +101,11 @@ def find_root_multi(Fn, Dn, X, em=1, imax=1e6):
         The root and the iteration count with error string.
     """
 
+    # instrument
+    if inst is not None:
+        Fn = [inst.wrap(fn) for fn in Fn]
+        Dn = [[inst.wrap(dn) for dn in Dn_i] for Dn_i in Dn]
+
     # initialize values
     ic = 0
 
@@ -104,6 +120,11 @@ def find_root_multi(Fn, Dn, X, em=1, imax=1e6):
         # check convergence
         is_converging = True
         for i in range(0, len(Dn)):
+            # instrument
+            if inst is not None:
+                inst.count("add", len(Dn[i]) - 1)
+                inst.count("cmp", 1)
+
             if sum(list(map(lambda dn: dn(X), Dn[i]))) > em:
                 is_converging = False
                 break
@@ -111,19 +132,27 @@ def find_root_multi(Fn, Dn, X, em=1, imax=1e6):
             return X, ic, None
         
         # obtain partial jacobian matrices for each variable 
-        Det_D = list(map(lambda index: get_jacobian_determinant(Fn, Dn, X, index), list(range(0, len(Fn) + 1))))
+        Det_D = list(map(lambda index: get_jacobian_determinant(Fn, Dn, X, index, True, inst), list(range(0, len(Fn) + 1))))
 
         # check if denominator is zero
-        if Det_D[0] == 0:
+        if Det_D[0][0] == 0:
             return None, ic, "Denominator is zero"
 
-        # update values
+        # update values with the ratios of determinants obtained from their logarithms
         for i in range(0, len(X)):
-            X[i] = X[i] - Det_D[i+1]/Det_D[0]
+            sign, logdet = Det_D[i+1]
+            if sign != 0:
+                X[i] = X[i] - sign*Det_D[0][0]*math.exp(logdet - Det_D[0][1])
+
+                # instrument
+                if inst is not None:
+                    inst.count("add", 2)
+                    inst.count("mul", 2)
+                    inst.count("fev", 1)
 
     return X, ic, None
 
-def get_jacobian_determinant(Fn, Dn, X, index):
+def get_jacobian_determinant(Fn, Dn, X, index, log=False, inst=None):
     """
     Get the determinant of a partial Jacobian matrix of a given set of equations.
     
@@ -137,11 +166,15 @@ def get_jacobian_determinant(Fn, Dn, X, index):
         Initial point of selection.
     index : int
         Index of the variable for which the determinant is to be calculated.
+    log : boolean (optional)
+        Option to return the sign and the logarithm of the absolute value of the determinant, which do not overflow or underflow.
+    inst : Instrument (optional)
+        Instrument to count the operations by category and time the phases.
 
     Returns
     -------
-    det: float
-        Value of the determinant
+    det: float or tuple (float, float)
+        Value of the determinant, or its sign and logarithm.
     """
 
     # initialize values
@@ -161,9 +194,11 @@ def get_jacobian_determinant(Fn, Dn, X, index):
 
         mat.append(temp)
 
-    # reconvert the array to numpy array
-    mat = np.array(mat)
+    # determinant of matrix from its LU decomposition
+    sign, logdet, ops = get_log_determinant(mat, False, inst)
+
+    if log:
+        return sign, logdet
 
-    # return determinant of matrix
-    return np.linalg.det(mat)
+    return sign*math.exp(logdet) if sign != 0 else 0.0
                 
\ No newline at end of file
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Authors: Sampreet Kalita
+# Created: 2026-10-19
+# Updated: 2026-10-19
+
+"""Module to store symmetric matrices in packed triangular form."""
+
+# dependencies
+import numpy as np
+
+class PackedSymmetric():
+    """
+    Class to store a symmetric matrix by the n*(n + 1)/2 elements of one of its triangles.
+
+    The elements are stored in a numpy.ndarray packed row by row, either of the lower triangle such that the element (i, j) with j <= i is at i*(i + 1)/2 + j, or of the upper triangle such that the element (i, j) with j >= i is at i*n - i*(i - 1)/2 + j - i. The rows are accessed as `A[i][j]` like the rows of a list of lists, hence the matrix is accepted by the solvers reading a symmetric matrix element-wise, and assigning an element assigns its symmetric element.
+
+    Parameters
+    ----------
+    A : list (list (float)) or numpy.ndarray or PackedSymmetric (optional)
+        Given symmetric matrix, of which the selected triangle is stored.
+    dim : int (optional)
+        Number of rows of a zero matrix if A is not provided.
+    lower : boolean (optional)
+        Option to pack the lower triangle, otherwise the upper triangle is packed.
+    """
+
+    def __init__(self, A=None, dim=None, lower=True):
+        """Class constructor for PackedSymmetric."""
+
+        self.dim = len(A) if A is not None else int(dim)
+        self.lower = lower
+
+        # copy elements of the triangle
+        if A is None:
+            self.data = np.zeros(self.dim*(self.dim + 1)//2)
+        elif isinstance(A, PackedSymmetric) and A.lower == lower:
+            self.data = A.data.copy()
+        else:
+            A = np.asarray(A, dtype=float)
+            self.data = A[np.tril_indices(self.dim)] if lower else A[np.triu_indices(self.dim)]
+
+    def get_index(self, i, j):
+        """
+        Obtain the position of an element in the packed storage.
+
+        Parameters
+        ----------
+        i : int
+            Row index.
+        j : int
+            Column index.
+
+        Returns
+        -------
+        k : int
+            The position of the element or of its symmetric element.
+        """
+
+        if self.lower:
+            return i*(i + 1)//2 + j if j <= i else j*(j + 1)//2 + i
+
+        return i*self.dim - i*(i - 1)//2 + j - i if j >= i else j*self.dim - j*(j - 1)//2 + i - j
+
+    def get_indices(self, i):
+        """
+        Obtain the positions of the elements of a row in the packed storage.
+
+        Parameters
+        ----------
+        i : int
+            Row index.
+
+        Returns
+        -------
+        indices : numpy.ndarray
+            The positions of the elements of each column, hence the row is updated as a single array operation.
+        """
+
+        j = np.arange(self.dim)
+
+        if self.lower:
+            return np.where(j <= i, i*(i + 1)//2 + j, j*(j + 1)//2 + i)
+
+        return np.where(j >= i, i*self.dim - i*(i - 1)//2 + j - i, j*self.dim - j*(j - 1)//2 + i - j)
+
+    def get(self, i, j):
+        """Obtain the element (i, j)."""
+
+        return self.data[self.get_index(i, j)]
+
+    def set(self, i, j, value):
+        """Assign the element (i, j) and its symmetric element."""
+
+        self.data[self.get_index(i, j)] = value
+
+    def copy(self):
+        """Obtain a copy of the matrix with the same packing."""
+
+        return PackedSymmetric(self, lower=self.lower)
+
+    def tolist(self):
+        """Obtain the full matrix as a list of lists."""
+
+        return self.__array__().tolist()
+
+    def __array__(self, dtype=None, copy=None):
+        """Obtain the full matrix as a numpy.ndarray."""
+
+        A = np.zeros((self.dim, self.dim), dtype=dtype)
+        indices = np.tril_indices(self.dim) if self.lower else np.triu_indices(self.dim)
+        A[indices] = self.data
+        A.T[indices] = self.data
+
+        return A
+
+    def __len__(self):
+        """Obtain the number of rows."""
+
+        return self.dim
+
+    def __getitem__(self, i):
+        """Obtain a row proxy accessed as `A[i][j]`."""
+
+        if not -self.dim <= i < self.dim:
+            raise IndexError("row index out of range")
+
+        return PackedRow(self, i % self.dim)
+
+    def __repr__(self):
+        """Obtain the full matrix as a string."""
+
+        return str(self.tolist())
+
+class PackedRow():
+    """
+    Class to access a row of a packed symmetric matrix without copying it.
+
+    Parameters
+    ----------
+    matrix : PackedSymmetric
+        Given packed symmetric matrix.
+    i : int
+        Index of the row.
+    """
+
+    def __init__(self, matrix, i):
+        """Class constructor for PackedRow."""
+
+        self.matrix = matrix
+        self.i = i
+
+    def __len__(self):
+        """Obtain the number of columns."""
+
+        return self.matrix.dim
+
+    def __getitem__(self, j):
+        """Obtain the element of a column."""
+
+        if not -self.matrix.dim <= j < self.matrix.dim:
+            raise IndexError("column index out of range")
+
+        return self.matrix.get(self.i, j % self.matrix.dim)
+
+    def __setitem__(self, j, value):
+        """Assign the element of a column and its symmetric element."""
+
+        self.matrix.set(self.i, j, value)
+
+    def __repr__(self):
+        """Obtain the row as a string."""
+
+        return str(list(self))
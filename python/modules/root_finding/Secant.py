@@ -6,7 +6,7 @@
 
 """Module to find roots of a univariate function using Secant Method."""
     
-def find_root_uni(fn, xi, xf, et=1e-6, imax=1e6):
+def find_root_uni(fn, xi, xf, et=1e-6, imax=1e6, inst=None):
     """
     Find the (approximate) root of a given function using Secant Method.
 
@@ -22,6 +22,8 @@ def find_root_uni(fn, xi, xf, et=1e-6, imax=1e6):
         Threshold of relative error.
     imax : int (optional)
         Maximum number of iterations to consider.
+    inst : Instrument (optional)
+        Instrument to count the function evaluations.
 
     Returns
     -------
@@ -29,6 +31,10 @@ def find_root_uni(fn, xi, xf, et=1e-6, imax=1e6):
         The root and the iteration count with error string.
     """
 
+    # instrument
+    if inst is not None:
+        fn = inst.wrap(fn)
+
     # initialize values
     ic = 0
 
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Authors: Sampreet Kalita
+# Created: 2026-10-19
+# Updated: 2026-10-19
+
+"""Module to test benchmarks -> Suite module."""
+
+# dependencies
+import unittest
+
+from benchmarks import Suite
+
+class TestBenchmarksSuite(unittest.TestCase):
+    """Tests for benchmarks -> Suite module."""
+
+    def test_run(self):
+        """Function to test run with all cases."""
+
+        print("\nSuite: All Cases")
+
+        # function
+        results = Suite.run([8], 1, debug=False)['results']
+        errors = [(result['name'], result['error']) for result in results if 'error' in result]
+
+        # output
+        print("\tResults: {count}\n\tErrors: {errors}".format(count=len(results), errors=errors))
+
+        # every case resolves its solver and runs
+        self.assertEqual(len(results), len(Suite.get_cases()))
+        self.assertEqual(errors, [])
+
+# start tests
+if __name__ == '__main__':
+    unittest.main()
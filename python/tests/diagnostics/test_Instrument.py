@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Authors: Sampreet Kalita
+# Created: 2026-10-19
+# Updated: 2026-10-19
+
+"""Module to test diagnostics -> Instrument module."""
+
+# dependencies
+import numpy as np
+import unittest
+
+from modules.diagnostics.Instrument import Instrument
+from modules.root_finding import LUDecomposition, Multigrid, NewtonRaphson
+
+class TestDiagnosticsInstrument(unittest.TestCase):
+    """Tests for diagnostics -> Instrument module."""
+
+    def test_count(self):
+        """Function to test the counts and phases with a direct solver."""
+
+        print("\nInstrument: LU Decomposition Method")
+
+        # input
+        A = [[4, 0, 2, 1], [3, 2, 2, 0], [2, 1, 1, 2], [1, 3, 2, 0]]
+        b = [3, -1, 2, -4]
+        inst = Instrument()
+
+        # function
+        sol, ops, msg = LUDecomposition.get_solution_basic(A, b, False, None, inst)
+        summary = inst.get_summary()
+
+        # output
+        print("\tSummary: {summary}".format(summary=summary))
+
+        # the triangular solves cost n^2 additions, n(n - 1) multiplications and 2n divisions
+        self.assertEqual(sorted(summary['times'].keys()), ['factor', 'substitute'])
+        self.assertEqual(summary['counts']['div'], 3*2*1 + 2*4)
+        self.assertEqual(summary['flops'], sum(summary['counts'][key] for key in ['add', 'mul', 'div', 'sqrt']))
+
+    def test_phases(self):
+        """Function to test the phases of a recursive solver."""
+
+        print("\nInstrument: Geometric Multigrid Method")
+
+        # input
+        F = np.ones((7, 7))
+        inst = Instrument()
+
+        # function
+        sol, ic, ops, msg = Multigrid.get_solution_Poisson(F, 1/8, np.zeros(F.shape), "V", "Jacobi", 2, 50, 1e-8, False, inst)
+        summary = inst.get_summary()
+
+        # output
+        print("\tSummary: {summary}".format(summary=summary))
+
+        self.assertEqual(msg, "Approx. solution obtained")
+        self.assertEqual(sorted(summary['times'].keys()), ['coarse', 'factor', 'prolongate', 'residual', 'restrict', 'smooth', 'substitute'])
+        self.assertEqual(summary['counts']['sqrt'], ic + 1)
+
+    def test_wrap(self):
+        """Function to test the function evaluation count of a scalar solver."""
+
+        print("\nInstrument: Newton-Raphson Method")
+
+        # input
+        fn = lambda x: x**2 - 2
+        df = lambda x: 2*x
+        inst = Instrument()
+
+        # function
+        root, ic, msg = NewtonRaphson.find_root_uni(fn, df, 1, 1e-12, 100, inst)
+
+        # output
+        print("\tIterations: {ic}\n\tEvaluations: {fev}".format(ic=ic, fev=inst.counts['fev']))
+
+        self.assertAlmostEqual(root, 2**0.5)
+        self.assertGreaterEqual(inst.counts['fev'], 2*ic)
+
+        # reset
+        inst.reset()
+        self.assertEqual(inst.get_flops(), 0)
+        self.assertEqual(inst.counts['fev'], 0)
+
+# start tests
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Authors: Sampreet Kalita
+# Created: 2026-10-19
+# Updated: 2026-10-19
+
+"""Module to test diagnostics -> Trace module."""
+
+# dependencies
+import json
+import os
+import tempfile
+import unittest
+
+from modules.diagnostics.Trace import Trace
+from modules.root_finding import GaussianElimination
+
+class TestDiagnosticsTrace(unittest.TestCase):
+    """Tests for diagnostics -> Trace module."""
+
+    def test_record(self):
+        """Function to test record with a solver."""
+
+        print("\nTrace: Gaussian Elimination Method")
+
+        # input
+        A = [[4, 0, 2, 1], [3, 2, 2, 0], [2, 1, 1, 2], [1, 3, 2, 0]]
+        B = [3, -1, 2, -4]
+        events = []
+        trace = Trace(6, events.append)
+
+        # function
+        sol, ops, msg = GaussianElimination.get_solution_pivot(A, B, False, trace)
+
+        # output
+        print("\tEvents: {count}\n\tKept: {kept}".format(count=trace.count, kept=len(trace.get_events())))
+
+        # all events are passed to the callback while the buffer keeps the latest ones
+        self.assertEqual(len(events), trace.count)
+        self.assertEqual(trace.get_events(), events[-6:])
+
+        # buffer without room for an event
+        for size in [0, -1]:
+            with self.assertRaises(ValueError):
+                Trace(size)
+        self.assertEqual([events[0]['kind'], events[-1]['kind']], ['elimination', 'substitution'])
+
+    def test_export(self):
+        """Function to test export_json and export_csv."""
+
+        print("\nTrace: Export")
+
+        # input
+        trace = Trace(4)
+        for i in range(3):
+            trace.record("iteration", i, norm=1/(i + 1))
+        trace.record("swap", 3, 1, 0)
+
+        with tempfile.TemporaryDirectory() as folder:
+            # function
+            trace.export_json(os.path.join(folder, 'trace.json'))
+            trace.export_csv(os.path.join(folder, 'trace.csv'))
+
+            # output
+            with open(os.path.join(folder, 'trace.json')) as file:
+                data = json.load(file)
+            with open(os.path.join(folder, 'trace.csv')) as file:
+                lines = file.read().splitlines()
+
+        print("\tJSON: {data}".format(data=data))
+
+        self.assertEqual(data['count'], 4)
+        self.assertIsNone(data['events'][3]['norm'])
+        self.assertEqual(lines[0], 'kind,step,row,col,norm,time_ns')
+        self.assertEqual(len(lines), 5)
+
+# start tests
+if __name__ == '__main__':
+    unittest.main()
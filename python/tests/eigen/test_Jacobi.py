@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Authors: Sampreet Kalita
+# Created: 2026-10-19
+# Updated: 2026-10-19
+
+"""Module to test eigen -> Jacobi module."""
+
+# dependencies
+import unittest
+
+import numpy as np
+
+from modules.eigen import Jacobi
+
+class TestEigenJacobi(unittest.TestCase):
+    """Tests for eigen -> Jacobi module."""
+
+    def test_get_eigens_cyclic(self):
+        """Function to test get_eigens_cyclic against get_eigens."""
+
+        print("\nJacobi Method: Cyclic Threshold Sweeps")
+
+        # input
+        rng = np.random.default_rng(0)
+        G = rng.uniform(-1, 1, (20, 20))
+        A = (G + G.T)/2
+
+        # function
+        eig_val, eig_vec, ic, msg = Jacobi.get_eigens_cyclic(A.tolist(), 1e-12, 50, False)
+        eig_val_max, eig_vec_max, ic_max, msg_max = Jacobi.get_eigens(A.tolist(), 1e-12, 1e6, False)
+
+        # output
+        print("\t{msg} after {ic} sweeps.\n\tRotations of the classical method: {ic_max}".format(msg=msg, ic=ic, ic_max=ic_max))
+
+        V = np.array(eig_vec).T
+        self.assertEqual(msg, "Eigenvalues and eigenvectors obtained")
+        self.assertLessEqual(ic, 10)
+        np.testing.assert_allclose(sorted(eig_val), sorted(eig_val_max), atol=1e-10)
+        np.testing.assert_allclose(A @ V, V*eig_val, atol=1e-10)
+
+        # off-diagonal norm below the square root of the machine precision times the matrix norm
+        G = np.random.default_rng(0).uniform(-1, 1, (16, 16))
+        S = G @ G.T/16 + np.eye(16)
+        eig_val, eig_vec, ic, msg = Jacobi.get_eigens_cyclic(S.tolist(), 1e-8, 50, False)
+        self.assertEqual(msg, "Eigenvalues and eigenvectors obtained")
+        self.assertLessEqual(ic, 10)
+
+    def test_get_eigens_parallel(self):
+        """Function to test get_eigens_parallel with an odd dimension."""
+
+        print("\nJacobi Method: Parallel Round-Robin Sweeps")
+
+        # input
+        rng = np.random.default_rng(1)
+        G = rng.uniform(-1, 1, (21, 21))
+        A = (G + G.T)/2
+
+        # function
+        eig_val, eig_vec, ic, msg = Jacobi.get_eigens_parallel(A.tolist(), 1e-12, 50, False)
+        rounds = Jacobi.get_rounds(21)
+
+        # output
+        print("\t{msg} after {ic} sweeps.\n\tRounds per sweep: {count}".format(msg=msg, ic=ic, count=len(rounds)))
+
+        # every pair meets once with disjoint pairs in each round
+        pairs = [(p, q) for P, Q in rounds for p, q in zip(P.tolist(), Q.tolist())]
+        self.assertEqual(len(rounds), 21)
+        self.assertEqual(sorted(pairs), [(p, q) for p in range(21) for q in range(p + 1, 21)])
+        for P, Q in rounds:
+            self.assertEqual(len(set(P.tolist() + Q.tolist())), 2*len(P))
+
+        V = np.array(eig_vec).T
+        self.assertEqual(msg, "Eigenvalues and eigenvectors obtained")
+        self.assertLessEqual(ic, 10)
+        np.testing.assert_allclose(sorted(eig_val), np.linalg.eigvalsh(A), atol=1e-10)
+        np.testing.assert_allclose(A @ V, V*eig_val, atol=1e-10)
+
+# start tests
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Authors: Sampreet Kalita
+# Created: 2026-10-19
+# Updated: 2026-10-19
+
+"""Module to test eigen -> Lanczos module."""
+
+# dependencies
+import unittest
+
+import numpy as np
+
+from modules.eigen import Lanczos
+from modules.root_finding.LinearOperator import LinearOperator
+
+class TestEigenLanczos(unittest.TestCase):
+    """Tests for eigen -> Lanczos module."""
+
+    def test_get_eigens_Lanczos(self):
+        """Function to test get_eigens_Lanczos with a matrix-free tight-binding chain."""
+
+        print("\nLanczos Method: Tight-Binding Chain")
+
+        # input
+        n = 300
+        d = np.random.default_rng(1).uniform(-1, 1, n)
+
+        def matvec(v):
+            w = d*v
+            w[1:] -= v[:-1]
+            w[:-1] -= v[1:]
+            return w
+
+        A = LinearOperator(n, matvec, d, ops=5*n)
+        w = np.linalg.eigvalsh(np.diag(d) - np.eye(n, k=1) - np.eye(n, k=-1))
+
+        # for each end of the spectrum and reorthogonalization
+        for which, expected in [("lowest", w[:4]), ("highest", w[::-1][:4])]:
+            for reorth in ["full", "selective"]:
+                # function
+                eig_val, eig_vec, ic, msg = Lanczos.get_eigens_Lanczos(A, 4, which, None, None, 1e-10, 500, False, reorth)
+
+                # output
+                print("\t{which} ({reorth}): {val}\n\tRestarts: {ic}".format(which=which, reorth=reorth, val=eig_val, ic=ic))
+
+                self.assertEqual(msg, "Eigenvalues and eigenvectors obtained")
+                np.testing.assert_allclose(eig_val, expected, atol=1e-8)
+                np.testing.assert_allclose(eig_vec @ eig_vec.T, np.eye(4), atol=1e-10)
+                for val, vec in zip(eig_val, eig_vec):
+                    np.testing.assert_allclose(matvec(vec), val*vec, atol=1e-8)
+
+    def test_get_eigens_Lanczos_dense(self):
+        """Function to test get_eigens_Lanczos with a basis spanning a dense matrix."""
+
+        print("\nLanczos Method: Dense Matrix")
+
+        # input
+        A = [[4, 1, 0, 0, 2], [1, 3, 1, 0, 0], [0, 1, 2, 1, 0], [0, 0, 1, 1, 1], [2, 0, 0, 1, 5]]
+
+        # function
+        eig_val, eig_vec, ic, msg = Lanczos.get_eigens_Lanczos(A, 2, "highest", debug=False)
+
+        # output
+        print("\tEigenvalues: {val}".format(val=eig_val))
+
+        np.testing.assert_allclose(eig_val, np.linalg.eigvalsh(A)[::-1][:2], atol=1e-12)
+        self.assertEqual(Lanczos.get_eigens_Lanczos(A, 2, "middle", debug=False)[3], "Selection is unknown")
+
+# start tests
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Authors: Sampreet Kalita
+# Created: 2026-10-19
+# Updated: 2026-10-19
+
+"""Module to test eigen -> Power module."""
+
+# dependencies
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from modules.eigen import Power
+
+class TestEigenPower(unittest.TestCase):
+    """Tests for eigen -> Power module."""
+
+    def test_get_eigens_deflated(self):
+        """Function to test get_eigens_deflated with each method."""
+
+        print("\nPower Iteration Method: Deflation")
+
+        # input
+        rng = np.random.default_rng(0)
+        Q, R = np.linalg.qr(rng.uniform(-1, 1, (30, 30)))
+        w = np.concatenate([[-10, 8, 6], np.linspace(-5, -1, 12), np.linspace(1, 5, 12), [0.5, 0.3, 0.1]])
+        A = (Q*w) @ Q.T
+
+        # for each method
+        for method, expected in [("power", [-10, 8, 6]), ("inverse", [0.1, 0.3, 0.5]), ("rayleigh", None)]:
+            # function
+            eig_val, eig_vec, ic, msg = Power.get_eigens_deflated(A, 3, method, 0, 1e-10, 2000, False)
+
+            # output
+            print("\t{method}: {val}\n\tIterations: {ic}".format(method=method, val=eig_val, ic=ic))
+
+            V = np.array(eig_vec).T
+            self.assertEqual(msg, "Eigenvalues and eigenvectors obtained")
+            np.testing.assert_allclose(A @ V, V*eig_val, atol=1e-9)
+            np.testing.assert_allclose(V.T @ V, np.eye(3), atol=1e-12)
+            if expected is not None:
+                np.testing.assert_allclose(eig_val, expected, atol=1e-9)
+            else:
+                self.assertEqual(len(set(np.round(eig_val, 8))), 3)
+
+        # factors of the shifted matrix are reused for all eigenpairs
+        with mock.patch.object(Power, "get_LU_pivot", wraps=Power.get_LU_pivot) as get_LU_pivot:
+            Power.get_eigens_deflated(A, 5, "inverse", 0, 1e-10, 2000, False)
+        self.assertEqual(get_LU_pivot.call_count, 1)
+
+        # unknown method
+        self.assertEqual(Power.get_eigens_deflated(A, 3, "none", debug=False)[3], "Method is unknown")
+
+    def test_get_eigen_inverse(self):
+        """Function to test get_eigen_inverse and get_eigen_Rayleigh with a shift."""
+
+        print("\nPower Iteration Method: Shifted Inverse and Rayleigh Quotient")
+
+        # input
+        A = [[4, 1, 0, 0], [1, 3, 1, 0], [0, 1, 2, 1], [0, 0, 1, 1]]
+        w = np.linalg.eigvalsh(A)
+
+        # function
+        val_i, vec_i, ic_i, msg_i = Power.get_eigen_inverse(A, 2.2, None, 1e-12, 200, False)
+        val_r, vec_r, ic_r, msg_r = Power.get_eigen_Rayleigh(A, vec_i, 1e-12, 50, False)
+
+        # output
+        print("\tInverse: {val} after {ic} iterations\n\tRayleigh: {val_r} after {ic_r} iterations".format(val=val_i, ic=ic_i, val_r=val_r, ic_r=ic_r))
+
+        nearest = w[np.argmin(np.abs(w - 2.2))]
+        self.assertAlmostEqual(val_i, nearest, places=10)
+        self.assertAlmostEqual(val_r, nearest, places=10)
+
+        # shift equal to an eigenvalue with an initial vector nearer to another eigenvector
+        val, vec, ic, msg = Power.get_eigen_inverse(np.diag([1.0, 2.0, 3.0]), 2.0, [1, 0.01, 0.1], 1e-12, 50, False)
+        self.assertEqual(msg, "Eigenvalue and eigenvector obtained")
+        self.assertAlmostEqual(val, 2.0, places=12)
+
+# start tests
+if __name__ == '__main__':
+    unittest.main()
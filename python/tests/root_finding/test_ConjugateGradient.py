@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Authors: Sampreet Kalita
+# Created: 2026-10-19
+# Updated: 2026-10-19
+
+"""Module to test root_finding -> ConjugateGradient module."""
+
+# dependencies
+import unittest
+
+from modules.root_finding import ConjugateGradient
+from modules.root_finding.LinearOperator import LinearOperator, get_operator
+
+class TestRootFindingConjugateGradient(unittest.TestCase):
+    """Tests for root_finding -> ConjugateGradient module."""
+
+    def mat_vec(self, v):
+        """
+        Demo matrix-free product with the one-dimensional Laplacian for testing.
+
+        Parameters
+        ----------
+        v : numpy.ndarray
+            Given vector.
+        """
+
+        Av = 2*v
+        Av[1:] -= v[:-1]
+        Av[:-1] -= v[1:]
+
+        return Av
+
+    def test_get_mat_vec(self):
+        """Function to test the operation count of get_mat_vec."""
+
+        print("\nConjugate Gradient Method: Matrix-Vector Product")
+
+        # input
+        A = [[4, 3, 2, 1], [3, 3, 2, 1], [2, 2, 2, 1], [1, 1, 1, 1]]
+
+        # function
+        counts = [ConjugateGradient.get_mat_vec(M, 4)[1] for M in [A, self.mat_vec, get_operator(A), LinearOperator(4, self.mat_vec, [2]*4, ops=20)]]
+
+        # output
+        print("\tOperations: {counts}".format(counts=counts))
+
+        # a multiplication and an addition per non-zero element as for the linear operators
+        self.assertEqual(counts, [2*16, 2*4, 2*16, 20])
+
+    def test_get_solution_basic(self):
+        """Function to test get_solution_basic."""
+
+        print("\nConjugate Gradient Method: Basic")
+
+        # input
+        A = [[4, 3, 2, 1], [3, 3, 2, 1], [2, 2, 2, 1], [1, 1, 1, 1]]
+        b = [3, 2, 1, 1]
+        x = [0, 0, 0, 0]
+
+        # function
+        root, ic, ops, msg = ConjugateGradient.get_solution_basic(A, b, x, 100, 1e-12, False)
+
+        # output
+        if root != None:
+            print("\tRoot: {x}\n\tIterations: {ic}\n\tOperations: {ops}".format(x=root, ic=ic, ops=ops))
+        else:
+            print("\t{msg}.\n\tOperations: {ops}".format(msg=msg, ops=ops))
+
+        for xi, ei in zip(root, [1, 0, -1, 1]):
+            self.assertAlmostEqual(xi, ei, places=8)
+
+    def test_get_solution_matrix_free(self):
+        """Function to test get_solution_basic with a matrix-vector product function."""
+
+        print("\nConjugate Gradient Method: Matrix-free")
+
+        # input
+        dim = 50
+        b = [1.0 for i in range(dim)]
+        x = [0.0 for i in range(dim)]
+
+        # function
+        root, ic, ops, msg = ConjugateGradient.get_solution_basic(self.mat_vec, b, x, 100, 1e-10, False)
+
+        # output
+        print("\t{msg} after {ic} iterations.\n\tOperations: {ops}".format(msg=msg, ic=ic, ops=ops))
+
+        self.assertLessEqual(ic, dim)
+        self.assertAlmostEqual(root[0], dim/2, places=6)
+
+# start tests
+if __name__ == '__main__':
+    unittest.main()
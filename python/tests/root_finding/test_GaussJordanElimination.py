@@ -2,7 +2,7 @@
 # -*- coding: utf-8 -*-
 # Authors: Sampreet Kalita
 # Created: 2019-04-07
-# Updated: 2020-01-15
+# Updated: 2026-10-19
 
 """Module to test root_finding -> GaussJordanElimination module."""
 
@@ -14,8 +14,8 @@ from modules.root_finding import GaussJordanElimination
 class TestRootFindingGaussJordan(unittest.TestCase):
     """Tests for root_finding -> GaussJordanElimination module."""
 
-    def test_find_inverse(self):
-        """Function to test find_inverse."""
+    def test_get_inverse(self):
+        """Function to test get_inverse."""
 
         print("\nGauss-Jordan Elimination Method: Inverse")
 
@@ -23,7 +23,7 @@ class TestRootFindingGaussJordan(unittest.TestCase):
         A = [[4, 1, 0], [5, -2, 4], [-2, 1, 1]]
 
         # function
-        Ainv, ops, msg = GaussJordanElimination.find_inverse(A)
+        Ainv, ops, msg = GaussJordanElimination.get_inverse(A, False)
 
         # output
         if Ainv != None:
@@ -31,6 +31,71 @@ class TestRootFindingGaussJordan(unittest.TestCase):
         else:
             print("\t{msg}.\n\tOperations: {ops}".format(msg=msg, ops=ops))
 
+    def test_get_inverse_singular(self):
+        """Function to test get_inverse with a singular matrix."""
+
+        print("\nGauss-Jordan Elimination Method: Singular Inverse")
+
+        # input
+        A = [[1, 2, 3], [4, 5, 6], [7, 8, 9]]
+
+        # function
+        Ainv, ops, msg = GaussJordanElimination.get_inverse(A, False)
+
+        # output
+        print("\t{msg}.\n\tOperations: {ops}".format(msg=msg, ops=ops))
+
+        self.assertIsNone(Ainv)
+
+    def test_get_solution_basic_preserved(self):
+        """Function to test get_solution_basic without overwriting the inputs."""
+
+        print("\nGauss-Jordan Elimination Method: Preserved Inputs")
+
+        # input
+        A = [[4, 0, 2, 1], [3, 2, 2, 0], [2, 1, 1, 2], [1, 3, 2, 0]]
+        b = [3, -1, 2, -4]
+        x = [0 for i in range(4)]
+
+        # function
+        root, ops, msg = GaussJordanElimination.get_solution_basic(A, b, False, overwrite_a=False, out=x)
+
+        # output
+        print("\tRoot: {x}\n\tOperations: {ops}".format(x=root, ops=ops))
+
+        self.assertIs(root, x)
+        self.assertEqual(A, [[4, 0, 2, 1], [3, 2, 2, 0], [2, 1, 1, 2], [1, 3, 2, 0]])
+        self.assertEqual(b, [3, -1, 2, -4])
+        for xi, ei in zip(x, [1, -1, -1, 1]):
+            self.assertAlmostEqual(xi, ei, places=12)
+
+    def test_get_solution_basic_cond(self):
+        """Function to test get_solution_basic and get_inverse with the condition number."""
+
+        print("\nGauss-Jordan Elimination Method: Condition Number")
+
+        # input
+        A = [[1e-6, 1, 2], [2e-6, 3, 1], [1e-6, 1, 1]]
+        b = [1, 2, 3]
+
+        # function
+        root, cond, ops, msg = GaussJordanElimination.get_solution_basic(A, b, False, overwrite_a=False, overwrite_b=False, cond=True)
+        Ainv, cond_inv, ops_inv, msg_inv = GaussJordanElimination.get_inverse(A, False, overwrite_a=False, cond=True)
+
+        # output
+        print("\tEstimate: {cond}\n\tCondition number: {cond_inv}".format(cond=cond, cond_inv=cond_inv))
+
+        # the estimate is exact for small matrices and equals the 1-norm condition number from the inverse
+        norm_1 = max([sum([abs(A[i][j]) for i in range(3)]) for j in range(3)])
+        norm_inv = max([sum([abs(Ainv[i][j]) for i in range(3)]) for j in range(3)])
+        self.assertAlmostEqual(cond_inv/(norm_1*norm_inv), 1.0, places=12)
+        self.assertAlmostEqual(cond/cond_inv, 1.0, places=8)
+        self.assertGreater(cond, 1e6)
+
+        # singular matrix
+        root, cond, ops, msg = GaussJordanElimination.get_solution_basic([[1, 2], [2, 4]], [1, 1], False, cond=True)
+        self.assertEqual([root, cond, msg], [None, float('inf'), "Martix is singular"])
+
 # start tests
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
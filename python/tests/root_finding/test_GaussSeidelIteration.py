@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Authors: Sampreet Kalita
+# Created: 2026-10-19
+# Updated: 2026-10-19
+
+"""Module to test root_finding -> GaussSeidelIteration module."""
+
+# dependencies
+import math
+import unittest
+
+from modules.root_finding import GaussSeidelIteration
+
+class TestRootFindingGaussSeidelIteration(unittest.TestCase):
+    """Tests for root_finding -> GaussSeidelIteration module."""
+
+    def get_system(self, dim):
+        """
+        Demo tridiagonal system for testing.
+
+        Parameters
+        ----------
+        dim : int
+            Number of variables.
+        """
+
+        A = [[2.0 if i==j else (-1.0 if abs(i - j) == 1 else 0.0) for j in range(dim)] for i in range(dim)]
+        b = [1.0 for i in range(dim)]
+
+        return A, b
+
+    def test_get_solution_basic(self):
+        """Function to test get_solution_basic."""
+
+        print("\nGauss-Seidel Iteration Method: Basic")
+
+        # input
+        A, b = self.get_system(8)
+        x = [0 for i in range(8)]
+
+        # function
+        root, ops, msg = GaussSeidelIteration.get_solution_basic(A, b, x, 1.0, 1e4, 1e-10, False)
+
+        # output
+        if root != None:
+            print("\tRoot: {x}\n\tOperations: {ops}".format(x=root, ops=ops))
+        else:
+            print("\t{msg}.\n\tOperations: {ops}".format(msg=msg, ops=ops))
+
+        self.assertAlmostEqual(root[0], 4.0, places=6)
+
+    def test_get_solution_basic_preserved(self):
+        """Function to test get_solution_basic without overwriting the inputs."""
+
+        print("\nGauss-Seidel Iteration Method: Preserved Inputs")
+
+        # input
+        A, b = self.get_system(8)
+        x = [0 for i in range(8)]
+        out = [0 for i in range(8)]
+
+        # function
+        root, ops, msg = GaussSeidelIteration.get_solution_basic(A, b, x, 1.0, 1e4, 1e-10, False, overwrite_a=False, overwrite_b=False, out=out)
+
+        # output
+        print("\tRoot: {x}\n\tOperations: {ops}".format(x=root, ops=ops))
+
+        self.assertIs(root, out)
+        self.assertEqual([A, b, x], list(self.get_system(8)) + [[0 for i in range(8)]])
+        self.assertAlmostEqual(out[0], 4.0, places=6)
+
+    def test_get_solution_basic_residual(self):
+        """Function to test get_solution_basic with the relative residual criterion."""
+
+        print("\nGauss-Seidel Iteration Method: Residual Criterion")
+
+        # input
+        A, b = self.get_system(8)
+        x = [0 for i in range(8)]
+
+        # function
+        root, ops, msg = GaussSeidelIteration.get_solution_basic(A, b, x, 1.0, 1e4, 1e-10, False, "residual", 2, 4)
+
+        # output
+        print("\tRoot: {x}\n\tOperations: {ops}".format(x=root, ops=ops))
+
+        A, b = self.get_system(8)
+        residual = max([abs(b[i] - sum([A[i][j]*root[j] for j in range(8)])) for i in range(8)])
+        self.assertLessEqual(residual, 1e-10*8**0.5)
+
+    def test_get_solution_basic_auto(self):
+        """Function to test get_solution_basic with automatic selection of the weight."""
+
+        print("\nGauss-Seidel Iteration Method: Automatic Over-Relaxation")
+
+        # input
+        A, b = self.get_system(32)
+
+        # function
+        lamb, rho, ic_pred, ops = GaussSeidelIteration.get_relaxation_factor(A, 50, 1e-3, 1e-8)
+        root, ops_auto, msg = GaussSeidelIteration.get_solution_basic(A, b, [0 for i in range(32)], "auto", 1e4, 1e-8, False, "residual", 2, 10, 20)
+        A, b = self.get_system(32)
+        root, ops_basic, msg = GaussSeidelIteration.get_solution_basic(A, b, [0 for i in range(32)], 1.0, 1e4, 1e-8, False, "residual", 2, 10)
+
+        # output
+        print("\tWeight: {lamb}\n\tPredicted iterations: {ic_pred}\n\tOperations: {ops_auto} (auto), {ops_basic} (basic)".format(lamb=lamb, ic_pred=ic_pred, ops_auto=ops_auto, ops_basic=ops_basic))
+
+        self.assertGreater(lamb, 1.0)
+        self.assertLess(lamb, 2.0)
+        self.assertLess(ops_auto, ops_basic)
+
+        # optimal weight of the tridiagonal system of a consistently ordered matrix
+        for dim in [32, 256]:
+            A, b = self.get_system(dim)
+            lamb, rho, ic_pred, ops = GaussSeidelIteration.get_relaxation_factor(A, 100, 1e-3, 1e-8)
+            self.assertAlmostEqual(lamb, 2/(1 + math.sin(math.pi/(dim + 1))), delta=1e-3)
+
+    def test_get_solution_multicolor(self):
+        """Function to test get_solution_multicolor."""
+
+        print("\nGauss-Seidel Iteration Method: Multicolor")
+
+        # input
+        A, b = self.get_system(8)
+        x = [0 for i in range(8)]
+
+        # function
+        colors = GaussSeidelIteration.get_colors(A)
+        root, ops, msg = GaussSeidelIteration.get_solution_multicolor(A, b, x, 1.0, 1e4, 1e-10, False)
+
+        # output
+        if root != None:
+            print("\tColors: {colors}\n\tRoot: {x}\n\tOperations: {ops}".format(colors=colors, x=root, ops=ops))
+        else:
+            print("\t{msg}.\n\tOperations: {ops}".format(msg=msg, ops=ops))
+
+        self.assertEqual(colors, [[0, 2, 4, 6], [1, 3, 5, 7]])
+        self.assertAlmostEqual(root[0], 4.0, places=6)
+
+# start tests
+if __name__ == '__main__':
+    unittest.main()
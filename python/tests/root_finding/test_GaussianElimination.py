@@ -2,7 +2,7 @@
 # -*- coding: utf-8 -*-
 # Authors: Sampreet Kalita
 # Created: 2019-04-07
-# Updated: 2020-01-16
+# Updated: 2026-10-19
 
 """Module to test root_finding -> GaussianElimination module."""
 
@@ -32,6 +32,73 @@ class TestRootFindingGaussianElimination(unittest.TestCase):
         else:
             print("\t{msg}.\n\tOperations: {ops}".format(msg=msg, ops=ops))
 
+    def test_get_solution_batched(self):
+        """Function to test get_solution_batched."""
+
+        print("\nGaussian Elimination Method: Batched")
+
+        # input
+        A = [[[4, 0, 2, 1], [3, 2, 2, 0], [2, 1, 1, 2], [1, 3, 2, 0]],
+            [[0, 1, 0, 0], [1, 0, 0, 0], [0, 0, 2, 0], [0, 0, 0, 4]],
+            [[1, 2, 3, 4], [2, 4, 6, 8], [0, 1, 0, 1], [1, 0, 1, 0]]]
+        B = [[7, 7, 6, 6], [1, 2, 2, 4], [1, 2, 3, 4]]
+
+        # function
+        sol, flags, ops, msg = GaussianElimination.get_solution_batched(A, B, False)
+
+        # output
+        print("\tSolutions: {X}\n\tSingular: {flags}\n\tOperations: {ops}".format(X=sol.tolist(), flags=flags.tolist(), ops=ops))
+
+        self.assertEqual(flags.tolist(), [False, False, True])
+        for xi, ei in zip(sol[0].tolist() + sol[1].tolist(), [1, 1, 1, 1, 2, 1, 1, 1]):
+            self.assertAlmostEqual(xi, ei, places=12)
+
+    def test_get_solution_pivot_preserved(self):
+        """Function to test get_solution_pivot without overwriting the inputs."""
+
+        print("\nGaussian Elimination Method: Preserved Inputs")
+
+        # input
+        A = [[4, 0, 2, 1], [3, 2, 2, 0], [2, 1, 1, 2], [1, 3, 2, 0]]
+        B = [[7, 3], [7, -1], [6, 2], [6, -4]]
+        A_0 = [list(row) for row in A]
+        B_0 = [list(row) for row in B]
+        X = [[0, 0] for i in range(4)]
+
+        # function
+        sol, ops, msg = GaussianElimination.get_solution_pivot(A, B, False, overwrite_a=False, overwrite_b=False, out=X)
+
+        # output
+        print("\tSolution: {X}\n\tOperations: {ops}".format(X=sol, ops=ops))
+
+        self.assertIs(sol, X)
+        self.assertEqual([A, B], [A_0, B_0])
+        for xi, ei in zip(sum(X, []), [1, 1, 1, -1, 1, -1, 1, 1]):
+            self.assertAlmostEqual(xi, ei, places=12)
+
+    def test_get_solution_pivot_strategies(self):
+        """Function to test get_solution_pivot with each pivoting strategy."""
+
+        print("\nGaussian Elimination Method: Pivoting Strategies")
+
+        # for each strategy
+        for strategy in ["partial", "scaled", "rook", "complete"]:
+            # input
+            A = [[1e-12, 1, 2], [1, 1e6, 1], [2, 1, 0]]
+            B = [3 + 1e-12, 1e6 + 2, 3]
+
+            # function
+            sol, ops, msg = GaussianElimination.get_solution_pivot(A, B, False, strategy=strategy)
+
+            # output
+            print("\t{strategy}: {X}\n\tOperations: {ops}".format(strategy=strategy, X=sol, ops=ops))
+
+            for xi, ei in zip(sol, [[1], [1], [1]]):
+                self.assertAlmostEqual(xi[0], ei[0], places=9)
+
+        # unknown strategy
+        self.assertEqual(GaussianElimination.get_solution_pivot(A, B, False, strategy="none")[2], "Pivoting strategy is unknown")
+
 # start tests
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Authors: Sampreet Kalita
+# Created: 2026-10-19
+# Updated: 2026-10-19
+
+"""Module to test root_finding -> JacobiIteration module."""
+
+# dependencies
+import unittest
+
+import numpy as np
+
+from modules.root_finding import JacobiIteration
+
+class TestRootFindingJacobiIteration(unittest.TestCase):
+    """Tests for root_finding -> JacobiIteration module."""
+
+    def test_get_solution_basic_auto(self):
+        """Function to test get_solution_basic with automatic selection of the weight."""
+
+        print("\nJacobi Iteration Method: Automatic Weight")
+
+        # input
+        n = 32
+        A = 2*np.eye(n) - np.eye(n, k=1) - np.eye(n, k=-1)
+        b = A @ np.sin(np.arange(n))
+
+        # function
+        lamb, rho, ic_pred, ops = JacobiIteration.get_relaxation_factor(A, 50, 1e-3, 1e-8)
+        root, ops_auto, msg = JacobiIteration.get_solution_basic(A.tolist(), b.tolist(), [0 for i in range(n)], "auto", 1e4, 1e-8, False, "residual")
+        root_1, ops_1, msg_1 = JacobiIteration.get_solution_basic(A.tolist(), b.tolist(), [0 for i in range(n)], 1.0, 1e4, 1e-8, False, "residual")
+
+        # output
+        print("\tWeight: {lamb}\n\tPredicted iterations: {ic_pred}\n\tOperations: {ops_auto} (auto), {ops_1} (unweighted)".format(lamb=lamb, ic_pred=ic_pred, ops_auto=ops_auto, ops_1=ops_1))
+
+        # spectrum of eigenvalues of opposite sign and equal magnitude requires the unit weight
+        self.assertEqual(lamb, 1.0)
+        self.assertLess(rho, 1)
+        self.assertEqual(msg, "Approx. solution obtained")
+        np.testing.assert_allclose(root, root_1, atol=1e-10)
+
+        # spectrum not symmetric about zero
+        A = np.eye(5) + 0.3*np.ones((5, 5))
+        lamb, rho, ic_pred, ops = JacobiIteration.get_relaxation_factor(A, 50, 1e-3, 1e-8)
+        self.assertAlmostEqual(lamb, 2/(2 + 1.2/1.3 - 0.3/1.3), places=10)
+        self.assertAlmostEqual(rho, (1.5/1.3)/(2 + 1.2/1.3 - 0.3/1.3), places=10)
+
+# start tests
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Authors: Sampreet Kalita
+# Created: 2026-10-19
+# Updated: 2026-10-19
+
+"""Module to test root_finding -> Krylov module."""
+
+# dependencies
+import unittest
+
+from modules.root_finding import GaussSeidelIteration, JacobiIteration, Krylov, LUDecomposition
+
+class TestRootFindingKrylov(unittest.TestCase):
+    """Tests for root_finding -> Krylov module."""
+
+    def get_system(self, dim):
+        """
+        Demo non-symmetric tridiagonal system for testing.
+
+        Parameters
+        ----------
+        dim : int
+            Number of variables.
+        """
+
+        A = [[3.0 if i==j else (-1.5 if i - j == 1 else (-0.5 if j - i == 1 else 0.0)) for j in range(dim)] for i in range(dim)]
+        b = [1.0 for i in range(dim)]
+
+        return A, b
+
+    def get_residual(self, A, b, x):
+        """
+        Obtain the maximum absolute residual of a solution.
+
+        Parameters
+        ----------
+        A : list (list (float))
+            Given coefficient matrix.
+        b : list (float)
+            Given constant vector.
+        x : list (float)
+            Given solution.
+        """
+
+        return max([abs(b[i] - sum([A[i][j]*x[j] for j in range(len(x))])) for i in range(len(b))])
+
+    def test_get_solution_PCG(self):
+        """Function to test get_solution_PCG."""
+
+        print("\nKrylov Subspace Method: Preconditioned Conjugate Gradient")
+
+        # input
+        A = [[4, 3, 2, 1], [3, 3, 2, 1], [2, 2, 2, 1], [1, 1, 1, 1]]
+        b = [3, 2, 1, 1]
+        M, ops, msg = JacobiIteration.get_preconditioner(A, False)
+
+        # function
+        root, ic, ops, msg = Krylov.get_solution_PCG(A, b, [0, 0, 0, 0], 100, 1e-12, False, M)
+
+        # output
+        print("\tRoot: {x}\n\tIterations: {ic}\n\tOperations: {ops}".format(x=root, ic=ic, ops=ops))
+
+        self.assertLess(self.get_residual(A, b, root), 1e-8)
+
+        # preconditioners of a matrix with a zero diagonal element
+        Z = [[0, 1], [1, 2]]
+        self.assertEqual(JacobiIteration.get_preconditioner(Z, False)[2], "Diagonal element is zero")
+        self.assertEqual(GaussSeidelIteration.get_preconditioner_SSOR(Z, 1.0, False)[2], "Diagonal element is zero")
+        self.assertEqual(LUDecomposition.get_preconditioner_ILU(Z, False)[2], "Diagonal element of U is zero")
+
+    def test_get_solution_GMRES(self):
+        """Function to test get_solution_GMRES."""
+
+        print("\nKrylov Subspace Method: GMRES")
+
+        # input
+        A, b = self.get_system(40)
+        M, ops, msg = GaussSeidelIteration.get_preconditioner_SSOR(A, 1.0, False)
+
+        # function
+        root, ic, ops, msg = Krylov.get_solution_GMRES(A, b, [0 for i in range(40)], 10, 1000, 1e-10, False, M)
+
+        # output
+        print("\t{msg} after {ic} iterations.\n\tOperations: {ops}".format(msg=msg, ic=ic, ops=ops))
+
+        self.assertLess(self.get_residual(A, b, root), 1e-8)
+
+    def test_get_solution_BiCGSTAB(self):
+        """Function to test get_solution_BiCGSTAB."""
+
+        print("\nKrylov Subspace Method: BiCGSTAB")
+
+        # input
+        A, b = self.get_system(40)
+        M, ops, msg = LUDecomposition.get_preconditioner_ILU(A, False)
+
+        # function
+        root, ic, ops, msg = Krylov.get_solution_BiCGSTAB(A, b, [0 for i in range(40)], 1000, 1e-10, False, M)
+
+        # output
+        print("\t{msg} after {ic} iterations.\n\tOperations: {ops}".format(msg=msg, ic=ic, ops=ops))
+
+        self.assertLess(self.get_residual(A, b, root), 1e-8)
+
+# start tests
+if __name__ == '__main__':
+    unittest.main()
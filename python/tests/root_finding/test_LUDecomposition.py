@@ -2,13 +2,18 @@
 # -*- coding: utf-8 -*-
 # Authors: Sampreet Kalita
 # Created: 2019-04-07
-# Updated: 2019-12-22
+# Updated: 2026-10-19
 
 """Module to test root_finding -> LUDecomposition module."""
 
 # dependencies
+import math
+import os
+import tempfile
 import unittest
 
+import numpy as np
+
 from modules.root_finding import LUDecomposition
 
 class TestRootFindingLUDecomposition(unittest.TestCase):
@@ -32,6 +37,182 @@ class TestRootFindingLUDecomposition(unittest.TestCase):
         else:
             print("\t{msg}.\n\tOperations: {ops}".format(msg=msg, ops=ops))
 
+    def test_get_condition_estimate(self):
+        """Function to test get_condition_estimate."""
+
+        print("\nLU Decomposition Method: Condition Estimate")
+
+        # input
+        A = [[4, 3, 2, 1], [3, 3, 2, 1], [2, 2, 2, 1], [1, 1, 1, 1]]
+
+        # function
+        L, U, ops = LUDecomposition.get_LU_basic_OnesInL(A, False)
+        cond, ops = LUDecomposition.get_condition_estimate(A, L, U, False)
+
+        # output
+        print("\tCondition Number: {cond}\n\tOperations: {ops}".format(cond=cond, ops=ops))
+
+        # exact value is 40
+        self.assertAlmostEqual(cond, 40.0, places=8)
+
+    def test_get_solution_refined(self):
+        """Function to test get_solution_refined."""
+
+        print("\nLU Decomposition Method: Mixed-Precision Iterative Refinement")
+
+        # input
+        A = [[4, 3, 2, 1], [3, 3, 2, 1], [2, 2, 2, 1], [1, 1, 1, 1]]
+        b = [3, 2, 1, 1]
+
+        # function
+        root, ic, err, ops, msg = LUDecomposition.get_solution_refined(A, b, 10, 1e-14, False)
+
+        # output
+        print("\tRoot: {x}\n\tRefinement steps: {ic}\n\tBackward error: {err}\n\tOperations: {ops}".format(x=root, ic=ic, err=err, ops=ops))
+
+        self.assertLess(err, 1e-15)
+        for xi, ei in zip(root, [1, 0, -1, 1]):
+            self.assertAlmostEqual(xi, ei, places=12)
+
+    def test_get_log_determinant(self):
+        """Function to test get_log_determinant."""
+
+        print("\nLU Decomposition Method: Log-Determinant")
+
+        # input
+        A = [[1, 3, 1], [2, 4, -6], [2, -4, -2]]
+        S = [[4, 2, 2], [2, 5, 1], [2, 1, 6]]
+
+        # function
+        sign, logdet, ops = LUDecomposition.get_log_determinant(A, False)
+        L, U, ops_C = LUDecomposition.get_LU_Cholesky(S, False)
+        det_S = LUDecomposition.get_determinant_factors(L, U)
+
+        # output
+        print("\tSign: {sign}\n\tLog-determinant: {logdet}\n\tOperations: {ops}".format(sign=sign, logdet=logdet, ops=ops))
+
+        # exact values are -72 and 80
+        self.assertEqual(sign, -1)
+        self.assertAlmostEqual(logdet, math.log(72), places=12)
+        self.assertAlmostEqual(det_S, 80, places=10)
+
+        # determinant of 0.1*I of size 400 underflows while its logarithm does not
+        sign, logdet, ops = LUDecomposition.get_log_determinant([[0.1 if i == j else 0 for j in range(400)] for i in range(400)], False)
+        self.assertEqual(sign, 1)
+        self.assertAlmostEqual(logdet, 400*math.log(0.1), places=8)
+
+        # singular matrix
+        self.assertEqual(LUDecomposition.get_determinant([[1, 2], [2, 4]], False)[0], 0)
+
+    def test_get_LU_tiled(self):
+        """Function to test get_LU_tiled and get_solution_tiled."""
+
+        print("\nLU Decomposition Method: Out-of-Core Tiled")
+
+        # input
+        rng = np.random.default_rng(0)
+        A = rng.uniform(-1, 1, (50, 50))
+        b = rng.uniform(-1, 1, 50)
+
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "A.npy")
+            np.save(path, A)
+
+            # function
+            path_LU, p, ops, msg = LUDecomposition.get_LU_tiled(path, 8, False, os.path.join(folder, "LU.npy"))
+            x, ops_s, msg_s = LUDecomposition.get_solution_tiled(path_LU, p, b, 8, False)
+            LU = np.load(path_LU)
+
+        # output
+        print("\tResidual: {res}\n\tOperations: {ops}".format(res=np.max(np.abs(A @ x - b)), ops=ops + ops_s))
+
+        # factors equal those of the in-memory decomposition
+        L, U, p_ref, ops_ref = LUDecomposition.get_LU_pivot(A, False)
+        self.assertEqual(p, p_ref)
+        np.testing.assert_allclose(np.tril(LU, -1) + np.eye(50), L, atol=1e-10)
+        np.testing.assert_allclose(np.triu(LU), U, atol=1e-10)
+        np.testing.assert_allclose(A @ x, b, atol=1e-10)
+        self.assertEqual([msg, msg_s], ["Factors obtained", "Solution obtained"])
+
+        # singular matrix
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "A.npy")
+            np.save(path, np.array([[1.0, 2.0, 3.0], [2.0, 4.0, 6.0], [1.0, 1.0, 1.0]]))
+            path_LU, p, ops, msg = LUDecomposition.get_LU_tiled(path, 2, False)
+            self.assertEqual([path_LU, p, msg], [None, None, "Matrix is singular"])
+
+            # factors with a zero pivot
+            np.save(path, np.array([[1.0, 2.0], [0.0, 0.0]]))
+            self.assertEqual(LUDecomposition.get_solution_tiled(path, [0, 1], [1.0, 1.0], 2, False)[2], "Matrix is singular")
+
+    def test_get_solution_block(self):
+        """Function to test the solutions for a block of constant vectors."""
+
+        print("\nLU Decomposition Method: Multiple Constant Vectors")
+
+        # input
+        rng = np.random.default_rng(0)
+        G = rng.uniform(-1, 1, (70, 70))
+        A = G @ G.T/70 + np.eye(70)
+        B = rng.uniform(-1, 1, (70, 5))
+
+        # function
+        X_C, ops_C, msg = LUDecomposition.get_solution_Cholesky(A.tolist(), B.tolist(), False)
+        L, U, p, ops = LUDecomposition.get_LU_pivot(A, False)
+        X_P, ops_P = LUDecomposition.get_solution_factors(L, U, p, B, False)
+
+        # output
+        print("\tResidual: {res}\n\tOperations: {ops}".format(res=np.max(np.abs(A @ X_C - B)), ops=ops_C))
+
+        np.testing.assert_allclose(A @ X_C, B, atol=1e-12)
+        np.testing.assert_allclose(A @ X_P, B, atol=1e-12)
+
+        # each column equals the solution for a single constant vector
+        x, ops_x = LUDecomposition.get_solution_factors(L, U, p, B[:, 2], False)
+        np.testing.assert_allclose(X_P[:, 2], x, atol=1e-12)
+        self.assertEqual(ops_P, 5*ops_x)
+
+    def test_get_solution_LDL(self):
+        """Function to test get_solution_LDL with a symmetric indefinite matrix."""
+
+        print("\nLU Decomposition Method: LDL with Bunch-Kaufman Pivoting")
+
+        # input
+        A = [[0, 1, 2, 1], [1, 0, 1, 3], [2, 1, -4, 0], [1, 3, 0, 0]]
+        b = [4, 5, -1, 4]
+
+        # function
+        sol, ops, msg = LUDecomposition.get_solution_LDL(A, b, False)
+        L, D, p, ops_f = LUDecomposition.get_LDL(A, False)
+
+        # output
+        print("\tRoot: {x}\n\tOperations: {ops}".format(x=sol.tolist(), ops=ops))
+
+        # small diagonal elements require a 2x2 pivot
+        self.assertTrue(np.any(np.diagonal(D, -1) != 0))
+        np.testing.assert_allclose((L @ D @ L.T), np.array(A, dtype=float)[p][:, p], atol=1e-12)
+        np.testing.assert_allclose(sol, [1, 1, 1, 1], atol=1e-12)
+
+    def test_get_solution_Cholesky_banded(self):
+        """Function to test get_solution_Cholesky_banded."""
+
+        print("\nLU Decomposition Method: Banded Cholesky")
+
+        # input
+        A = 4*np.eye(30) - np.eye(30, k=1) - np.eye(30, k=-1) - np.eye(30, k=2) - np.eye(30, k=-2) + 2*np.eye(30)
+        b = np.ones(30)
+
+        # function
+        sol, ops, msg = LUDecomposition.get_solution_Cholesky_banded(A, b, 2, False)
+        sol_C, ops_C, msg_C = LUDecomposition.get_solution_Cholesky(A.tolist(), b.tolist(), False)
+
+        # output
+        print("\tOperations: {ops}\n\tDense operations: {ops_C}".format(ops=ops, ops_C=ops_C))
+
+        np.testing.assert_allclose(sol, sol_C, atol=1e-12)
+        self.assertLess(ops, ops_C/4)
+        self.assertEqual(LUDecomposition.get_solution_Cholesky_banded(-A, b, 2, False)[2], "Matrix is not positive definite")
+
 # start tests
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Authors: Sampreet Kalita
+# Created: 2026-10-19
+# Updated: 2026-10-19
+
+"""Module to test root_finding -> LinearOperator module."""
+
+# dependencies
+import math
+import unittest
+
+import numpy as np
+
+from modules.root_finding import GaussSeidelIteration, JacobiIteration
+from modules.root_finding.LinearOperator import LinearOperator, get_operator
+
+def get_operator_Laplacian(n):
+    """Function to obtain the operator of the one-dimensional Laplacian stencil [-1, 2, -1] shifted by the identity."""
+
+    def matvec(v):
+        w = 3*v
+        w[1:] -= v[:-1]
+        w[:-1] -= v[1:]
+        return w
+
+    def row(i):
+        indices = np.arange(max(i - 1, 0), min(i + 2, n))
+        return indices, np.where(indices == i, 3.0, -1.0)
+
+    return LinearOperator(n, matvec, np.full(n, 3.0), row, 4*n)
+
+class TestRootFindingLinearOperator(unittest.TestCase):
+    """Tests for root_finding -> LinearOperator module."""
+
+    def test_get_solution_operator(self):
+        """Function to test the iterative solvers with a matrix-free operator."""
+
+        print("\nLinear Operator: Laplacian 1D")
+
+        # input
+        n = 200
+        A = get_operator_Laplacian(n)
+        x_exact = np.sin(np.linspace(0, math.pi, n))
+        b = A.matvec(x_exact)
+
+        # function
+        for name, solver in [("Jacobi", JacobiIteration.get_solution_basic), ("Gauss-Seidel", GaussSeidelIteration.get_solution_basic)]:
+            sol, ops, msg = solver(A, b, np.zeros(n), "auto", 500, 1e-12, False, "residual")
+
+            # output
+            print("\t{name}: {msg}\n\tOperations: {ops}".format(name=name, msg=msg, ops=ops))
+
+            self.assertEqual(msg, "Approx. solution obtained")
+            np.testing.assert_allclose(sol, x_exact, atol=1e-9)
+
+        # multicolor with detected coloring
+        colors = GaussSeidelIteration.get_colors(A)
+        sol, ops, msg = GaussSeidelIteration.get_solution_multicolor(A, b, np.zeros(n), 1.0, 500, 1e-12, False, colors, "residual")
+        print("\tMulticolor Gauss-Seidel: {msg}\n\tColors: {count}".format(msg=msg, count=len(colors)))
+
+        self.assertEqual(len(colors), 2)
+        np.testing.assert_allclose(sol, x_exact, atol=1e-9)
+
+    def test_get_operator(self):
+        """Function to test get_operator with a dense matrix."""
+
+        print("\nLinear Operator: Dense Matrix")
+
+        # input
+        A = [[4, -1, 0], [-1, 4, -1], [0, -1, 4]]
+        b = [2, 4, 10]
+
+        # function
+        op = get_operator(A)
+        sol_op, ops_op, msg_op = GaussSeidelIteration.get_solution_basic(op, b, [0, 0, 0], 1, 100, 1e-12, False)
+        sol, ops, msg = GaussSeidelIteration.get_solution_basic(A, b, [0, 0, 0], 1, 100, 1e-12, False, overwrite_a=False, overwrite_b=False)
+
+        # output
+        print("\tOperator: {sol_op}\n\tMatrix: {sol}".format(sol_op=sol_op.tolist(), sol=sol))
+
+        self.assertEqual(op.get_row(0)[0].tolist(), [0, 1])
+        np.testing.assert_allclose(sol_op, [1, 2, 3])
+        np.testing.assert_allclose(sol_op, sol)
+
+        # rows are required by Gauss-Seidel but not by Jacobi
+        op.row = None
+        self.assertEqual(GaussSeidelIteration.get_solution_basic(op, b, [0, 0, 0], 1, 100, 1e-12, False)[2], "Row access is required")
+        np.testing.assert_allclose(JacobiIteration.get_solution_basic(op, b, [0, 0, 0], 1, 100, 1e-12, False)[0], [1, 2, 3])
+
+# start tests
+if __name__ == '__main__':
+    unittest.main()
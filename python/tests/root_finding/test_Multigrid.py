@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Authors: Sampreet Kalita
+# Created: 2026-10-19
+# Updated: 2026-10-19
+
+"""Module to test root_finding -> Multigrid module."""
+
+# dependencies
+import unittest
+
+import numpy as np
+
+from modules.root_finding import Multigrid
+
+class TestRootFindingMultigrid(unittest.TestCase):
+    """Tests for root_finding -> Multigrid module."""
+
+    def test_get_solution_Poisson(self):
+        """Function to test get_solution_Poisson."""
+
+        print("\nGeometric Multigrid Method: Poisson 2D")
+
+        # for each grid size
+        counts = []
+        for k in [4, 5, 6]:
+            # input
+            n = 2**k - 1
+            h = 1/(n + 1)
+            F = np.ones((n, n))
+            U = np.zeros((n, n))
+
+            # function
+            sol, ic, ops, msg = Multigrid.get_solution_Poisson(F, h, U, "V", "GaussSeidel", 2, 50, 1e-8, False)
+
+            # output
+            print("\tGrid: {n}x{n}\n\t{msg} after {ic} cycles.\n\tOperations: {ops}".format(n=n, msg=msg, ic=ic, ops=ops))
+
+            counts.append(ic)
+            residual = np.max(np.abs(F - Multigrid.get_laplacian(np.array(sol), h)))
+            self.assertLess(residual, 1e-6)
+
+        # mesh-independent cycle counts
+        self.assertLessEqual(max(counts) - min(counts), 1)
+
+    def test_get_solution_Poisson_grid(self):
+        """Function to test get_solution_Poisson with grids of different shapes."""
+
+        print("\nGeometric Multigrid Method: Grid Shapes")
+
+        # rectangular grid coarsened until the shorter axis has 3 points
+        h = 1/32
+        F = np.ones((31, 15))
+        sol, ic, ops, msg = Multigrid.get_solution_Poisson(F, h, np.zeros((31, 15)), "V", "GaussSeidel", 2, 50, 1e-8, False)
+
+        # output
+        print("\tGrid: 31x15\n\t{msg} after {ic} cycles.".format(msg=msg, ic=ic))
+
+        self.assertEqual(msg, "Approx. solution obtained")
+        self.assertLess(np.max(np.abs(F - Multigrid.get_laplacian(np.array(sol), h))), 1e-6)
+
+        # grids that cannot be coarsened
+        for n in [16, 64, 30]:
+            self.assertEqual(Multigrid.get_solution_Poisson(np.ones((n, n)), 1/(n + 1), np.zeros((n, n)), "V", "GaussSeidel", 2, 50, 1e-8, False)[3], "Number of points along an axis is not 2^k - 1")
+
+# start tests
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Authors: Sampreet Kalita
+# Created: 2026-10-19
+# Updated: 2026-10-19
+
+"""Module to test root_finding -> PackedSymmetric module."""
+
+# dependencies
+import unittest
+
+import numpy as np
+
+from modules.eigen import Jacobi
+from modules.root_finding import LUDecomposition
+from modules.root_finding.PackedSymmetric import PackedSymmetric
+
+class TestRootFindingPackedSymmetric(unittest.TestCase):
+    """Tests for root_finding -> PackedSymmetric module."""
+
+    def test_storage(self):
+        """Function to test the packed storage and the row access."""
+
+        print("\nPacked Symmetric Matrix: Storage")
+
+        # input
+        A = [[4, 1, 2], [1, 5, 3], [2, 3, 6]]
+
+        # for each packing
+        for lower in [True, False]:
+            # function
+            P = PackedSymmetric(A, lower=lower)
+            P[2][0] = 7
+
+            # output
+            print("\tLower: {lower}\n\tData: {data}".format(lower=lower, data=P.data))
+
+            self.assertEqual(len(P.data), 6)
+            self.assertEqual([P[0][2], P.get(2, 0)], [7, 7])
+            self.assertEqual(np.asarray(P).tolist(), [[4, 1, 7], [1, 5, 3], [7, 3, 6]])
+
+    def test_solvers(self):
+        """Function to test the solvers accepting packed matrices."""
+
+        print("\nPacked Symmetric Matrix: Cholesky and Jacobi")
+
+        # input
+        A = [[4, 1, 2, 0.5], [1, 5, 3, 1], [2, 3, 6, 2], [0.5, 1, 2, 7]]
+        b = [1, 2, 3, 4]
+        P = PackedSymmetric(A, lower=False)
+
+        # function
+        sol, ops, msg = LUDecomposition.get_solution_Cholesky(P, b, False)
+        sol_A, ops_A, msg_A = LUDecomposition.get_solution_Cholesky(A, b, False)
+        eig_val, eig_vec, ic, msg = Jacobi.get_eigens(P, 1e-12, 100, False)
+
+        # output
+        print("\tRoot: {x}\n\tEigenvalues: {eig_val}".format(x=sol, eig_val=eig_val))
+
+        np.testing.assert_allclose(sol, sol_A)
+        np.testing.assert_allclose(sorted(eig_val), np.linalg.eigvalsh(A), atol=1e-10)
+        np.testing.assert_allclose(np.array(A) @ np.array(eig_vec).T, np.array(eig_vec).T*eig_val, atol=1e-10)
+
+# start tests
+if __name__ == '__main__':
+    unittest.main()